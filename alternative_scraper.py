@@ -7,12 +7,29 @@ import requests
 import time
 import random
 from urllib.parse import quote_plus
-import re
-from bs4 import BeautifulSoup
+from config import Config
+from dedup import SeenIndex
+from rate_limit import get_default_scheduler
+from cancellation import CancellationToken, run_abortable
+from timing import StageTimer, timed
+from url_extractor import extract_profile_urls
+from page_classifier import classify_page, PageClassification, OK, EMPTY
+from page_snapshot import PageSnapshot
+from search_results import SearchResultsMixin
+from metrics import get_metrics
+from rate_limit import BACKOFF_STATUS_CODES
 
-class AlternativeLinkedInScraper:
-    def __init__(self):
+class AlternativeLinkedInScraper(SearchResultsMixin):
+    def __init__(self, search_cache=None, seen_index=None, rate_scheduler=None, cancel_token=None, timer=None,
+                 serp_records=None, candidates=None):
         self.session = requests.Session()
+        self.cancel_token = cancel_token or CancellationToken()
+        self.timer = timer or StageTimer()
+        self.search_cache = search_cache
+        self.rate_scheduler = rate_scheduler or get_default_scheduler()
+        self.seen_index = seen_index  # Profiles the calling job has already claimed
+        self.serp_records = serp_records  # {url: lead record from the SERP}, only in SERP-only mode
+        self.candidates = candidates  # The calling job's CandidateIndex, for ranking
         # Rotate user agents
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.7339.207 Safari/537.36',
@@ -37,21 +54,36 @@ class AlternativeLinkedInScraper:
         }
         self.session.headers.update(headers)
     
-    def random_delay(self, min_seconds=1, max_seconds=3):
-        """Random delay to appear more human"""
-        time.sleep(random.uniform(min_seconds, max_seconds))
-    
     def get_user_agent(self):
         """Get random user agent"""
         return random.choice(self.user_agents)
     
+    def record_fetch(self, engine, url, response):
+        """Feed a search response to the rate scheduler and the live metrics; returns the page's classification"""
+        page = PageClassification(OK)
+        if response.status_code == 200:
+            # A challenge page can come back as a normal 200 response, so classify before crediting the host
+            page = classify_page(response.text, response.url)
+            if page.is_blocked:
+                get_metrics().increment('block_detections_total', engine=engine)
+                self.rate_scheduler.penalize(url)
+                return page
+            get_metrics().increment('serps_fetched_total', engine=engine)
+        elif response.status_code in BACKOFF_STATUS_CODES:
+            get_metrics().increment('block_detections_total', engine=engine)
+
+        self.rate_scheduler.record_response(url, response.status_code, response.headers.get('Retry-After'))
+        return page
+    
+    @timed('bing_search')
     def search_bing_for_linkedin(self, query, max_results=20):
         """Search Bing for LinkedIn profiles (less aggressive anti-bot)"""
         try:
             profiles = []
+            found = SeenIndex()
             
             # Bing is less aggressive with blocking
-            search_url = "https://www.bing.com/search"
+            search_url = Config.BING_SEARCH_URL
             
             searches = [
                 f'site:linkedin.com/in "{query}"',
@@ -61,7 +93,7 @@ class AlternativeLinkedInScraper:
             ]
             
             for search_query in searches:
-                if len(profiles) >= max_results:
+                if len(profiles) >= max_results or self.cancel_token.is_cancelled:
                     break
                     
                 print(f"🔍 Bing search: {search_query}")
@@ -73,24 +105,39 @@ class AlternativeLinkedInScraper:
                     'setlang': 'en'
                 }
                 
+                cached_urls = self.get_cached_search('bing', search_query, params['mkt'])
+                if cached_urls is not None:
+                    self.collect_new_urls(cached_urls, profiles, found, max_results)
+                    print(f"💾 Found {len(cached_urls)} cached profiles for this search")
+                    continue
+                
                 headers = {
                     'User-Agent': self.get_user_agent(),
                     'Referer': 'https://www.bing.com'
                 }
                 
                 try:
-                    response = self.session.get(search_url, params=params, headers=headers, timeout=10)
+                    with self.timer.span('rate_wait'):
+                        self.rate_scheduler.wait(search_url, self.cancel_token)
+                    with self.timer.span('bing_request'):
+                        response = run_abortable(
+                            self.session.get, self.cancel_token,
+                            search_url, params=params, headers=headers, timeout=10
+                        )
+                    page = self.record_fetch('bing', search_url, response)
                     
-                    if response.status_code == 200:
+                    if page.is_blocked:
+                        print(f"⚠️ Bing served a challenge page ({page.describe()})")
+                    elif response.status_code == 200:
                         # Extract LinkedIn URLs from response
                         linkedin_urls = self.extract_linkedin_urls_from_html(response.text)
+                        results = self.parse_serp_results('bing', PageSnapshot(response.text, response.url))
+                        if linkedin_urls or page.status == EMPTY:
+                            self.cache_search('bing', search_query, params['mkt'], linkedin_urls, results)
                         
-                        for url in linkedin_urls:
-                            if url not in profiles and len(profiles) < max_results:
-                                profiles.append(url)
+                        self.collect_new_urls(linkedin_urls, profiles, found, max_results)
                         
                         print(f"✅ Found {len(linkedin_urls)} profiles with this search")
-                        self.random_delay(2, 4)
                     else:
                         print(f"❌ Bing returned status code: {response.status_code}")
                         
@@ -104,13 +151,15 @@ class AlternativeLinkedInScraper:
             print(f"❌ Bing search error: {str(e)}")
             return []
     
+    @timed('duckduckgo_search')
     def search_duckduckgo_for_linkedin(self, query, max_results=20):
         """Search DuckDuckGo for LinkedIn profiles"""
         try:
             profiles = []
+            found = SeenIndex()
             
             # DuckDuckGo HTML search endpoint
-            search_url = "https://html.duckduckgo.com/html/"
+            search_url = Config.DUCKDUCKGO_SEARCH_URL
             
             searches = [
                 f'site:linkedin.com/in "{query}"',
@@ -120,7 +169,7 @@ class AlternativeLinkedInScraper:
             ]
             
             for search_query in searches:
-                if len(profiles) >= max_results:
+                if len(profiles) >= max_results or self.cancel_token.is_cancelled:
                     break
                     
                 print(f"🦆 DuckDuckGo search: {search_query}")
@@ -133,6 +182,12 @@ class AlternativeLinkedInScraper:
                     'vqd': ''  # Required by DDG
                 }
                 
+                cached_urls = self.get_cached_search('duckduckgo', search_query, data['kl'])
+                if cached_urls is not None:
+                    self.collect_new_urls(cached_urls, profiles, found, max_results)
+                    print(f"💾 Found {len(cached_urls)} cached profiles for this search")
+                    continue
+                
                 headers = {
                     'User-Agent': self.get_user_agent(),
                     'Referer': 'https://duckduckgo.com/',
@@ -140,18 +195,27 @@ class AlternativeLinkedInScraper:
                 }
                 
                 try:
-                    response = self.session.post(search_url, data=data, headers=headers, timeout=10)
+                    with self.timer.span('rate_wait'):
+                        self.rate_scheduler.wait(search_url, self.cancel_token)
+                    with self.timer.span('duckduckgo_request'):
+                        response = run_abortable(
+                            self.session.post, self.cancel_token,
+                            search_url, data=data, headers=headers, timeout=10
+                        )
+                    page = self.record_fetch('duckduckgo', search_url, response)
                     
-                    if response.status_code == 200:
+                    if page.is_blocked:
+                        print(f"⚠️ DuckDuckGo served a challenge page ({page.describe()})")
+                    elif response.status_code == 200:
                         # Extract LinkedIn URLs from response
                         linkedin_urls = self.extract_linkedin_urls_from_html(response.text)
+                        results = self.parse_serp_results('duckduckgo', PageSnapshot(response.text, response.url))
+                        if linkedin_urls or page.status == EMPTY:
+                            self.cache_search('duckduckgo', search_query, data['kl'], linkedin_urls, results)
                         
-                        for url in linkedin_urls:
-                            if url not in profiles and len(profiles) < max_results:
-                                profiles.append(url)
+                        self.collect_new_urls(linkedin_urls, profiles, found, max_results)
                         
                         print(f"✅ Found {len(linkedin_urls)} profiles with this search")
-                        self.random_delay(2, 4)
                     else:
                         print(f"❌ DuckDuckGo returned status code: {response.status_code}")
                         
@@ -165,41 +229,16 @@ class AlternativeLinkedInScraper:
             print(f"❌ DuckDuckGo search error: {str(e)}")
             return []
     
+    @timed('serp_extract')
     def extract_linkedin_urls_from_html(self, html):
-        """Extract LinkedIn profile URLs from HTML content"""
+        """Extract LinkedIn profile URLs from HTML content, in ranking order"""
         try:
-            linkedin_urls = []
-            
-            # Use regex to find LinkedIn URLs
-            patterns = [
-                r'https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9\-_%]+',
-                r'linkedin\.com/in/[a-zA-Z0-9\-_%]+',
-                r'/in/[a-zA-Z0-9\-_%]+'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE)
-                for match in matches:
-                    # Clean and normalize the URL
-                    if match.startswith('/in/'):
-                        clean_url = f"https://www.linkedin.com{match}"
-                    elif match.startswith('linkedin.com'):
-                        clean_url = f"https://www.{match}"
-                    else:
-                        clean_url = match
-                    
-                    # Remove query parameters
-                    clean_url = clean_url.split('?')[0].split('#')[0]
-                    
-                    if clean_url not in linkedin_urls and '/in/' in clean_url:
-                        linkedin_urls.append(clean_url)
-            
-            return list(set(linkedin_urls))  # Remove duplicates
-            
+            return extract_profile_urls(html)
         except Exception as e:
             print(f"Error extracting URLs: {str(e)}")
             return []
     
+    @timed('alternative_search')
     def scrape_linkedin_profiles(self, query, max_results=20):
         """Main method to scrape LinkedIn profiles using multiple search engines"""
         print(f"🔍 Searching for LinkedIn profiles: {query}")
@@ -211,7 +250,7 @@ class AlternativeLinkedInScraper:
         all_profiles.extend(bing_profiles)
         
         # Try DuckDuckGo if we need more results
-        if len(all_profiles) < max_results:
+        if len(all_profiles) < max_results and not self.cancel_token.is_cancelled:
             print("🦆 Trying DuckDuckGo search...")
             remaining_needed = max_results - len(all_profiles)
             ddg_profiles = self.search_duckduckgo_for_linkedin(query, remaining_needed)
@@ -0,0 +1,500 @@
+# Offline benchmark harness for LeadSprinter
+# Plays recorded SERP and profile pages back from a local HTTP server with configurable
+# latency, drives the real scrapers against it and reports throughput, memory and CPU
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import timeit
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+from config import Config
+from metrics import get_rss_bytes
+
+FIXTURES_DIR = os.path.join(Config.BASE_DIR, 'fixtures')
+
+# Local path -> (engine, fixture file)
+SERP_ROUTES = {
+    '/google/search': ('google', 'google_serp.html'),
+    '/bing/search': ('bing', 'bing_serp.html'),
+    '/duckduckgo/html/': ('duckduckgo', 'duckduckgo_serp.html')
+}
+PROFILE_FIXTURE = 'profile.html'
+PROFILE_DATA_FIXTURE = 'profiles.json'
+
+# Profile links in a SERP fixture, plain or URL-encoded (DuckDuckGo redirect links)
+PROFILE_LINK_PATTERN = re.compile(r'(linkedin\.com(?:/|%2F)in(?:/|%2F))([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+SAMPLE_INTERVAL = 0.1
+
+# Copies of a SERP fixture joined into one page for the extraction micro-benchmark (~1 MB, like a real Google SERP)
+LARGE_SERP_COPIES = 120
+
+# The previous extractor's patterns: three IGNORECASE passes, kept as the micro-benchmark baseline
+LEGACY_URL_PATTERNS = [
+    r'https?://(?:www\.)?linkedin\.com/in/[a-zA-Z0-9\-_%]+',
+    r'linkedin\.com/in/[a-zA-Z0-9\-_%]+',
+    r'/in/[a-zA-Z0-9\-_%]+'
+]
+
+
+def get_child_usage():
+    """CPU seconds and peak RSS (bytes) of exited child processes - chromedriver and Chrome"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0, 0
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    peak = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return usage.ru_utime + usage.ru_stime, peak
+
+
+class FixtureServer:
+    """Serves fixture pages on 127.0.0.1 after a simulated network delay"""
+
+    def __init__(self, fixtures_dir=None, latency=0.0, jitter=0.0, port=0):
+        self.fixtures_dir = fixtures_dir or FIXTURES_DIR
+        self.latency = latency
+        self.jitter = jitter
+        self.port = port
+        self.server = None
+        self.served = {}  # page kind -> count
+        self._fixtures = {}
+        self._lock = threading.Lock()
+
+        with open(os.path.join(self.fixtures_dir, PROFILE_DATA_FIXTURE), 'r', encoding='utf-8') as f:
+            self.profiles = json.load(f)
+
+    def get_fixture(self, name):
+        """Fixture file contents, read once"""
+        if name not in self._fixtures:
+            with open(os.path.join(self.fixtures_dir, name), 'r', encoding='utf-8') as f:
+                self._fixtures[name] = f.read()
+        return self._fixtures[name]
+
+    def get_url(self, path='/'):
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def count(self, kind):
+        with self._lock:
+            self.served[kind] = self.served.get(kind, 0) + 1
+
+    def get_page_loads(self):
+        """SERP and profile pages served (favicons and other requests are not counted)"""
+        with self._lock:
+            return sum(count for kind, count in self.served.items() if kind != 'other')
+
+    def render_serp(self, fixture, request_key):
+        """A SERP fixture whose profile links are unique to this search, so every query finds new profiles"""
+        digest = hashlib.md5(request_key.encode('utf-8')).digest()
+        token = ''.join(chr(ord('a') + byte % 26) for byte in digest[:8])
+        return PROFILE_LINK_PATTERN.sub(lambda match: f"{match.group(1)}{match.group(2)}-{token}", self.get_fixture(fixture))
+
+    def render_profile(self, slug):
+        """The profile template filled in for a slug produced by render_serp"""
+        base_slug = slug if slug in self.profiles else slug.rsplit('-', 1)[0]
+        person = self.profiles.get(base_slug) or {
+            'name': ' '.join(part.capitalize() for part in base_slug.split('-')[:2]),
+            'title': 'Software Developer',
+            'location': 'Galway, Ireland',
+            'company': 'Unknown'
+        }
+
+        values = dict(person, slug=slug, email=f"{base_slug.replace('-', '.')}@example.com")
+        page = self.get_fixture(PROFILE_FIXTURE)
+        for key, value in values.items():
+            page = page.replace('{{' + key + '}}', value)
+        return page
+
+    def respond(self, path, query, body):
+        """(status, kind, html) for a request"""
+        if path in SERP_ROUTES:
+            engine, fixture = SERP_ROUTES[path]
+            return 200, f"serp_{engine}", self.render_serp(fixture, f"{path}?{query}&{body}")
+
+        if path.startswith('/in/'):
+            return 200, 'profile', self.render_profile(path[len('/in/'):].strip('/'))
+
+        return 404, 'other', '<html><body>Not found</body></html>'
+
+    def start(self):
+        fixtures = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def handle_request(self, body=''):
+                parsed = urlparse(self.path)
+                status, kind, html = fixtures.respond(parsed.path, parsed.query, body)
+
+                delay = fixtures.latency + random.uniform(0, fixtures.jitter)
+                if delay > 0 and kind != 'other':
+                    time.sleep(delay)
+                fixtures.count(kind)
+
+                content = html.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self):
+                self.handle_request()
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.handle_request(self.rfile.read(length).decode('utf-8', 'replace'))
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def get_config_overrides(self, paced=False):
+        """Config values that point the scrapers at this server instead of the live sites"""
+        overrides = {
+            'GOOGLE_SEARCH_URL': self.get_url('/google/search'),
+            'BING_SEARCH_URL': self.get_url('/bing/search'),
+            'DUCKDUCKGO_SEARCH_URL': self.get_url('/duckduckgo/html/'),
+            'URL_REWRITES': {
+                'https://www.linkedin.com/': self.get_url('/'),
+                'https://linkedin.com/': self.get_url('/')
+            },
+            # Measure the scraping itself, not the caches or job files
+            'PROFILE_CACHE_ENABLED': False,
+            'SEARCH_CACHE_MODE': 'bypass',
+            'JOURNAL_ENABLED': False,
+            'TIMING_REPORTS_ENABLED': False
+        }
+        if not paced:
+            # The configured politeness delays would dominate every measurement
+            overrides.update({
+                'HOST_REQUESTS_PER_MINUTE': 60000, 'HOST_BURST': 1000
+            })
+        return overrides
+
+
+@contextlib.contextmanager
+def config_overrides(values):
+    """Temporarily replace Config attributes"""
+    saved = {name: getattr(Config, name) for name in values}
+    for name, value in values.items():
+        setattr(Config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(Config, name, value)
+
+
+class ResourceSampler:
+    """Wall time, CPU time and memory of this process (and its exited browsers) over one benchmark run"""
+
+    def __init__(self):
+        self.peak_rss = self.start_rss = self.end_rss = 0
+        self.start_wall = self.start_cpu = self.start_child_cpu = 0.0
+        self.wall = self.cpu = 0.0
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        while True:
+            self.peak_rss = max(self.peak_rss, get_rss_bytes())
+            if self._stopped.wait(SAMPLE_INTERVAL):
+                return
+
+    def start(self):
+        self.start_rss = get_rss_bytes()
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+        self.start_child_cpu, _ = get_child_usage()
+        self._thread = threading.Thread(target=self.sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the clocks (child usage is read later, once the browsers have quit)"""
+        self.wall = time.perf_counter() - self.start_wall
+        self.cpu = time.process_time() - self.start_cpu
+        self._stopped.set()
+        self._thread.join()
+        self.end_rss = get_rss_bytes()
+
+    def get_results(self, browsers=False):
+        results = {
+            'wall_seconds': round(self.wall, 3),
+            'cpu_seconds': round(self.cpu, 3),
+            'cpu_percent': round(100 * self.cpu / self.wall, 1) if self.wall else 0.0,
+            'peak_rss_mb': round(self.peak_rss / 1048576, 1),
+            'rss_growth_mb': round((self.end_rss - self.start_rss) / 1048576, 1)
+        }
+        if browsers:
+            child_cpu, child_peak = get_child_usage()
+            results['browser_cpu_seconds'] = round(child_cpu - self.start_child_cpu, 3)
+            results['browser_peak_rss_mb'] = round(child_peak / 1048576, 1)
+        return results
+
+
+def summarize(sampler, server, profiles, loads_before, browsers=False):
+    """Throughput figures for one run"""
+    results = sampler.get_results(browsers)
+    page_loads = server.get_page_loads() - loads_before
+    wall = results['wall_seconds'] or 1e-9
+    results.update({
+        'profiles': profiles,
+        'page_loads': page_loads,
+        'profiles_per_second': round(profiles / wall, 3),
+        'page_loads_per_second': round(page_loads / wall, 3)
+    })
+    return results
+
+
+def bench_alternative(server, queries, max_results):
+    """HTTP scraper: Bing then DuckDuckGo per query; profiles are the URLs it finds"""
+    from alternative_scraper import AlternativeLinkedInScraper
+    from rate_limit import RateScheduler
+
+    scraper = AlternativeLinkedInScraper(rate_scheduler=RateScheduler())
+    loads_before = server.get_page_loads()
+
+    sampler = ResourceSampler().start()
+    found = set()
+    for query in queries:
+        found.update(scraper.scrape_linkedin_profiles(query, max_results))
+    sampler.stop()
+
+    results = summarize(sampler, server, len(found), loads_before)
+    results['stages'] = scraper.timer.get_report()['stages']
+    return results
+
+
+def bench_browser(server, job_titles, locations, num_results, workers):
+    """Selenium scraper: Google SERPs plus profile extraction, through a private driver pool"""
+    from driver_pool import DriverPool
+    from rate_limit import RateScheduler
+    from scraper import LinkedInScraper
+
+    pool = DriverPool(max_size=workers + 1)
+    scraper = LinkedInScraper(pool=pool, rate_scheduler=RateScheduler())
+    search_params = {
+        'job_titles': job_titles,
+        'locations': locations,
+        'num_results': num_results,
+        'workers': workers,
+        'use_profile_cache': False,
+        'search_cache': 'bypass'
+    }
+
+    try:
+        # Launch the browsers before the clock starts; startup time is reported on its own
+        started = time.perf_counter()
+        leases = [pool.checkout() for _ in range(workers + 1)]
+        for lease in leases:
+            pool.checkin(lease)
+        startup_seconds = time.perf_counter() - started
+
+        loads_before = server.get_page_loads()
+        sampler = ResourceSampler().start()
+        records = list(scraper.iter_profiles(search_params))
+        sampler.stop()
+    finally:
+        scraper.cleanup()
+        pool.close()
+
+    results = summarize(sampler, server, len(records), loads_before, browsers=True)
+    results['browser_startup_seconds'] = round(startup_seconds, 3)
+    results['stages'] = (scraper.timing_report or {}).get('stages', {})
+    return results
+
+
+def legacy_extract_urls(html):
+    """The extractor the URL engine replaced, for comparison"""
+    linkedin_urls = []
+    for pattern in LEGACY_URL_PATTERNS:
+        for match in re.findall(pattern, html, re.IGNORECASE):
+            if match.startswith('/in/'):
+                clean_url = f"https://www.linkedin.com{match}"
+            elif match.startswith('linkedin.com'):
+                clean_url = f"https://www.{match}"
+            else:
+                clean_url = match
+            clean_url = clean_url.split('?')[0].split('#')[0]
+            if clean_url not in linkedin_urls and '/in/' in clean_url:
+                linkedin_urls.append(clean_url)
+    return list(set(linkedin_urls))
+
+
+def build_large_serp(server, fixture, copies):
+    """One large page made of many copies of a SERP fixture, each with its own profile links"""
+    return '\n'.join(server.render_serp(fixture, f"copy-{i}") for i in range(copies))
+
+
+def bench_extraction(server, copies=LARGE_SERP_COPIES, rounds=5):
+    """Micro-benchmark of SERP URL extraction on large pages, against the previous three-pass extractor"""
+    from url_extractor import extract_profile_urls
+
+    runs = {}
+    for path, (engine, fixture) in SERP_ROUTES.items():
+        html = build_large_serp(server, fixture, copies)
+        megabytes = len(html.encode('utf-8')) / 1048576
+
+        seconds = min(timeit.repeat(lambda: extract_profile_urls(html), number=1, repeat=rounds))
+        legacy_seconds = min(timeit.repeat(lambda: legacy_extract_urls(html), number=1, repeat=rounds))
+
+        runs[f"extraction_{engine}"] = {
+            'page_mb': round(megabytes, 2),
+            'urls_found': len(extract_profile_urls(html)),
+            'ms_per_page': round(seconds * 1000, 3),
+            'mb_per_second': round(megabytes / seconds, 1) if seconds else 0.0,
+            'legacy_ms_per_page': round(legacy_seconds * 1000, 3),
+            'speedup': round(legacy_seconds / seconds, 1) if seconds else 0.0
+        }
+    return runs
+
+
+def format_results(name, results, baseline=None):
+    """Readable summary of one run, with the change against a baseline run if given"""
+    rows = [
+        ('profiles/sec', 'profiles_per_second', '{:.2f}'),
+        ('page loads/sec', 'page_loads_per_second', '{:.2f}'),
+        ('profiles', 'profiles', '{}'),
+        ('page loads', 'page_loads', '{}'),
+        ('wall time', 'wall_seconds', '{:.2f}s'),
+        ('CPU (python)', 'cpu_seconds', '{:.2f}s'),
+        ('CPU (browsers)', 'browser_cpu_seconds', '{:.2f}s'),
+        ('CPU utilisation', 'cpu_percent', '{:.1f}%'),
+        ('peak RSS', 'peak_rss_mb', '{:.1f} MB'),
+        ('RSS growth', 'rss_growth_mb', '{:.1f} MB'),
+        ('browser peak RSS', 'browser_peak_rss_mb', '{:.1f} MB'),
+        ('browser startup', 'browser_startup_seconds', '{:.2f}s'),
+        ('page size', 'page_mb', '{:.2f} MB'),
+        ('URLs found', 'urls_found', '{}'),
+        ('extraction', 'ms_per_page', '{:.2f} ms'),
+        ('throughput', 'mb_per_second', '{:.1f} MB/s'),
+        ('previous extractor', 'legacy_ms_per_page', '{:.2f} ms'),
+        ('speedup', 'speedup', '{:.1f}x')
+    ]
+
+    lines = [f"📊 {name}"]
+    for label, key, fmt in rows:
+        if key not in results:
+            continue
+        line = f"  {label:<18}{fmt.format(results[key]):>12}"
+        previous = (baseline or {}).get(key)
+        if previous:
+            line += f"   ({(results[key] - previous) / previous:+.1%} vs baseline)"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='LeadSprinter offline benchmark against local fixture pages')
+    parser.add_argument('--scraper', choices=['all', 'alternative', 'browser', 'extraction'], default='all',
+                        help='Which scraper to benchmark (extraction: SERP URL extraction micro-benchmark only)')
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds the server waits before each page')
+    parser.add_argument('--jitter', type=float, default=0.05, help='Extra random delay of up to this many seconds')
+    parser.add_argument('--profiles', type=int, default=20, help='Profiles the browser benchmark extracts')
+    parser.add_argument('--workers', type=int, default=Config.PROFILE_WORKERS, help='Browser extraction workers')
+    parser.add_argument('--queries', type=int, default=3, help='Queries the alternative scraper runs')
+    parser.add_argument('--serp-copies', type=int, default=LARGE_SERP_COPIES,
+                        help='Fixture copies per page in the extraction micro-benchmark')
+    parser.add_argument('--paced', action='store_true',
+                        help='Keep the configured rate limits and delays instead of removing them')
+    parser.add_argument('--fixtures', metavar='DIR', default=FIXTURES_DIR, help='Directory of fixture pages')
+    parser.add_argument('--port', type=int, default=0, help='Port for the fixture server (default: any free port)')
+    parser.add_argument('--output', metavar='PATH', help='Save the results as JSON')
+    parser.add_argument('--compare', metavar='PATH', help='Show the change against results saved with --output')
+    parser.add_argument('--verbose', action='store_true', help='Show the scrapers\' own output')
+    return parser.parse_args(argv)
+
+
+def run_benchmarks(options):
+    """Run the selected benchmarks and return their results"""
+    server = FixtureServer(options.fixtures, options.latency, options.jitter, options.port).start()
+    print(f"🧪 Fixture server on {server.get_url()} (latency {options.latency}s + up to {options.jitter}s)")
+
+    queries = [f"software developer galway {i}" if i else "software developer galway" for i in range(options.queries)]
+    runs = {}
+    output = None if options.verbose else open(os.devnull, 'w', encoding='utf-8')
+
+    try:
+        if options.scraper in ('all', 'extraction'):
+            print("🧪 Benchmarking SERP URL extraction...")
+            runs.update(bench_extraction(server, options.serp_copies))
+
+        with config_overrides(server.get_config_overrides(options.paced)):
+            if options.scraper in ('all', 'alternative'):
+                print("🧪 Benchmarking alternative (HTTP) scraper...")
+                with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+                    runs['alternative'] = bench_alternative(server, queries, 20)
+
+            if options.scraper in ('all', 'browser'):
+                print("🧪 Benchmarking browser scraper...")
+                with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+                    runs['browser'] = bench_browser(
+                        server, ['Software Developer'], ['Galway'], options.profiles, options.workers
+                    )
+    finally:
+        server.stop()
+        if output:
+            output.close()
+
+    return {
+        'started': datetime.now().isoformat(),
+        'settings': {
+            'latency': options.latency,
+            'jitter': options.jitter,
+            'profiles': options.profiles,
+            'workers': options.workers,
+            'queries': options.queries,
+            'serp_copies': options.serp_copies,
+            'paced': options.paced,
+            'page_load_strategy': Config.PAGE_LOAD_STRATEGY
+        },
+        'runs': runs
+    }
+
+
+def main(argv=None):
+    options = parse_args(argv)
+
+    baseline = None
+    if options.compare:
+        with open(options.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = run_benchmarks(options)
+    for name, run in results['runs'].items():
+        print(format_results(name, run, (baseline or {}).get('runs', {}).get(name)))
+
+    if options.output:
+        directory = os.path.dirname(os.path.abspath(options.output))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(options.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved to {options.output}")
+    return results
+
+
+if __name__ == '__main__':
+    main()
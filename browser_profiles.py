@@ -0,0 +1,187 @@
+# Browser profile directories for LeadSprinter
+# A bounded set of reusable Chrome user-data directories, one per pooled browser, so the
+# HTTP disk cache survives between jobs and nothing piles up in the temp folder
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from config import Config
+
+LOCK_FILE = '.leadsprinter_in_use'  # Holds the PID of the process using the directory
+LAST_USED_FILE = '.leadsprinter_last_used'
+
+# Left behind by a Chrome that did not shut down cleanly; they make the next launch refuse the profile
+CHROME_SINGLETON_FILES = ['SingletonLock', 'SingletonSocket', 'SingletonCookie']
+
+
+def is_process_alive(pid):
+    """Whether a process with this PID is still running"""
+    if pid <= 0:
+        return False
+
+    if sys.platform == 'win32':
+        import ctypes
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+def get_directory_size(path):
+    """Total size in bytes of the files under a directory"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+class ProfileDirectoryManager:
+    """Hands out reusable user-data directories and garbage-collects stale ones"""
+
+    def __init__(self, root=None, max_slots=None, max_age=None, max_bytes=None):
+        self.root = root or Config.BROWSER_PROFILES_DIR
+        self.max_slots = max_slots or Config.BROWSER_PROFILE_SLOTS
+        self.max_age = max_age if max_age is not None else Config.BROWSER_PROFILE_MAX_AGE_SECONDS
+        self.max_bytes = max_bytes if max_bytes is not None else Config.BROWSER_PROFILES_MAX_BYTES
+        self._in_use = set()
+        self._temporary = set()
+        self._lock = threading.Lock()
+
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+
+    def get_slot_path(self, slot):
+        return os.path.join(self.root, f"profile_{slot}")
+
+    def is_locked(self, path):
+        """Whether another live process is using the directory"""
+        try:
+            with open(os.path.join(path, LOCK_FILE), 'r') as f:
+                pid = int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return False
+        return pid != os.getpid() and is_process_alive(pid)
+
+    def claim(self, path):
+        """Mark a directory as ours and clear Chrome's leftovers from an unclean shutdown"""
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        with open(os.path.join(path, LOCK_FILE), 'w') as f:
+            f.write(str(os.getpid()))
+
+        for name in CHROME_SINGLETON_FILES:
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass
+
+    def acquire(self):
+        """A user-data directory for one browser; the same slots are reused across jobs"""
+        with self._lock:
+            for slot in range(self.max_slots):
+                path = self.get_slot_path(slot)
+                if path in self._in_use or self.is_locked(path):
+                    continue
+                self.claim(path)
+                self._in_use.add(path)
+                return path
+
+            # Every slot is busy (e.g. another LeadSprinter process); fall back to a throwaway directory
+            path = tempfile.mkdtemp(prefix='leadsprinter_profile_')
+            self._temporary.add(path)
+            return path
+
+    def release(self, path):
+        """Give a directory back once its browser has quit"""
+        if not path:
+            return
+
+        with self._lock:
+            if path in self._temporary:
+                self._temporary.discard(path)
+                shutil.rmtree(path, ignore_errors=True)
+                return
+
+            self._in_use.discard(path)
+
+        try:
+            with open(os.path.join(path, LAST_USED_FILE), 'w') as f:
+                f.write(str(time.time()))
+            os.remove(os.path.join(path, LOCK_FILE))
+        except OSError:
+            pass
+
+    def get_last_used(self, path):
+        try:
+            return os.path.getmtime(os.path.join(path, LAST_USED_FILE))
+        except OSError:
+            return os.path.getmtime(path)
+
+    def collect_garbage(self):
+        """Delete idle directories past max_age, then least recently used ones while over max_bytes"""
+        with self._lock:
+            idle = []
+            for name in os.listdir(self.root):
+                path = os.path.join(self.root, name)
+                if not os.path.isdir(path) or path in self._in_use or self.is_locked(path):
+                    continue
+                idle.append((self.get_last_used(path), path))
+
+        removed = 0
+        now = time.time()
+        remaining = []
+        for last_used, path in sorted(idle):
+            if self.max_age and now - last_used > self.max_age:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+            else:
+                remaining.append(path)
+
+        if self.max_bytes:
+            total = get_directory_size(self.root)
+            for path in remaining:
+                if total <= self.max_bytes:
+                    break
+                size = get_directory_size(path)
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+                removed += 1
+
+        if removed:
+            print(f"🧹 Removed {removed} stale browser profile directories")
+        return removed
+
+
+_default_manager = None
+_default_manager_lock = threading.Lock()
+
+
+def get_profile_manager():
+    """Manager shared by every pooled browser; collects garbage once per process"""
+    global _default_manager
+
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = ProfileDirectoryManager()
+            try:
+                _default_manager.collect_garbage()
+            except Exception as e:
+                print(f"⚠️ Browser profile cleanup failed: {str(e)}")
+        return _default_manager
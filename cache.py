@@ -0,0 +1,193 @@
+# Persistent caches for LeadSprinter
+# Stores extracted profiles and search results on disk so repeat jobs skip page loads
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from config import Config
+from canonicalize import canonicalize
+
+
+class SQLiteCache:
+    """Shared plumbing for the on-disk caches: one thread-safe SQLite connection"""
+
+    SCHEMA = []
+    ADDED_COLUMNS = []  # (table, column, definition) added after the table was first released
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        for statement in self.SCHEMA:
+            self._conn.execute(statement)
+        for table, column, definition in self.ADDED_COLUMNS:
+            columns = [row[1] for row in self._conn.execute(f'PRAGMA table_info({table})')]
+            if column not in columns:
+                self._conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+        self._conn.commit()
+
+    def get_hit_rate(self):
+        """Fraction of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class ProfileCache(SQLiteCache):
+    """SQLite cache of extracted profile records keyed by canonical LinkedIn URL"""
+
+    SCHEMA = [
+        'CREATE TABLE IF NOT EXISTS profiles ('
+        'url TEXT PRIMARY KEY, data TEXT NOT NULL, stored_at REAL NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS profiles_stored_at ON profiles (stored_at)'
+    ]
+
+    def __init__(self, path=None, ttl=None, max_entries=None):
+        super().__init__(path or Config.PROFILE_CACHE_PATH)
+        self.ttl = ttl if ttl is not None else Config.PROFILE_CACHE_TTL_SECONDS
+        self.max_entries = max_entries if max_entries is not None else Config.PROFILE_CACHE_MAX_ENTRIES
+
+    def get(self, url):
+        """Return the cached record for a profile, or None if missing or expired"""
+        key = canonicalize(url)
+        if not key:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data, stored_at FROM profiles WHERE url = ?', (key,)
+            ).fetchone()
+
+            if row and (not self.ttl or time.time() - row[1] < self.ttl):
+                self.hits += 1
+                return json.loads(row[0])
+
+            if row:
+                self._conn.execute('DELETE FROM profiles WHERE url = ?', (key,))
+                self._conn.commit()
+            self.misses += 1
+            return None
+
+    def put(self, url, record):
+        """Store an extracted profile record"""
+        key = canonicalize(url)
+        if not key:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO profiles (url, data, stored_at) VALUES (?, ?, ?)',
+                (key, json.dumps(record), time.time())
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """Drop expired entries, then the oldest ones beyond the size limit"""
+        with self._lock:
+            if self.ttl:
+                self._conn.execute('DELETE FROM profiles WHERE stored_at < ?', (time.time() - self.ttl,))
+
+            if self.max_entries:
+                self._conn.execute(
+                    'DELETE FROM profiles WHERE url IN ('
+                    'SELECT url FROM profiles ORDER BY stored_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+
+
+class SearchCache(SQLiteCache):
+    """SQLite cache of (engine, query, locale) -> ordered profile URLs and their result text, with TTL and LRU eviction"""
+
+    MODES = ('use', 'refresh', 'bypass')
+
+    SCHEMA = [
+        'CREATE TABLE IF NOT EXISTS searches ('
+        'engine TEXT NOT NULL, query TEXT NOT NULL, locale TEXT NOT NULL, '
+        'urls TEXT NOT NULL, stored_at REAL NOT NULL, last_access REAL NOT NULL, '
+        'PRIMARY KEY (engine, query, locale))',
+        'CREATE INDEX IF NOT EXISTS searches_last_access ON searches (last_access)'
+    ]
+    # (url, title, snippet) per result, so SERP-only mode and candidate ranking work from a cached search
+    ADDED_COLUMNS = [('searches', 'results', 'TEXT')]
+
+    def __init__(self, path=None, ttl=None, max_entries=None, mode=None):
+        super().__init__(path or Config.SEARCH_CACHE_PATH)
+        self.ttl = ttl if ttl is not None else Config.SEARCH_CACHE_TTL_SECONDS
+        self.max_entries = max_entries if max_entries is not None else Config.SEARCH_CACHE_MAX_ENTRIES
+        self.mode = mode or Config.SEARCH_CACHE_MODE
+
+        if self.mode not in self.MODES:
+            raise ValueError(f"Search cache mode must be one of {', '.join(self.MODES)}")
+
+    def get(self, engine, query, locale=''):
+        """Return (URL list, result list) cached for a query, or None ('refresh' and 'bypass' always miss)"""
+        if self.mode != 'use':
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT urls, stored_at, results FROM searches WHERE engine = ? AND query = ? AND locale = ?',
+                (engine, query, locale)
+            ).fetchone()
+
+            if row and (not self.ttl or time.time() - row[1] < self.ttl):
+                self._conn.execute(
+                    'UPDATE searches SET last_access = ? WHERE engine = ? AND query = ? AND locale = ?',
+                    (time.time(), engine, query, locale)
+                )
+                self._conn.commit()
+                self.hits += 1
+                return json.loads(row[0]), json.loads(row[2] or '[]')
+
+            self.misses += 1
+            return None
+
+    def put(self, engine, query, locale, urls, results=None):
+        """Store the ordered URL list a query produced, with each result's (url, title, snippet) ('bypass' stores nothing)"""
+        if self.mode == 'bypass':
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO searches (engine, query, locale, urls, stored_at, last_access, results) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (engine, query, locale, json.dumps(list(urls)), now, now, json.dumps([list(r) for r in results or []]))
+            )
+            self._conn.commit()
+
+    def evict(self):
+        """Drop expired entries, then the least recently used ones beyond the size limit"""
+        with self._lock:
+            if self.ttl:
+                self._conn.execute('DELETE FROM searches WHERE stored_at < ?', (time.time() - self.ttl,))
+
+            if self.max_entries:
+                self._conn.execute(
+                    'DELETE FROM searches WHERE rowid IN ('
+                    'SELECT rowid FROM searches ORDER BY last_access DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM searches').fetchone()[0]
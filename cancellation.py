@@ -0,0 +1,65 @@
+# Cancellation support for LeadSprinter
+# A stop request wakes every sleep, page-readiness poll and HTTP call that is waiting on it
+
+import threading
+
+# How often an abortable call checks whether the job was cancelled
+ABORT_POLL_SECONDS = 0.1
+
+
+class CancelledError(Exception):
+    """Raised when work is abandoned because the user stopped the job"""
+
+
+class CancellationToken:
+    """Thread-safe stop flag that blocked waits can be woken by"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        """Signal every waiter"""
+        self._event.set()
+
+    def sleep(self, seconds):
+        """Sleep unless cancelled first; returns True if the sleep was cut short"""
+        if seconds <= 0:
+            return self.is_cancelled
+        return self._event.wait(seconds)
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise CancelledError("Scraping stopped by user")
+
+
+def run_abortable(func, token, *args, **kwargs):
+    """Run a blocking call in a daemon thread so a cancel returns control at once"""
+    if token is None:
+        return func(*args, **kwargs)
+
+    token.raise_if_cancelled()
+
+    outcome = {}
+    done = threading.Event()
+
+    def target():
+        try:
+            outcome['result'] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome['error'] = e
+        finally:
+            done.set()
+
+    # On cancel the call keeps running in the background and its result is discarded
+    threading.Thread(target=target, daemon=True).start()
+
+    while not done.wait(ABORT_POLL_SECONDS):
+        token.raise_if_cancelled()
+
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('result')
@@ -0,0 +1,62 @@
+# LinkedIn URL canonicalization for LeadSprinter
+# Every extractor, the dedup index, the caches and the exporter reduce profile URLs to one
+# form, so the same person is never loaded twice under different URLs
+
+import base64
+import re
+from functools import lru_cache
+from urllib.parse import quote, unquote
+
+CANONICAL_PREFIX = 'https://www.linkedin.com/in/'
+
+# Scheme and subdomain (www., ie., de., m. ...) are ignored; the slug ends at the first delimiter
+PROFILE_SLUG_PATTERN = re.compile(r'linkedin\.com/in/([^/?#&"\'\s<>]+)', re.IGNORECASE)
+ENCODED_PROFILE_PATTERN = re.compile(r'linkedin\.com%2Fin%2F', re.IGNORECASE)
+BING_TARGET_PATTERN = re.compile(r'[?&;]u=a1([A-Za-z0-9\-_]+)')
+
+# Where a slug ends once decoded (an encoded ?, / or & inside a plain match)
+SLUG_END_PATTERN = re.compile(r'[/?#&\s]')
+
+# Punctuation that follows a URL in running text rather than belonging to it
+TRAILING_PUNCTUATION = '.,;:!)]}'
+
+CACHE_SIZE = 65536
+
+
+def unwrap_redirect(url):
+    """The profile URL inside a search engine redirect (DuckDuckGo uddg=, encoded Google q=, Bing u=a1)"""
+    if ENCODED_PROFILE_PATTERN.search(url):
+        return unquote(url)
+
+    match = BING_TARGET_PATTERN.search(url)
+    if match:
+        token = match.group(1)
+        try:
+            return base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode('utf-8', 'ignore')
+        except (ValueError, TypeError):
+            pass
+    return url
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_profile_url(slug):
+    """Canonical URL for a profile slug: decoded, lowercased and percent-encoded exactly once"""
+    slug = SLUG_END_PATTERN.split(unquote(slug).strip(), 1)[0].rstrip(TRAILING_PUNCTUATION).lower()
+    if not slug:
+        return None
+    return CANONICAL_PREFIX + quote(slug, safe='-_.~')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonicalize(url):
+    """Normalize a LinkedIn profile URL to https://www.linkedin.com/in/<slug>, or None if it is not one"""
+    if not url or not isinstance(url, str):
+        return None
+
+    match = PROFILE_SLUG_PATTERN.search(url)
+    if not match:
+        match = PROFILE_SLUG_PATTERN.search(unwrap_redirect(url))
+        if not match:
+            return None
+
+    return canonical_profile_url(match.group(1))
@@ -3,13 +3,61 @@
 
 import sys
 import os
+import argparse
+import pandas as pd
 from datetime import datetime
 from scraper import LinkedInScraper
+from driver_pool import shutdown_default_pool
 from data_handler import DataHandler
+from journal import JobJournal
+from metrics import get_metrics, MetricsPublisher
+from config import Config
 import logging
 
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description='LeadSprinter Pro - Command Line Interface')
+    parser.add_argument(
+        '--search-cache', choices=['use', 'refresh', 'bypass'], default=Config.SEARCH_CACHE_MODE,
+        help="'use' cached search results, 'refresh' them by searching again, or 'bypass' the cache entirely"
+    )
+    parser.add_argument(
+        '--skip-seen', action='append', default=[], metavar='EXPORT',
+        help='Skip profiles already present in a previous Excel/CSV export (repeatable)'
+    )
+    parser.add_argument(
+        '--seen-index', metavar='PATH',
+        help='File that remembers every profile collected, so later runs never reload them'
+    )
+    parser.add_argument(
+        '--journal', metavar='PATH',
+        help='Where to write the job journal (default: a new file in the journals folder)'
+    )
+    parser.add_argument(
+        '--serp-only', action='store_true', default=Config.SERP_ONLY_MODE,
+        help='Build leads from search result titles and snippets instead of loading each profile page'
+    )
+    parser.add_argument(
+        '--open-incomplete', action='store_true', default=Config.SERP_OPEN_INCOMPLETE,
+        help='With --serp-only, still load profiles whose search result lacks a name, title or company'
+    )
+    parser.add_argument(
+        '--resume', metavar='JOURNAL',
+        help='Resume an interrupted job from its journal instead of starting a new one'
+    )
+    parser.add_argument(
+        '--metrics-file', metavar='PATH', default=Config.METRICS_TEXTFILE_PATH,
+        help='Keep rewriting live job metrics to this Prometheus text file'
+    )
+    parser.add_argument(
+        '--metrics-port', type=int, metavar='PORT', default=Config.METRICS_HTTP_PORT,
+        help='Serve live job metrics on http://127.0.0.1:PORT/metrics'
+    )
+    return parser.parse_args(argv)
+
 class LeadSprinterCLI:
-    def __init__(self):
+    def __init__(self, options=None):
+        self.options = options or parse_args([])
         self.scraper = None
         self.data_handler = DataHandler()
         self.setup_logging()
@@ -47,6 +95,13 @@ class LeadSprinterCLI:
         except ValueError:
             num_results = 20
         
+        # Get number of parallel browser workers
+        try:
+            workers = int(input("Enter number of browser workers (default 1): ") or "1")
+            workers = max(1, min(8, workers))
+        except ValueError:
+            workers = 1
+        
         # Get industry filter
         print("\nAvailable industries:")
         industries = ['All', 'Technology', 'Healthcare', 'Finance', 'Marketing', 'Sales', 'Education']
@@ -63,6 +118,13 @@ class LeadSprinterCLI:
             'job_titles': [title.strip() for title in job_titles_input.split(',')],
             'locations': [loc.strip() for loc in locations_input.split(',')],
             'num_results': num_results,
+            'workers': workers,
+            'search_cache': self.options.search_cache,
+            'seen_exports': self.options.skip_seen,
+            'seen_index_path': self.options.seen_index,
+            'journal_path': self.options.journal,
+            'serp_only': self.options.serp_only,
+            'open_incomplete': self.options.open_incomplete,
             'industry': industry if industry != 'All' else None,
             'company_size': None
         }
@@ -75,43 +137,42 @@ class LeadSprinterCLI:
         else:
             print(f"\r{status}", end='', flush=True)
     
+    def print_profile(self, number, profile):
+        """Print one lead as soon as it is extracted"""
+        print(f"\n{number}. {profile.get('name', 'N/A')} - {profile.get('title', 'N/A')}")
+        print(f"   Company: {profile.get('company', 'N/A')} | Location: {profile.get('location', 'N/A')}")
+        print(f"   LinkedIn: {profile.get('linkedin_url', 'N/A')}")
+        if profile.get('email'):
+            print(f"   Email: {profile['email']}")
+    
     def run_scraping(self, search_params):
         """Run the scraping process"""
         print(f"\nStarting scrape with parameters:")
         print(f"  Job Titles: {', '.join(search_params['job_titles'])}")
         print(f"  Locations: {', '.join(search_params['locations'])}")
         print(f"  Results: {search_params['num_results']}")
+        print(f"  Workers: {search_params.get('workers', 1)}")
         print(f"  Industry: {search_params['industry'] or 'All'}")
         print("-" * 50)
         
         try:
             self.scraper = LinkedInScraper()
-            results_df = self.scraper.scrape_profiles(
-                search_params, 
-                progress_callback=self.progress_callback
-            )
+            
+            # Show each lead as it arrives instead of waiting for the whole job
+            profiles = []
+            for profile in self.scraper.iter_profiles(search_params, progress_callback=self.progress_callback):
+                profiles.append(profile)
+                self.print_profile(len(profiles), profile)
             
             print(f"\n\nScraping completed!")
             
-            if not results_df.empty:
+            if profiles:
+                results_df = pd.DataFrame(profiles).drop_duplicates(subset=['linkedin_url'], keep='first')
                 print(f"Found {len(results_df)} profiles")
                 
                 # Store results
                 self.data_handler.store_results(results_df)
                 
-                # Show preview
-                print("\nFirst 5 results:")
-                print("-" * 80)
-                for idx, row in results_df.head(5).iterrows():
-                    print(f"Name: {row.get('name', 'N/A')}")
-                    print(f"Title: {row.get('title', 'N/A')}")
-                    print(f"Company: {row.get('company', 'N/A')}")
-                    print(f"Location: {row.get('location', 'N/A')}")
-                    print(f"LinkedIn: {row.get('linkedin_url', 'N/A')}")
-                    if row.get('email'):
-                        print(f"Email: {row.get('email', 'N/A')}")
-                    print("-" * 40)
-                
                 # Export results
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 job_title_clean = search_params['job_titles'][0].replace(' ', '_')
@@ -141,7 +202,21 @@ class LeadSprinterCLI:
     
     def run(self):
         """Main CLI loop"""
+        publisher = None
         try:
+            if self.options.metrics_file or self.options.metrics_port:
+                publisher = MetricsPublisher(
+                    get_metrics(), self.options.metrics_file, self.options.metrics_port
+                ).start()
+            
+            if self.options.resume:
+                # Everything the job needs is in its journal; no prompts
+                search_params = JobJournal.read_params(self.options.resume)
+                search_params['journal_path'] = self.options.resume
+                print(f"\nResuming job from {self.options.resume}")
+                self.run_scraping(search_params)
+                return
+            
             search_params = self.get_user_input()
             if search_params:
                 confirm = input(f"\nProceed with scraping? (y/N): ").lower().strip()
@@ -155,10 +230,15 @@ class LeadSprinterCLI:
         except Exception as e:
             print(f"Unexpected error: {str(e)}")
             self.logger.error(f"CLI error: {str(e)}")
+        finally:
+            # Quit the pooled browsers only once the whole session is over
+            shutdown_default_pool()
+            if publisher:
+                publisher.stop()
 
-def run_cli():
+def run_cli(argv=None):
     """Entry point for CLI"""
-    cli = LeadSprinterCLI()
+    cli = LeadSprinterCLI(parse_args(argv))
     cli.run()
 
 if __name__ == "__main__":
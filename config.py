@@ -17,18 +17,114 @@ class Config:
     THEME = 'DarkBlue3'
     
     # Scraping Settings
-    DEFAULT_DELAY_MIN = 1
-    DEFAULT_DELAY_MAX = 3
-    PROFILE_DELAY_MIN = 2
-    PROFILE_DELAY_MAX = 5
     MAX_RESULTS_PER_SEARCH = 100
     TIMEOUT_SECONDS = 10
+    PAGE_READY_TIMEOUT = 10  # Overall deadline for a page to show any expected content
+    PAGE_READY_POLL_INTERVAL = 0.25
+    PAGE_LOAD_STRATEGY = 'eager'  # 'normal' waits for every subresource, 'eager' for the DOM, 'none' returns at once
+    
+    # Search Endpoints (pointed at a local fixture server by benchmark.py)
+    GOOGLE_SEARCH_URL = "https://www.google.com/search"
+    BING_SEARCH_URL = "https://www.bing.com/search"
+    DUCKDUCKGO_SEARCH_URL = "https://html.duckduckgo.com/html/"
+    URL_REWRITES = {}  # URL prefix -> replacement applied to page loads, e.g. {'https://www.linkedin.com/': 'http://127.0.0.1:8000/'}
+    
+    # ChromeDriver Resolution Settings
+    CHROME_BINARY = None  # Path to Chrome; found automatically when None
+    DRIVER_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600  # Look for a newer chromedriver at most weekly
+    
+    # WebDriver Pool Settings
+    DRIVER_POOL_SIZE = 2
+    DRIVER_MAX_AGE_SECONDS = 1800  # Recycle browsers after 30 minutes
+    DRIVER_MAX_PAGES = 200  # Recycle browsers after this many page loads
+    
+    # Parallel Extraction Settings
+    PROFILE_WORKERS = 1  # Browser workers used to extract profiles in parallel
+    HOST_REQUESTS_PER_MINUTE = 20  # Combined page-load budget per host across all workers
+    HOST_RATE_LIMITS = {}  # Per-host overrides, e.g. {'www.linkedin.com': 12}
+    HOST_BURST = 2  # Requests a host may receive back to back after an idle spell
+    RATE_BACKOFF_BASE_SECONDS = 5  # First pause after a 429/503 or captcha; doubles while it continues
+    RATE_BACKOFF_MAX_SECONDS = 300
+    RATE_MIN_FACTOR = 0.25  # Lowest fraction of the configured rate a penalized host drops to
+    RATE_RECOVERY_STEP = 0.1  # Fraction of the configured rate regained per successful request
+    PIPELINE_QUEUE_SIZE = 20  # Profile URLs the search stage may queue ahead of extraction
+    
+    # SERP-Only Extraction Settings (build leads from search result titles and snippets)
+    SERP_ONLY_MODE = False  # Skip profile page loads for leads the search results already describe
+    SERP_OPEN_INCOMPLETE = False  # In SERP-only mode, still open profiles whose results lack a key field
+    SERP_KEY_FIELDS = ['name', 'title', 'company']
+    
+    # Candidate Ranking Settings (which found profiles get page loads first)
+    RELEVANCE_RANKING_ENABLED = True
+    RELEVANCE_CANDIDATE_FACTOR = 2  # Candidates gathered per profile still needed, so ranking has a choice
+    RELEVANCE_TITLE_WEIGHT = 0.6  # Result title/snippet matches the searched job title
+    RELEVANCE_LOCATION_WEIGHT = 0.25  # Result title/snippet matches the searched location
+    RELEVANCE_SIGHTINGS_WEIGHT = 0.15  # Found by several search strategies or engines
+    RELEVANCE_SIGHTINGS_CAP = 3  # Sightings beyond this add nothing
+    
+    # Resource Blocking Settings (Chrome DevTools Protocol request blocking)
+    RESOURCE_BLOCKING_ENABLED = True
+    BLOCKED_RESOURCE_TYPES = ['Image', 'Font', 'Media']  # Also available: 'Stylesheet'
+    BLOCKED_URL_PATTERNS = [
+        '*googletagmanager.com*',
+        '*google-analytics.com*',
+        '*doubleclick.net*',
+        '*px.ads.linkedin.com*',
+        '*snap.licdn.com*',
+        '*connect.facebook.net*',
+        '*bat.bing.com*'
+    ]
+    ALLOWED_URL_PATTERNS = []  # Never blocked, even if a deny pattern matches
+    ESTIMATED_RESOURCE_BYTES = {  # Typical sizes used to estimate savings from blocked requests
+        'Image': 40000,
+        'Font': 30000,
+        'Media': 500000,
+        'Stylesheet': 30000,
+        'Script': 60000,
+        'Other': 10000
+    }
     
     # File Paths
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     LOGS_DIR = os.path.join(BASE_DIR, 'logs')
     EXPORTS_DIR = os.path.join(BASE_DIR, 'exports')
     TEMP_DIR = os.path.join(BASE_DIR, 'temp')
+    CACHE_DIR = os.path.join(BASE_DIR, 'cache')
+    JOURNAL_DIR = os.path.join(BASE_DIR, 'journals')
+    REPORTS_DIR = os.path.join(BASE_DIR, 'reports')
+    
+    # Profile Cache Settings
+    PROFILE_CACHE_ENABLED = True
+    PROFILE_CACHE_PATH = os.path.join(CACHE_DIR, 'profiles.sqlite3')
+    PROFILE_CACHE_TTL_SECONDS = 7 * 24 * 3600  # Re-scrape profiles older than a week
+    PROFILE_CACHE_MAX_ENTRIES = 50000
+    
+    # Search Result Cache Settings
+    SEARCH_CACHE_MODE = 'use'  # 'use', 'refresh' (re-run searches and update) or 'bypass'
+    SEARCH_CACHE_PATH = os.path.join(CACHE_DIR, 'searches.sqlite3')
+    SEARCH_CACHE_TTL_SECONDS = 3 * 24 * 3600
+    SEARCH_CACHE_MAX_ENTRIES = 5000
+    
+    DRIVER_CACHE_PATH = os.path.join(CACHE_DIR, 'chromedriver.json')
+    
+    # Browser Profile Settings (reusable Chrome user-data directories)
+    BROWSER_PROFILES_DIR = os.path.join(CACHE_DIR, 'browser_profiles')
+    BROWSER_PROFILE_SLOTS = 8  # Most directories kept; one per concurrently running browser
+    BROWSER_PROFILE_MAX_AGE_SECONDS = 14 * 24 * 3600  # Delete directories unused for two weeks
+    BROWSER_PROFILES_MAX_BYTES = 1024 * 1024 * 1024  # Trim least recently used directories above 1 GB
+    BROWSER_DISK_CACHE_BYTES = 100 * 1024 * 1024  # HTTP cache limit per browser
+    
+    # Job Journal Settings (crash-safe progress log used to resume interrupted jobs)
+    JOURNAL_ENABLED = True
+    JOURNAL_FSYNC = False  # fsync after every entry; survives power loss, not just a killed process
+    
+    # Live Metrics Settings (Prometheus text format)
+    METRICS_TEXTFILE_PATH = None  # e.g. '/var/lib/node_exporter/textfile/leadsprinter.prom'
+    METRICS_HTTP_PORT = None  # Serve http://127.0.0.1:<port>/metrics while running
+    METRICS_INTERVAL_SECONDS = 5  # How often the text file is rewritten
+    
+    # Timing Report Settings (per-stage p50/p95/p99 saved after every job)
+    TIMING_REPORTS_ENABLED = True
     
     # Chrome Options
     CHROME_OPTIONS = [
@@ -36,7 +132,6 @@ class Config:
         '--disable-dev-shm-usage',
         '--disable-gpu',
         '--disable-extensions',
-        '--disable-images',
         '--window-size=1920,1080',
         '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     ]
@@ -76,6 +171,7 @@ class Config:
         'location',
         'linkedin_url',
         'email',
+        'relevance_score',
         'scraped_date'
     ]
     
@@ -86,6 +182,7 @@ class Config:
         'location': 'Location', 
         'linkedin_url': 'LinkedIn Profile',
         'email': 'Email Address',
+        'relevance_score': 'Relevance Score',
         'scraped_date': 'Date Scraped'
     }
     
@@ -99,7 +196,7 @@ class Config:
     @classmethod
     def ensure_directories(cls):
         """Ensure all necessary directories exist"""
-        directories = [cls.LOGS_DIR, cls.EXPORTS_DIR, cls.TEMP_DIR]
+        directories = [cls.LOGS_DIR, cls.EXPORTS_DIR, cls.TEMP_DIR, cls.CACHE_DIR, cls.JOURNAL_DIR, cls.REPORTS_DIR]
         for directory in directories:
             if not os.path.exists(directory):
                 os.makedirs(directory)
\ No newline at end of file
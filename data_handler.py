@@ -6,6 +6,7 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 import json
+from canonicalize import canonicalize
 
 class DataHandler:
     def __init__(self):
@@ -29,6 +30,12 @@ class DataHandler:
         if self.results_df.empty:
             return
         
+        # One URL form per person, so the same profile found under different URLs is dropped
+        if 'linkedin_url' in self.results_df.columns:
+            self.results_df['linkedin_url'] = self.results_df['linkedin_url'].map(
+                lambda url: canonicalize(url) or url
+            )
+        
         # Remove duplicates
         self.results_df = self.results_df.drop_duplicates(subset=['linkedin_url'], keep='first')
         
@@ -122,8 +129,8 @@ class DataHandler:
         )
         
         # Prepare data for export
-        export_columns = ['name', 'title', 'company', 'location', 'linkedin_url', 'email', 'scraped_date']
-        export_df = self.results_df[export_columns].copy()
+        export_columns = ['name', 'title', 'company', 'location', 'linkedin_url', 'email', 'relevance_score', 'scraped_date']
+        export_df = self.results_df[[col for col in export_columns if col in self.results_df.columns]].copy()
         
         # Rename columns for better presentation
         column_names = {
@@ -133,6 +140,7 @@ class DataHandler:
             'location': 'Location',
             'linkedin_url': 'LinkedIn Profile',
             'email': 'Email Address',
+            'relevance_score': 'Relevance Score',
             'scraped_date': 'Date Scraped'
         }
         export_df.rename(columns=column_names, inplace=True)
@@ -8,6 +8,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from scraper import LinkedInScraper
+from driver_pool import shutdown_default_pool
 import time
 
 def debug_google_search():
@@ -27,7 +28,7 @@ def debug_google_search():
         
         # Test basic Google access
         print("\n1. Testing basic Google access...")
-        scraper.driver.get("https://www.google.com")
+        scraper.navigate("https://www.google.com")
         time.sleep(2)
         
         current_url = scraper.driver.current_url
@@ -57,7 +58,8 @@ def debug_google_search():
             
         # Check current page content for debugging
         print("\n3. Checking page content...")
-        page_source = scraper.driver.page_source[:1000].lower()  # First 1000 chars
+        snapshot = scraper.get_snapshot()
+        page_source = snapshot.head
         
         if 'captcha' in page_source:
             print("⚠️ CAPTCHA detected in page")
@@ -73,7 +75,7 @@ def debug_google_search():
         # Save page source for inspection
         try:
             with open('debug_page_source.html', 'w', encoding='utf-8') as f:
-                f.write(scraper.driver.page_source)
+                f.write(snapshot.html)
             print("💾 Page source saved to 'debug_page_source.html'")
         except:
             print("⚠️ Could not save page source")
@@ -85,7 +87,8 @@ def debug_google_search():
         
     finally:
         if scraper.driver:
-            scraper.driver.quit()
+            scraper.cleanup()
+            shutdown_default_pool()
             print("🔄 Browser closed")
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+# Deduplication index for LeadSprinter
+# Constant-time "have we seen this profile?" checks shared by search and extraction
+
+import os
+import threading
+from canonicalize import canonicalize
+
+# Column names a previous export may use for the profile URL
+URL_COLUMNS = ['linkedin_url', 'LinkedIn Profile']
+
+
+class SeenIndex:
+    """Thread-safe set of canonical profile URLs, optionally seeded from earlier runs"""
+
+    def __init__(self, urls=None):
+        self._keys = set()
+        self._lock = threading.Lock()
+
+        for url in urls or []:
+            self.add(url)
+
+    @staticmethod
+    def key(url):
+        """Index key for a URL - the canonical profile URL when there is one"""
+        return canonicalize(url) or url
+
+    def add(self, url):
+        """Mark a URL as seen; returns True if it was new"""
+        key = self.key(url)
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+
+    def __contains__(self, url):
+        return self.key(url) in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def filter_new(self, urls, mark=False):
+        """Return URLs not seen yet, in their original order and without repeats"""
+        new_urls = []
+        batch = set()
+
+        for url in urls:
+            key = self.key(url)
+            if key in batch or key in self._keys:
+                continue
+            batch.add(key)
+            new_urls.append(url)
+
+        if mark:
+            with self._lock:
+                self._keys.update(batch)
+
+        return new_urls
+
+    def seed_from_export(self, filepath):
+        """Add every profile URL from a previous Excel or CSV export; returns how many were added"""
+        import pandas as pd
+
+        if filepath.lower().endswith('.csv'):
+            df = pd.read_csv(filepath)
+        else:
+            df = pd.read_excel(filepath)
+
+        column = next((name for name in URL_COLUMNS if name in df.columns), None)
+        if column is None:
+            raise ValueError(f"No LinkedIn URL column found in {filepath}")
+
+        before = len(self)
+        for url in df[column].dropna().astype(str):
+            self.add(url)
+        return len(self) - before
+
+    def load(self, filepath):
+        """Add URLs saved by save(); a missing file is treated as empty"""
+        if not os.path.exists(filepath):
+            return 0
+
+        before = len(self)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    self.add(line.strip())
+        return len(self) - before
+
+    def save(self, filepath):
+        """Persist the index as one canonical URL per line"""
+        directory = os.path.dirname(os.path.abspath(filepath))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with self._lock:
+            keys = sorted(self._keys)
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            for key in keys:
+                f.write(key + '\n')
@@ -0,0 +1,296 @@
+# WebDriver pool for LeadSprinter
+# Keeps warm Chrome instances around so back-to-back jobs skip the cold start
+
+import atexit
+import threading
+import time
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from config import Config
+from resource_filter import ResourceFilter
+from driver_resolver import get_driver_resolver
+from browser_profiles import get_profile_manager
+from metrics import get_metrics
+
+
+def build_chrome_options(resource_filter=None, profile_dir=None):
+    """Build Chrome options with optimal settings"""
+    chrome_options = Options()
+
+    # ALWAYS run headless to avoid opening browser windows
+    chrome_options.add_argument('--headless=new')  # Use new headless mode
+
+    # Performance optimizations
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-notifications')
+    chrome_options.add_argument('--disable-popup-blocking')
+
+    # Anti-detection measures
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    # Fix for dev container/codespace issues
+    chrome_options.add_argument('--disable-web-security')
+    chrome_options.add_argument('--allow-running-insecure-content')
+    chrome_options.add_argument('--disable-features=VizDisplayCompositor')
+
+    # Reusable per-browser profile directory, so the HTTP cache stays warm between jobs
+    if profile_dir:
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        chrome_options.add_argument(f'--disk-cache-size={Config.BROWSER_DISK_CACHE_BYTES}')
+
+    # User agent to appear more legitimate
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+
+    # Window size
+    chrome_options.add_argument('--window-size=1920,1080')
+
+    if Config.CHROME_BINARY:
+        chrome_options.binary_location = Config.CHROME_BINARY
+
+    # Don't block on subresources; callers wait for the content they need instead
+    chrome_options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+
+    # Images, fonts, media and trackers are blocked through DevTools once the browser is up
+    if resource_filter:
+        resource_filter.apply_to_options(chrome_options)
+
+    return chrome_options
+
+
+def launch_chrome(driver_path, chrome_options):
+    """Start Chrome with a known chromedriver, or let Selenium find one if there is none"""
+    if driver_path:
+        from selenium.webdriver.chrome.service import Service
+        return webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+    return webdriver.Chrome(options=chrome_options)
+
+
+def create_chrome_driver():
+    """Launch a new headless Chrome instance"""
+    resource_filter = ResourceFilter()
+    profiles = get_profile_manager()
+    profile_dir = profiles.acquire()
+    chrome_options = build_chrome_options(resource_filter, profile_dir)
+
+    resolver = get_driver_resolver()
+
+    try:
+        # Cached chromedriver path - no version check over the network on every launch
+        driver = launch_chrome(resolver.resolve()['driver_path'], chrome_options)
+
+    except Exception as e1:
+        try:
+            # The cached driver may be stale; resolve again once before giving up on it
+            resolver.invalidate()
+            driver = launch_chrome(resolver.resolve()['driver_path'], chrome_options)
+        except Exception as e2:
+            profiles.release(profile_dir)
+            raise Exception(f"Failed to setup Chrome driver: {str(e1)}. Fallback also failed: {str(e2)}")
+
+    # Remembered so the directory can be handed back once this browser quits
+    driver.leadsprinter_profile_dir = profile_dir
+
+    try:
+        resource_filter.install(driver)
+    except Exception as e:
+        print(f"⚠️ Resource blocking unavailable: {str(e)}")
+
+    return driver
+
+
+def quit_chrome_driver(driver):
+    """Quit a browser and return its profile directory for reuse"""
+    profile_dir = getattr(driver, 'leadsprinter_profile_dir', None)
+    try:
+        driver.quit()
+    finally:
+        if profile_dir:
+            get_profile_manager().release(profile_dir)
+
+
+class DriverLease:
+    """A driver checked out of the pool plus the bookkeeping for its recycle policy"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.pages_loaded = 0
+
+    def record_page(self):
+        """Count a page load against this driver"""
+        self.pages_loaded += 1
+        self.last_used = time.time()
+
+    def get_age(self):
+        """Seconds since the browser was launched"""
+        return time.time() - self.created_at
+
+
+class DriverPool:
+    """Thread-safe pool of Chrome drivers with checkout/return semantics"""
+
+    def __init__(self, factory=None, max_size=None, max_age=None, max_pages=None, destroyer=None):
+        self.factory = factory or create_chrome_driver
+        self.destroyer = destroyer or quit_chrome_driver
+        self.max_size = max_size or Config.DRIVER_POOL_SIZE
+        self.max_age = max_age if max_age is not None else Config.DRIVER_MAX_AGE_SECONDS
+        self.max_pages = max_pages if max_pages is not None else Config.DRIVER_MAX_PAGES
+
+        self._idle = []
+        self._total = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def checkout(self, timeout=None):
+        """Borrow a healthy driver, launching a new one if the pool has room"""
+        deadline = time.time() + timeout if timeout is not None else None
+
+        while True:
+            lease = None
+            with self._condition:
+                if self._closed:
+                    raise Exception("Driver pool is closed")
+
+                if self._idle:
+                    lease = self._idle.pop()
+                elif self._total < self.max_size:
+                    self._total += 1
+                else:
+                    remaining = deadline - time.time() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise Exception("Timed out waiting for a free web driver")
+                    self._condition.wait(remaining)
+                    continue
+
+            if lease is None:
+                # Launch outside the lock so other workers are not blocked on Chrome startup
+                try:
+                    return DriverLease(self.factory())
+                except Exception:
+                    with self._condition:
+                        self._total -= 1
+                        self._condition.notify()
+                    raise
+
+            if not self.needs_recycle(lease) and self.is_healthy(lease):
+                return lease
+
+            self._retire(lease)
+
+    def checkin(self, lease, discard=False):
+        """Return a driver to the pool, retiring it if it is broken or worn out"""
+        if lease is None:
+            return
+
+        if not discard and not self._closed and not self.needs_recycle(lease):
+            try:
+                # Stop any in-flight loads so an idle browser does not keep downloading
+                lease.driver.get('about:blank')
+            except Exception:
+                discard = True
+        else:
+            discard = True
+
+        if discard:
+            self._retire(lease)
+            return
+
+        with self._condition:
+            if self._closed:
+                retire = True
+            else:
+                retire = False
+                lease.last_used = time.time()
+                self._idle.append(lease)
+                self._condition.notify()
+
+        if retire:
+            self._retire(lease)
+
+    def needs_recycle(self, lease):
+        """Check the max-age/max-pages recycle policy"""
+        if self.max_age and lease.get_age() >= self.max_age:
+            return True
+        if self.max_pages and lease.pages_loaded >= self.max_pages:
+            return True
+        return False
+
+    def is_healthy(self, lease):
+        """Cheap liveness probe - a crashed browser fails any command"""
+        try:
+            lease.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def _retire(self, lease):
+        """Quit a driver and free its slot"""
+        try:
+            self.destroyer(lease.driver)
+        except Exception:
+            pass
+
+        with self._condition:
+            self._total -= 1
+            self._condition.notify()
+
+    def ensure_capacity(self, size):
+        """Grow the pool so that `size` drivers can be checked out at once"""
+        with self._condition:
+            if size > self.max_size:
+                self.max_size = size
+                self._condition.notify_all()
+
+    def get_stats(self):
+        """Current pool occupancy"""
+        with self._condition:
+            return {
+                'total': self._total,
+                'idle': len(self._idle),
+                'in_use': self._total - len(self._idle),
+                'max_size': self.max_size
+            }
+
+    def close(self):
+        """Quit every idle driver; drivers still checked out are quit on return"""
+        with self._condition:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+
+        for lease in idle:
+            self._retire(lease)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool():
+    """Shared pool used by the scraper, CLI and GUI"""
+    global _default_pool
+
+    with _default_pool_lock:
+        if _default_pool is None or _default_pool._closed:
+            _default_pool = DriverPool()
+            atexit.register(_default_pool.close)
+            get_metrics().watch('active_drivers', lambda pool=_default_pool: pool.get_stats()['in_use'])
+        return _default_pool
+
+
+def shutdown_default_pool():
+    """Quit all pooled browsers (call on application exit)"""
+    global _default_pool
+
+    with _default_pool_lock:
+        pool = _default_pool
+        _default_pool = None
+
+    if pool:
+        pool.close()
@@ -0,0 +1,184 @@
+# ChromeDriver resolution for LeadSprinter
+# Remembers which chromedriver matches the installed Chrome so startup needs no
+# version check over the network and no throwaway browser launch
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from config import Config
+
+# Where Chrome usually lives when it is not on PATH
+CHROME_CANDIDATES = {
+    'win32': [
+        os.path.join(os.environ.get('PROGRAMFILES', r'C:\Program Files'), r'Google\Chrome\Application\chrome.exe'),
+        os.path.join(os.environ.get('PROGRAMFILES(X86)', r'C:\Program Files (x86)'), r'Google\Chrome\Application\chrome.exe'),
+        os.path.join(os.environ.get('LOCALAPPDATA', ''), r'Google\Chrome\Application\chrome.exe')
+    ],
+    'darwin': [
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+        '/Applications/Chromium.app/Contents/MacOS/Chromium'
+    ]
+}
+CHROME_COMMANDS = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+
+def get_major(version):
+    """Major version number of a dotted version string, or None"""
+    match = VERSION_PATTERN.search(version or '')
+    return int(match.group(1)) if match else None
+
+
+class DriverResolver:
+    """Resolves the chromedriver path once and reuses it while Chrome and the driver are unchanged"""
+
+    def __init__(self, cache_path=None, max_age=None):
+        self.cache_path = cache_path or Config.DRIVER_CACHE_PATH
+        self.max_age = max_age if max_age is not None else Config.DRIVER_CACHE_MAX_AGE_SECONDS
+        self._lock = threading.Lock()
+
+    def find_chrome(self):
+        """Path to the Chrome binary, without launching it"""
+        if Config.CHROME_BINARY and os.path.exists(Config.CHROME_BINARY):
+            return Config.CHROME_BINARY
+
+        for command in CHROME_COMMANDS:
+            path = shutil.which(command)
+            if path:
+                return path
+
+        for path in CHROME_CANDIDATES.get(sys.platform, []):
+            if path and os.path.exists(path):
+                return path
+        return None
+
+    def get_fingerprint(self, path):
+        """Cheap identity of a binary - changes when it is updated or replaced"""
+        try:
+            stat = os.stat(path)
+            return [os.path.realpath(path), stat.st_size, int(stat.st_mtime)]
+        except (OSError, TypeError):
+            return None
+
+    def read_version(self, path):
+        """Version reported by a binary's --version flag (Chrome prints it without opening a window)"""
+        if sys.platform == 'win32' and path.lower().endswith('chrome.exe'):
+            # chrome.exe --version prints nothing on Windows; the install has one folder per version
+            application_dir = os.path.dirname(path)
+            versions = [name for name in os.listdir(application_dir) if VERSION_PATTERN.fullmatch(name)]
+            return max(versions, key=lambda v: [int(part) for part in v.split('.')]) if versions else None
+
+        output = subprocess.run(
+            [path, '--version'], capture_output=True, text=True, timeout=10
+        ).stdout
+        match = VERSION_PATTERN.search(output)
+        return match.group(0) if match else None
+
+    def load(self):
+        """Cached resolution, or None"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, entry):
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        temp_path = self.cache_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(temp_path, self.cache_path)
+
+    def invalidate(self):
+        """Forget the cached resolution (e.g. after the driver failed to start)"""
+        try:
+            os.remove(self.cache_path)
+        except OSError:
+            pass
+
+    def is_valid(self, entry, chrome_path):
+        """Whether a cached resolution still matches the installed Chrome and driver"""
+        if not entry or not entry.get('driver_path'):
+            return False
+        if not os.path.isfile(entry['driver_path']) or not os.access(entry['driver_path'], os.X_OK):
+            return False
+        if self.get_fingerprint(entry['driver_path']) != entry.get('driver_fingerprint'):
+            return False
+        # An updated Chrome may need a newer driver
+        if chrome_path and self.get_fingerprint(chrome_path) != entry.get('chrome_fingerprint'):
+            return False
+        return True
+
+    def is_fresh(self, entry):
+        """Whether a cached resolution is young enough to skip looking for driver updates"""
+        return bool(self.max_age) and time.time() - entry.get('resolved_at', 0) < self.max_age
+
+    def resolve(self, allow_download=True):
+        """Cached resolution if still valid, otherwise resolve again and record it"""
+        # driver_path is None when nothing was found; Selenium then looks for a driver itself
+        with self._lock:
+            chrome_path = self.find_chrome()
+            cached = self.load()
+
+            if self.is_valid(cached, chrome_path) and self.is_fresh(cached):
+                return cached
+
+            try:
+                entry = self.resolve_fresh(chrome_path, allow_download)
+            except Exception as e:
+                # Offline or the download failed - a driver that still matches Chrome is good enough
+                if self.is_valid(cached, chrome_path):
+                    print(f"⚠️ Could not check for driver updates, using cached driver: {str(e)}")
+                    return cached
+                print(f"⚠️ ChromeDriver resolution failed: {str(e)}")
+                return {'driver_path': None, 'driver_version': None,
+                        'chrome_path': chrome_path, 'chrome_version': None}
+
+            try:
+                self.save(entry)
+            except Exception as e:
+                print(f"⚠️ Could not cache ChromeDriver location: {str(e)}")
+            return entry
+
+    def resolve_fresh(self, chrome_path, allow_download=True):
+        """Find a chromedriver whose major version matches Chrome"""
+        chrome_version = self.read_version(chrome_path) if chrome_path else None
+
+        # A matching driver on PATH needs no download at all
+        driver_path = shutil.which('chromedriver')
+        driver_version = self.read_version(driver_path) if driver_path else None
+
+        if not driver_path or (chrome_version and get_major(driver_version) != get_major(chrome_version)):
+            if not allow_download:
+                raise Exception("No matching chromedriver on PATH and downloads are disabled")
+
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver_path = ChromeDriverManager().install()
+            driver_version = self.read_version(driver_path)
+
+        return {
+            'driver_path': driver_path,
+            'driver_version': driver_version,
+            'driver_fingerprint': self.get_fingerprint(driver_path),
+            'chrome_path': chrome_path,
+            'chrome_version': chrome_version,
+            'chrome_fingerprint': self.get_fingerprint(chrome_path) if chrome_path else None,
+            'resolved_at': time.time()
+        }
+
+
+_default_resolver = DriverResolver()
+
+
+def get_driver_resolver():
+    """Resolver shared by the driver pool and the startup check"""
+    return _default_resolver
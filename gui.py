@@ -4,7 +4,9 @@ import threading
 import time
 from datetime import datetime
 from scraper import LinkedInScraper
+from driver_pool import shutdown_default_pool
 from data_handler import DataHandler
+from config import Config
 
 class LeadSprinterGUI:
     def __init__(self):
@@ -55,6 +57,11 @@ class LeadSprinterGUI:
              sg.Spin([i for i in range(10, 501, 10)], initial_value=50, 
                     key='-NUM_RESULTS-', size=(10, 1))],
             
+            [sg.Text('Browser Workers:', size=(18, 1)), 
+             sg.Spin([i for i in range(1, 9)], initial_value=1, 
+                    key='-WORKERS-', size=(10, 1),
+                    tooltip='Number of browsers extracting profiles in parallel')],
+            
             [sg.Text('Industry Filter:', size=(18, 1)), 
              sg.Combo(['All Industries', 'Technology', 'Healthcare', 'Finance', 
                       'Marketing', 'Sales', 'Education', 'Manufacturing'], 
@@ -63,7 +70,15 @@ class LeadSprinterGUI:
             [sg.Text('Company Size:', size=(18, 1)), 
              sg.Combo(['All Sizes', '1-10', '11-50', '51-200', '201-500', 
                       '501-1000', '1000+'], default_value='All Sizes', 
-                     key='-COMPANY_SIZE-', size=(25, 1))]
+                     key='-COMPANY_SIZE-', size=(25, 1))],
+            
+            [sg.Text('', size=(18, 1)), 
+             sg.Checkbox('Refresh cached search results', key='-REFRESH_SEARCH_CACHE-', default=False,
+                        tooltip='Search again instead of reusing results from earlier identical searches')],
+            
+            [sg.Text('', size=(18, 1)), 
+             sg.Checkbox('Leads from search results only', key='-SERP_ONLY-', default=Config.SERP_ONLY_MODE,
+                        tooltip='Read name, title and company from the search results instead of opening every profile')]
         ]
         
         # Control buttons section
@@ -201,8 +216,11 @@ class LeadSprinterGUI:
                     'job_titles': [title.strip() for title in values['-JOB_TITLES-'].split(',')],
                     'locations': [loc.strip() for loc in values['-LOCATIONS-'].split(',')],
                     'num_results': values['-NUM_RESULTS-'],
+                    'workers': values['-WORKERS-'],
                     'industry': values['-INDUSTRY-'] if values['-INDUSTRY-'] != 'All Industries' else None,
-                    'company_size': values['-COMPANY_SIZE-'] if values['-COMPANY_SIZE-'] != 'All Sizes' else None
+                    'company_size': values['-COMPANY_SIZE-'] if values['-COMPANY_SIZE-'] != 'All Sizes' else None,
+                    'search_cache': 'refresh' if values['-REFRESH_SEARCH_CACHE-'] else 'use',
+                    'serp_only': values['-SERP_ONLY-']
                 }
                 
                 # Start scraping in background thread
@@ -242,6 +260,7 @@ class LeadSprinterGUI:
         # Cleanup
         if self.scraper:
             self.scraper.cleanup()
+        shutdown_default_pool()
 
 def run_gui():
     """Entry point for GUI"""
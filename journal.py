@@ -0,0 +1,149 @@
+# Job journal for LeadSprinter
+# Append-only JSON Lines log of a scraping job, written as the job runs so that a
+# crashed or killed run can be resumed without repeating completed work
+
+import json
+import os
+import threading
+from datetime import datetime
+from config import Config
+
+
+# Entry types, one JSON object per line:
+#   job      - search parameters, written once when the journal is created
+#   query    - a finished search, the profile URLs it queued and their relevance scores
+#   visit    - a profile URL that was processed, with its record if it was accepted
+#   finished - the job ran to completion
+
+
+class JobJournal:
+    """Append-only record of a job's parameters, finished queries, visited URLs and extracted profiles"""
+
+    def __init__(self, path, search_params=None):
+        self.path = path
+        self.params = None
+        self.completed_queries = {}  # query -> number of results it found
+        self.queued = {}  # profile URL -> (query, job title, location, relevance score)
+        self.visited = set()
+        self.records = []  # Records from a replayed journal; a live run streams its records to the file only
+        self.finished = False
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        torn = False
+        if os.path.exists(path):
+            torn = self.replay()
+
+        # Line buffered: every entry reaches the OS as soon as it is written
+        self._file = open(path, 'a', encoding='utf-8', buffering=1)
+        if torn:
+            # Start on a fresh line so the first new entry is not glued to the half-written one
+            self._file.write('\n')
+
+        if self.params is None and search_params is not None:
+            self.params = dict(search_params)
+            self.append({'type': 'job', 'params': self.params, 'started': datetime.now().isoformat()})
+
+    @staticmethod
+    def read_params(path):
+        """Search parameters of the job recorded in a journal"""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('type') == 'job':
+                    return entry['params']
+        raise ValueError(f"No job parameters found in {path}")
+
+    @property
+    def is_resumed(self):
+        return bool(self.completed_queries or self.visited)
+
+    def replay(self):
+        """Rebuild the job state from an existing journal; returns True if its last line was cut off"""
+        line = ''
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash can leave the last line half written
+                    continue
+
+                entry_type = entry.get('type')
+                if entry_type == 'job':
+                    self.params = entry['params']
+                elif entry_type == 'query':
+                    self.completed_queries[entry['query']] = entry.get('found', len(entry['urls']))
+                    scores = entry.get('scores') or {}
+                    for url in entry['urls']:
+                        self.queued[url] = (entry['query'], entry['job_title'], entry['location'], scores.get(url))
+                elif entry_type == 'visit':
+                    # Failed extractions stay pending so a resumed job retries them
+                    if entry.get('extracted', True):
+                        self.visited.add(entry['url'])
+                    if entry.get('record'):
+                        self.records.append(entry['record'])
+                elif entry_type == 'finished':
+                    self.finished = True
+        return bool(line) and not line.endswith('\n')
+
+    def append(self, entry):
+        """Write one entry; cheap enough to call after every profile"""
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            if Config.JOURNAL_FSYNC:
+                os.fsync(self._file.fileno())
+
+    def record_query(self, query, job_title, location, urls, found=None, scores=None):
+        """A search finished and queued these profile URLs; found counts all results, queued or not"""
+        found = len(urls) if found is None else found
+        scores = scores or {}
+        with self._lock:
+            self.completed_queries[query] = found
+            for url in urls:
+                self.queued[url] = (query, job_title, location, scores.get(url))
+        entry = {
+            'type': 'query', 'query': query, 'job_title': job_title,
+            'location': location, 'urls': list(urls), 'found': found
+        }
+        if scores:
+            entry['scores'] = scores
+        self.append(entry)
+
+    def record_visit(self, url, record=None, extracted=True):
+        """A profile was processed; record is the accepted profile data, if any"""
+        with self._lock:
+            if extracted:
+                self.visited.add(url)
+        self.append({'type': 'visit', 'url': url, 'record': record, 'extracted': extracted})
+
+    def record_finished(self):
+        self.finished = True
+        self.append({'type': 'finished', 'ended': datetime.now().isoformat()})
+
+    def get_pending(self):
+        """Profiles queued before the interruption but never processed, as (url, query, job title, location, score)"""
+        with self._lock:
+            return [
+                (url,) + context for url, context in self.queued.items()
+                if url not in self.visited
+            ]
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def get_default_journal_path(search_params):
+    """Journal file for a new job, named after its first job title and the start time"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    job_title = search_params['job_titles'][0].replace(' ', '_') if search_params.get('job_titles') else 'job'
+    return os.path.join(Config.JOURNAL_DIR, f"job_{job_title}_{timestamp}.jsonl")
@@ -58,39 +58,21 @@ def check_dependencies():
         sys.exit(1)
 
 def check_webdriver():
-    """Check if Chrome WebDriver is available"""
+    """Check that Chrome and a matching ChromeDriver are installed, without launching a browser"""
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.chrome.service import Service
-        import tempfile
+        from driver_resolver import get_driver_resolver
         
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
+        resolution = get_driver_resolver().resolve()
+        if not resolution['chrome_path']:
+            print("WebDriver check failed: Google Chrome was not found")
+            return False
+        if not resolution['driver_path']:
+            print("WebDriver check failed: no ChromeDriver matching your Chrome version was found")
+            return False
         
-        # Use unique user data directory
-        user_data_dir = tempfile.mkdtemp()
-        chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
-        
-        # Try webdriver-manager first
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.quit()
-            return True
-        except Exception as e1:
-            # Fallback to system driver
-            try:
-                driver = webdriver.Chrome(options=chrome_options)
-                driver.quit()
-                return True
-            except Exception as e2:
-                print(f"WebDriver check failed: {str(e1)}")
-                return False
+        print(f"Chrome {resolution['chrome_version'] or '(unknown version)'}, "
+              f"ChromeDriver {resolution['driver_version'] or '(unknown version)'}")
+        return True
         
     except Exception as e:
         print(f"WebDriver check failed: {str(e)}")
@@ -0,0 +1,215 @@
+# Live metrics for LeadSprinter
+# Process-wide counters and gauges, published as a Prometheus text file and/or a small
+# local HTTP endpoint so a supervisor can watch a running job
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config import Config
+
+PREFIX = 'leadsprinter_'
+
+# name -> (type, help text)
+METRIC_HELP = {
+    'profiles_extracted_total': ('counter', 'Profiles extracted and accepted into job results'),
+    'serps_fetched_total': ('counter', 'Search result pages fetched, by engine'),
+    'cache_hits_total': ('counter', 'Profile and search cache hits'),
+    'serp_leads_total': ('counter', 'Leads built from search results without a profile page load'),
+    'block_detections_total': ('counter', 'Captcha, rate-limit or block responses, by engine'),
+    'profiles_per_minute': ('gauge', 'Profiles accepted per minute in the current job'),
+    'job_profiles_done': ('gauge', 'Profiles collected so far in the current job'),
+    'job_profiles_target': ('gauge', 'Profiles requested for the current job'),
+    'active_drivers': ('gauge', 'Browsers currently checked out of the driver pool'),
+    'queue_depth': ('gauge', 'Profile URLs waiting for an extraction worker'),
+    'process_resident_memory_bytes': ('gauge', 'Resident set size of the LeadSprinter process')
+}
+
+
+def get_rss_bytes():
+    """Current resident memory of this process (peak RSS where the current value is unavailable)"""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        return 0
+
+
+class Metrics:
+    """Thread-safe counters plus gauges that are read from live objects when rendered"""
+
+    def __init__(self):
+        self.counters = {}  # (name, labels) -> value
+        self.gauges = {}  # (name, labels) -> value
+        self.gauge_sources = {}  # name -> callable returning the current value
+        self.job_started = None
+        self.job_profiles = 0
+        self._lock = threading.Lock()
+
+    def increment(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def watch(self, name, source):
+        """Read a gauge from `source()` at render time (None stops watching)"""
+        with self._lock:
+            if source is None:
+                self.gauge_sources.pop(name, None)
+            else:
+                self.gauge_sources[name] = source
+
+    def start_job(self, target):
+        """Reset the per-job gauges"""
+        with self._lock:
+            self.job_started = time.monotonic()
+            self.job_profiles = 0
+        self.set_gauge('job_profiles_target', target)
+        self.set_gauge('job_profiles_done', 0)
+
+    def record_profile(self):
+        """One profile accepted into the current job"""
+        self.increment('profiles_extracted_total')
+        with self._lock:
+            self.job_profiles += 1
+
+    def observe_progress(self, current, total, status=None):
+        """Progress callback hook - mirrors the numbers the GUI and CLI show"""
+        self.set_gauge('job_profiles_done', current)
+        if total:
+            self.set_gauge('job_profiles_target', total)
+
+    def get_profiles_per_minute(self):
+        with self._lock:
+            if self.job_started is None:
+                return 0.0
+            minutes = (time.monotonic() - self.job_started) / 60
+            return self.job_profiles / minutes if minutes > 0 else 0.0
+
+    def snapshot(self):
+        """Every metric value right now, as {(name, labels): value}"""
+        with self._lock:
+            values = dict(self.counters)
+            values.update(self.gauges)
+            sources = dict(self.gauge_sources)
+
+        values[('profiles_per_minute', ())] = round(self.get_profiles_per_minute(), 3)
+        values[('process_resident_memory_bytes', ())] = get_rss_bytes()
+        for name, source in sources.items():
+            try:
+                values[(name, ())] = source()
+            except Exception:
+                continue
+        return values
+
+    def render(self):
+        """Prometheus text exposition format"""
+        by_name = {}
+        for (name, labels), value in self.snapshot().items():
+            by_name.setdefault(name, []).append((labels, value))
+
+        lines = []
+        for name in sorted(by_name):
+            metric_type, help_text = METRIC_HELP.get(name, ('gauge', name))
+            lines.append(f"# HELP {PREFIX}{name} {help_text}")
+            lines.append(f"# TYPE {PREFIX}{name} {metric_type}")
+            for labels, value in sorted(by_name[name]):
+                label_text = ','.join(f'{key}="{label}"' for key, label in labels)
+                lines.append(f"{PREFIX}{name}{{{label_text}}} {value}" if label_text else f"{PREFIX}{name} {value}")
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsPublisher:
+    """Rewrites a Prometheus text file periodically and/or serves /metrics on localhost"""
+
+    def __init__(self, metrics, textfile_path=None, http_port=None, interval=None):
+        self.metrics = metrics
+        self.textfile_path = textfile_path
+        self.http_port = http_port
+        self.interval = interval or Config.METRICS_INTERVAL_SECONDS
+        self.server = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def write_textfile(self):
+        """Atomically replace the text file so a collector never reads half a file"""
+        directory = os.path.dirname(os.path.abspath(self.textfile_path))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        temp_path = self.textfile_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.metrics.render())
+        os.replace(temp_path, self.textfile_path)
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.write_textfile()
+            except Exception as e:
+                print(f"⚠️ Could not write metrics file: {str(e)}")
+
+    def start(self):
+        if self.textfile_path:
+            self.write_textfile()
+            self._thread = threading.Thread(target=self.run, daemon=True)
+            self._thread.start()
+            print(f"📈 Writing metrics to {self.textfile_path} every {self.interval}s")
+
+        if self.http_port:
+            metrics = self.metrics
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.rstrip('/') not in ('', '/metrics'):
+                        self.send_error(404)
+                        return
+                    body = metrics.render().encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            self.server = ThreadingHTTPServer(('127.0.0.1', self.http_port), Handler)
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            print(f"📈 Serving metrics on http://127.0.0.1:{self.server.server_port}/metrics")
+        return self
+
+    def stop(self):
+        """Stop publishing, leaving a final up-to-date text file behind"""
+        self._stopped.set()
+        if self.textfile_path:
+            try:
+                self.write_textfile()
+            except Exception:
+                pass
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+_metrics = Metrics()
+
+
+def get_metrics():
+    """Process-wide metrics shared by the scrapers, pipeline and publishers"""
+    return _metrics
@@ -0,0 +1,128 @@
+# Page classification for LeadSprinter
+# Sorts a fetched page into ok / consent / blocked / empty in one scan of the document,
+# keeping the matched phrases as evidence
+
+import re
+from urllib.parse import urlparse
+
+OK = 'ok'
+CONSENT = 'consent'
+BLOCKED = 'blocked'
+EMPTY = 'empty'
+
+# Phrases per category, as regex fragments matched against the lowercased page. Bare status
+# codes are not used - "403" or "429" turn up in ordinary result counts and snippets
+PAGE_PATTERNS = {
+    BLOCKED: [
+        r'unusual traffic',
+        r'detected unusual',
+        r'unusual requests',
+        r'suspicious requests',
+        r'automated queries',
+        r'verify you are (?:a )?human',
+        r'verify that you',
+        r"prove you(?:'|&#39;|’)re (?:a )?human",
+        r'please confirm (?:that )?you',
+        r"(?:are you|not) a robot",
+        r'id="captcha-form"',
+        r'g-recaptcha',
+        r'\bcaptcha\b',
+        r'solve the challenge',
+        r'bots use duckduckgo too',
+        r'anomaly-modal',
+        r'\b403 forbidden\b',
+        r'\b429 too many requests\b',
+        r'\b(?:error|http|status)[\s:]*(?:403|429)\b',
+        r'access denied'
+    ],
+    CONSENT: [
+        r'before you continue to google',
+        r'action="https://consent\.google\.[a-z.]+',
+        r'id="l2aglb"',
+        r'consent\.youtube\.com'
+    ],
+    EMPTY: [
+        r'did not match any documents',
+        r'no results found for',
+        r'there are no results for',
+        r'class="no-results"'
+    ]
+}
+
+# Redirect targets that give a page away before its content is read. Matched against host and
+# path only - the query string carries the search terms ("Robotics Engineer")
+URL_PATTERNS = {
+    BLOCKED: [r'captcha', r'/sorry/', r'blocked', r'denied', r'robot'],
+    CONSENT: [r'consent\.google\.', r'consent\.youtube\.']
+}
+
+# A blocked page outranks a consent wall, which outranks an empty result list
+PRIORITY = [BLOCKED, CONSENT, EMPTY]
+
+MAX_EVIDENCE = 10
+
+
+def compile_patterns(patterns):
+    """One alternation with a named group per category, so a single scan tests every phrase"""
+    return re.compile('|'.join(
+        f"(?P<{category}>{'|'.join(fragments)})" for category, fragments in patterns.items()
+    ))
+
+
+PAGE_PATTERN = compile_patterns(PAGE_PATTERNS)
+URL_PATTERN = compile_patterns(URL_PATTERNS)
+
+
+class PageClassification:
+    """Outcome of classifying a page"""
+
+    def __init__(self, status, evidence=None):
+        self.status = status
+        self.evidence = evidence or []  # (category, matched text, offset); offset -1 for the URL
+
+    @property
+    def is_blocked(self):
+        return self.status == BLOCKED
+
+    def describe(self):
+        """Short human-readable summary of the evidence"""
+        return ', '.join(f"{category}: '{text}'" for category, text, _ in self.evidence) or 'no evidence'
+
+    def __repr__(self):
+        return f"PageClassification({self.status}, {self.evidence})"
+
+
+def get_url_location(url):
+    """Lowercased host and path of a URL, without the query string or fragment"""
+    parsed = urlparse((url or '').lower())
+    return parsed.netloc + parsed.path
+
+
+def classify_page(html, url='', lowered=None):
+    """Classify a page in one linear pass; `lowered` reuses an already lowercased copy of html"""
+    evidence = []
+
+    for match in URL_PATTERN.finditer(get_url_location(url)):
+        evidence.append((match.lastgroup, match.group(), -1))
+
+    found = {category for category, _, _ in evidence}
+    if BLOCKED not in found:
+        page = lowered if lowered is not None else (html or '').lower()
+        for match in PAGE_PATTERN.finditer(page):
+            category = match.lastgroup
+            found.add(category)
+            if len(evidence) < MAX_EVIDENCE:
+                evidence.append((category, match.group(), match.start()))
+            # Nothing outranks a block, so the rest of the page cannot change the answer
+            if category == BLOCKED:
+                break
+
+    for category in PRIORITY:
+        if category in found:
+            return PageClassification(category, evidence)
+    return PageClassification(OK, evidence)
+
+
+def classify_snapshot(snapshot):
+    """Classify a PageSnapshot, reusing its lowercased copy of the page"""
+    return classify_page(snapshot.html, snapshot.url, snapshot.lower)
@@ -0,0 +1,92 @@
+# Page readiness detection for LeadSprinter
+# Waits once for any of several selectors instead of paying one timeout per selector
+
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from config import Config
+from cancellation import CancelledError
+
+# One poll checks every selector and the optional page-state predicate
+READINESS_SCRIPT = """
+const selectors = arguments[0];
+const predicate = arguments[1];
+
+for (const selector of selectors) {
+    try {
+        if (document.querySelector(selector)) {
+            return selector;
+        }
+    } catch (e) {
+        continue;
+    }
+}
+
+if (predicate && (new Function(predicate))()) {
+    return 'predicate';
+}
+
+return null;
+"""
+
+
+# Google result containers
+SERP_RESULT_SELECTORS = [
+    '#search',
+    '#rso',
+    'div.g'
+]
+
+# Google results, or the consent/captcha pages that replace them
+SERP_READY_SELECTORS = SERP_RESULT_SELECTORS + [
+    'form[action*="consent"]',
+    '#L2AGLb',
+    '#captcha-form',
+    '#recaptcha'
+]
+
+
+class ReadinessResult:
+    """Outcome of a readiness wait"""
+
+    def __init__(self, ready, fired=None, elapsed=0.0):
+        self.ready = ready
+        self.fired = fired  # Selector that matched, 'predicate', or None on timeout
+        self.elapsed = elapsed
+
+    def __bool__(self):
+        return self.ready
+
+    def __repr__(self):
+        return f"ReadinessResult(ready={self.ready}, fired={self.fired!r}, elapsed={self.elapsed:.2f}s)"
+
+
+class ReadinessDetector:
+    """Wait until any selector is present or a page-state predicate holds, bounded by one deadline"""
+
+    def __init__(self, selectors, predicate=None, timeout=None, poll_interval=None):
+        self.selectors = list(selectors)
+        self.predicate = predicate  # JavaScript function body returning a truthy value
+        self.timeout = timeout if timeout is not None else Config.PAGE_READY_TIMEOUT
+        self.poll_interval = poll_interval or Config.PAGE_READY_POLL_INTERVAL
+
+    def check(self, driver):
+        """Single poll - returns the selector that fired or None"""
+        return driver.execute_script(READINESS_SCRIPT, self.selectors, self.predicate)
+
+    def wait(self, driver, timeout=None, cancel_token=None):
+        """Block until the page is ready or the overall deadline passes"""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+
+        def poll(d):
+            # Checked on every poll so a stop request ends the wait within one interval
+            if cancel_token and cancel_token.is_cancelled:
+                raise CancelledError("Scraping stopped by user")
+            return self.check(d)
+
+        try:
+            fired = WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(poll)
+            return ReadinessResult(True, fired, time.monotonic() - start)
+        except TimeoutException:
+            return ReadinessResult(False, None, time.monotonic() - start)
@@ -0,0 +1,48 @@
+# Page snapshots for LeadSprinter
+# Fetches the DOM once per navigation and shares derived views between detectors and extractors
+
+
+class PageSnapshot:
+    """The page source captured once, with lowered text, head and parsed tree computed on demand"""
+
+    HEAD_LENGTH = 2000
+
+    def __init__(self, html, url=''):
+        self.html = html or ''
+        self.url = url or ''
+        self._lower = None
+        self._head = None
+        self._soup = None
+
+    @classmethod
+    def from_driver(cls, driver):
+        """Capture the current page - the only place page_source is pulled over the wire"""
+        return cls(driver.page_source, driver.current_url)
+
+    @property
+    def lower(self):
+        """Lowercased document, computed once"""
+        if self._lower is None:
+            self._lower = self.html.lower()
+        return self._lower
+
+    @property
+    def head(self):
+        """Lowercased start of the document, for cheap diagnostics"""
+        if self._head is None:
+            if self._lower is not None:
+                self._head = self._lower[:self.HEAD_LENGTH]
+            else:
+                self._head = self.html[:self.HEAD_LENGTH].lower()
+        return self._head
+
+    @property
+    def soup(self):
+        """Parsed BeautifulSoup tree, built once"""
+        if self._soup is None:
+            from bs4 import BeautifulSoup
+            self._soup = BeautifulSoup(self.html, 'html.parser')
+        return self._soup
+
+    def __len__(self):
+        return len(self.html)
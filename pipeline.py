@@ -0,0 +1,349 @@
+# Search/extraction pipeline for LeadSprinter
+# The search stage feeds profile URLs through a bounded queue to extraction workers,
+# so the next SERP is fetched while the current batch of profiles is being extracted
+
+import queue
+import threading
+from config import Config
+from metrics import get_metrics
+from serp_parser import get_missing_fields
+
+# How often blocked stages wake up to check for stop requests
+POLL_SECONDS = 0.2
+
+
+class ProfileTask:
+    """A profile URL waiting for extraction, with the search that found it"""
+
+    def __init__(self, profile_url, search_query, job_title, location, serp_record=None, relevance_score=None):
+        self.profile_url = profile_url
+        self.search_query = search_query
+        self.job_title = job_title
+        self.location = location
+        self.serp_record = serp_record  # Lead built from the search result, in SERP-only mode
+        self.relevance_score = relevance_score  # How well the search result matched, when candidates are ranked
+
+
+class ScrapePipeline:
+    """Producer/consumer pipeline behind LinkedInScraper.scrape_profiles"""
+
+    def __init__(self, scraper, search_params, progress_callback=None, journal=None):
+        self.scraper = scraper
+        self.journal = journal
+        self.search_params = search_params
+        self.progress_callback = progress_callback
+        self.total_requested = search_params['num_results']
+        self.num_workers = max(1, int(search_params.get('workers') or Config.PROFILE_WORKERS))
+        self.open_incomplete = search_params.get('open_incomplete', Config.SERP_OPEN_INCOMPLETE)
+        # Ranking only pays off if the searches find more candidates than the job still needs
+        self.candidate_factor = Config.RELEVANCE_CANDIDATE_FACTOR if scraper.candidates is not None else 1
+
+        # Bounded, so a fast search stage blocks instead of racing ahead of extraction
+        self.tasks = queue.Queue(maxsize=search_params.get('queue_size') or Config.PIPELINE_QUEUE_SIZE)
+        self.results = queue.Queue()
+
+        self.state = threading.Condition()
+        self.completed = 0  # Profiles accepted into the results
+        self.pending = 0  # Tasks queued or being extracted
+        self.search_done = threading.Event()
+        self.finished = threading.Event()  # Target reached, stop requested or pipeline torn down
+
+    def report(self, status):
+        """Forward a status line to the progress callback"""
+        get_metrics().observe_progress(self.completed, self.total_requested, status)
+        if self.progress_callback:
+            self.progress_callback(self.completed, self.total_requested, status)
+
+    def is_stopped(self):
+        """True once the job is complete or the user asked to stop"""
+        return self.scraper.stop_requested or self.finished.is_set()
+
+    def get_search_variants(self, job_title, location):
+        """Query variants tried in turn for one job title/location pair"""
+        return [
+            f"{job_title} {location}",
+            f"{job_title} in {location}",
+            f"{job_title} {location} Ireland" if 'galway' in location.lower() else f"{job_title} {location}"
+        ]
+
+    def rank_candidates(self, urls, job_title, location):
+        """(url, relevance score) pairs, best candidates first when ranking is enabled"""
+        candidates = self.scraper.candidates
+        if candidates is None:
+            return [(url, None) for url in urls]
+
+        ranked = candidates.rank(urls, job_title, location)
+        if ranked:
+            print(f"📊 Candidate relevance: best {ranked[0][1]}, worst {ranked[-1][1]}")
+        return ranked
+
+    def wait_for_demand(self):
+        """Block the search stage while queued and in-flight work already covers the target"""
+        with self.state:
+            while not self.is_stopped():
+                needed = self.total_requested - self.completed - self.pending
+                if needed > 0:
+                    return needed
+                self.state.wait(POLL_SECONDS)
+            return 0
+
+    def put_task(self, task):
+        """Queue a profile for extraction, waiting for space; returns False if the job stopped"""
+        with self.state:
+            self.pending += 1
+
+        while not self.is_stopped():
+            try:
+                self.tasks.put(task, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+
+        with self.state:
+            self.pending -= 1
+            self.state.notify_all()
+        return False
+
+    def search_stage(self):
+        """Producer: run searches and queue every new profile URL"""
+        scraper = self.scraper
+
+        try:
+            if not self.queue_pending():
+                return
+
+            for job_title in self.search_params['job_titles']:
+                for location in self.search_params['locations']:
+                    for search_query in self.get_search_variants(job_title, location):
+                        # Searches finished before an interruption are not repeated on resume
+                        if self.journal and search_query in self.journal.completed_queries:
+                            if self.journal.completed_queries[search_query]:
+                                break
+                            continue
+
+                        needed = self.wait_for_demand()
+                        if needed <= 0:
+                            return
+
+                        self.report(f"Searching: {search_query}")
+
+                        try:
+                            profile_urls = scraper.scrape_google_search_results(
+                                search_query,
+                                min(20, needed * self.candidate_factor)
+                            )
+
+                            # If Google returns no results, try DuckDuckGo as fallback
+                            if not profile_urls:
+                                print(f"🔄 Google found nothing for '{search_query}', trying DuckDuckGo...")
+                                profile_urls = scraper.scrape_duckduckgo_search_results(
+                                    search_query,
+                                    min(15, needed * self.candidate_factor)
+                                )
+
+                            if not profile_urls:
+                                print(f"❌ No profiles found for '{search_query}' with any search engine")
+                                if self.journal and not self.is_stopped():
+                                    self.journal.record_query(search_query, job_title, location, [])
+                                continue
+
+                            # Skip profiles we already have and claim the rest for this job, best candidates first
+                            new_urls = scraper.seen_index.filter_new(profile_urls, mark=True)
+                            ranked = self.rank_candidates(new_urls, job_title, location)
+                            print(f"🔍 Queueing {len(new_urls)} profiles from '{search_query}'")
+
+                            if self.journal:
+                                self.journal.record_query(
+                                    search_query, job_title, location, [url for url, _ in ranked],
+                                    found=len(profile_urls),
+                                    scores={url: score for url, score in ranked if score is not None}
+                                )
+
+                            serp_records = scraper.serp_records or {}
+                            for profile_url, score in ranked:
+                                task = ProfileTask(
+                                    profile_url, search_query, job_title, location,
+                                    serp_records.get(profile_url), score
+                                )
+                                if not self.put_task(task):
+                                    return
+
+                            # If we found profiles with this variant, don't try other variants for this job/location combo
+                            break
+
+                        except Exception as e:
+                            print(f"❌ Search failed for '{search_query}': {str(e)}")
+                            continue
+        finally:
+            self.search_done.set()
+
+    def queue_pending(self):
+        """Re-queue profiles a resumed job had found but not yet extracted; returns False if the job stopped"""
+        if not self.journal:
+            return True
+
+        pending = self.journal.get_pending()
+        if pending:
+            print(f"📒 Resuming {len(pending)} profiles queued before the interruption")
+
+        for profile_url, search_query, job_title, location, score in pending:
+            if self.wait_for_demand() <= 0:
+                return False
+            task = ProfileTask(profile_url, search_query, job_title, location, relevance_score=score)
+            if not self.put_task(task):
+                return False
+        return True
+
+    def extract(self, worker, task):
+        """Extract one profile, serving it from the profile cache or its search result when possible"""
+        scraper = self.scraper
+
+        cached = scraper.profile_cache.get(task.profile_url) if scraper.profile_cache is not None else None
+        if cached:
+            get_metrics().increment('cache_hits_total', cache='profile')
+            cached['linkedin_url'] = task.profile_url
+            return cached
+
+        # In SERP-only mode the search result is the lead, unless it lacks a key field we may open the page for
+        serp_record = task.serp_record
+        if serp_record and (not self.open_incomplete or not get_missing_fields(serp_record)):
+            get_metrics().increment('serp_leads_total')
+            return dict(serp_record)
+
+        # Drivers are only borrowed once a worker actually needs to load a page
+        if worker.lease is None:
+            worker.setup_driver()
+
+        # Spacing between profile loads comes from the shared rate scheduler in navigate()
+        profile_data = worker.scrape_profile_info(task.profile_url)
+        if profile_data:
+            scraper.store_in_cache(profile_data)
+
+            # Anything the page did not show is taken from the search result
+            for field, value in (serp_record or {}).items():
+                if value and profile_data.get(field) in ('N/A', None):
+                    profile_data[field] = value
+
+        return profile_data
+
+    def extraction_worker(self):
+        """Consumer: drain the task queue with a dedicated browser"""
+        worker = self.scraper.create_worker()
+
+        try:
+            while not self.is_stopped():
+                try:
+                    task = self.tasks.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    if self.search_done.is_set() and self.tasks.empty():
+                        break
+                    continue
+
+                profile_data = None
+                try:
+                    profile_data = self.extract(worker, task)
+                except Exception as e:
+                    print(f"❌ Error processing {task.profile_url}: {str(e)}")
+                finally:
+                    self.results.put((task, profile_data))
+
+        except Exception as e:
+            print(f"❌ Worker failed: {str(e)}")
+        finally:
+            self.scraper.release_worker(worker)
+
+    def accept(self, task, profile_data):
+        """Count one extraction result against the target; returns the record if it is kept"""
+        accepted = False
+        with self.state:
+            self.pending -= 1
+
+            if not profile_data:
+                print(f"⚠️  Could not extract data from {task.profile_url}")
+            elif self.completed < self.total_requested and not self.scraper.stop_requested:
+                accepted = True
+                # Add search context
+                profile_data['search_query'] = task.search_query
+                profile_data['job_title_searched'] = task.job_title
+                profile_data['location_searched'] = task.location
+                if task.relevance_score is not None:
+                    profile_data['relevance_score'] = task.relevance_score
+
+                self.completed += 1
+                get_metrics().record_profile()
+                if self.scraper.completed_index is not None:
+                    self.scraper.completed_index.add(task.profile_url)
+
+                print(f"✅ Profile {self.completed}: {profile_data.get('name', 'Unknown')} - {profile_data.get('title', 'No title')}")
+
+            if self.completed >= self.total_requested:
+                self.finished.set()
+            self.state.notify_all()
+
+        if self.journal:
+            # A record turned away by a stop request (or a full target) was never saved, so it stays
+            # pending and a resumed job extracts it again
+            self.journal.record_visit(task.profile_url, profile_data if accepted else None, extracted=accepted)
+
+        if profile_data:
+            self.report(f"Extracted: {profile_data.get('name', 'Unknown')}{self.scraper.get_cache_status()}")
+
+        return profile_data if accepted else None
+
+    def iter_results(self):
+        """Run both stages and yield each record as soon as it is accepted"""
+        # A resumed job starts from the profiles its journal already holds
+        resumed = list(self.journal.records) if self.journal else []
+        self.completed = len(resumed)
+        if self.scraper.completed_index is not None:
+            for record in resumed:
+                self.scraper.completed_index.add(record.get('linkedin_url'))
+        if self.completed >= self.total_requested:
+            self.finished.set()
+
+        # Extraction workers plus the driver the search stage holds
+        self.scraper.pool.ensure_capacity(self.num_workers + 1)
+
+        metrics = get_metrics()
+        metrics.start_job(self.total_requested)
+        metrics.watch('queue_depth', self.tasks.qsize)
+
+        search_thread = threading.Thread(target=self.search_stage, daemon=True)
+        worker_threads = [
+            threading.Thread(target=self.extraction_worker, daemon=True)
+            for _ in range(self.num_workers)
+        ]
+
+        search_thread.start()
+        for thread in worker_threads:
+            thread.start()
+
+        try:
+            yield from resumed
+
+            while True:
+                try:
+                    task, profile_data = self.results.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    workers_alive = any(thread.is_alive() for thread in worker_threads)
+                    if not workers_alive and self.results.empty():
+                        break
+                    continue
+
+                record = self.accept(task, profile_data)
+                if record:
+                    yield record
+        except BaseException:
+            # Ctrl-C, or a consumer abandoning the iterator; wake the stages so the joins below return promptly
+            self.scraper.stop_scraping()
+            raise
+        finally:
+            self.finished.set()
+            search_thread.join()
+            for thread in worker_threads:
+                thread.join()
+            metrics.watch('queue_depth', None)
+            metrics.observe_progress(self.completed, self.total_requested)
+
+        if self.journal and not self.scraper.stop_requested:
+            self.journal.record_finished()
@@ -0,0 +1,103 @@
+# Profile field extraction for LeadSprinter
+# Pulls every profile field out of the page in a single WebDriver round trip
+
+# Candidate selectors per field, tried in order; the first one with visible text wins
+PROFILE_FIELD_SELECTORS = {
+    'name': [
+        'h1.text-heading-xlarge',
+        '.pv-text-details__left-panel h1',
+        '.profile-photo-edit__preview'
+    ],
+    'title': [
+        '.text-body-medium.break-words',
+        '.pv-text-details__left-panel .text-body-medium',
+        '.profile-photo-edit__preview + div'
+    ],
+    'location': [
+        '.text-body-small.inline.t-black--light.break-words',
+        '.pv-text-details__left-panel .text-body-small',
+        '[data-field="location"]'
+    ],
+    'company': [
+        '.pv-entity__secondary-title',
+        '.experience-item__subtitle',
+        '[data-field="experience"] .pv-entity__secondary-title'
+    ]
+}
+
+# Any of these means the profile has rendered, or that LinkedIn served a sign-in wall instead
+PROFILE_READY_SELECTORS = PROFILE_FIELD_SELECTORS['name'] + [
+    '.authwall-join-form',
+    'form.login__form'
+]
+
+MAX_EMAIL_CANDIDATES = 10
+
+# Runs inside the browser: resolves the whole selector table and scans for emails
+# without shipping the page source back over the WebDriver connection
+EXTRACT_FIELDS_SCRIPT = """
+const table = arguments[0];
+const maxEmails = arguments[1];
+const fields = {};
+const matched = {};
+
+for (const [field, selectors] of Object.entries(table)) {
+    for (const selector of selectors) {
+        let element = null;
+        try {
+            element = document.querySelector(selector);
+        } catch (e) {
+            continue;
+        }
+        const text = element ? (element.innerText || element.textContent || '').trim() : '';
+        if (text) {
+            fields[field] = text;
+            matched[field] = selector;
+            break;
+        }
+    }
+}
+
+const emails = [];
+const seen = new Set();
+const addEmail = (email) => {
+    email = email.trim();
+    if (email && !seen.has(email) && emails.length < maxEmails) {
+        seen.add(email);
+        emails.push(email);
+    }
+};
+
+for (const link of document.querySelectorAll('a[href^="mailto:"]')) {
+    addEmail(decodeURIComponent(link.getAttribute('href').slice(7).split('?')[0]));
+}
+
+const emailPattern = /\\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}\\b/g;
+const html = document.documentElement ? document.documentElement.outerHTML : '';
+for (const match of html.matchAll(emailPattern)) {
+    addEmail(match[0]);
+    if (emails.length >= maxEmails) {
+        break;
+    }
+}
+
+return {fields: fields, matched: matched, emails: emails};
+"""
+
+
+def extract_profile_fields(driver, selector_table=None):
+    """Extract name, title, location, company and email candidates in one execute_script call"""
+    result = driver.execute_script(
+        EXTRACT_FIELDS_SCRIPT,
+        selector_table or PROFILE_FIELD_SELECTORS,
+        MAX_EMAIL_CANDIDATES
+    )
+
+    if not result:
+        return {'fields': {}, 'matched': {}, 'emails': []}
+
+    return {
+        'fields': result.get('fields') or {},
+        'matched': result.get('matched') or {},
+        'emails': result.get('emails') or []
+    }
@@ -0,0 +1,160 @@
+# Request rate scheduling for LeadSprinter
+# One scheduler is shared by every browser worker and HTTP fallback so the combined rate
+# per host stays capped, and a host that pushes back (429/503, captcha) is given room
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from config import Config
+
+# Status codes that mean "slow down" rather than "this request failed"
+BACKOFF_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None"""
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostBucket:
+    """Token bucket plus backoff state for one host"""
+
+    def __init__(self, requests_per_minute, burst):
+        self.base_rate = requests_per_minute / 60.0
+        self.rate = self.base_rate  # Tokens per second, lowered while the host pushes back
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.backoff = 0.0  # Current backoff step; doubles on each consecutive penalty
+
+    def refill(self, now):
+        """Add the tokens earned since the last update"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now):
+        """Claim one request and return when it may start"""
+        self.refill(now)
+
+        start = max(now, self.blocked_until)
+        if self.tokens < 1:
+            start = max(start, now + (1 - self.tokens) / self.rate)
+
+        # The bucket alone spaces requests: up to `burst` back to back, then one per 1/rate seconds
+        self.tokens -= 1
+        return start
+
+
+class RateScheduler:
+    """Shared per-host token buckets that honor Retry-After and back off when a host pushes back"""
+
+    def __init__(self, requests_per_minute=None, burst=None, host_limits=None):
+        self.requests_per_minute = requests_per_minute or Config.HOST_REQUESTS_PER_MINUTE
+        self.burst = burst or Config.HOST_BURST
+        self.host_limits = host_limits if host_limits is not None else Config.HOST_RATE_LIMITS
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.total_waited = 0.0
+
+    def get_host(self, url):
+        """Bucket key for a URL"""
+        try:
+            return urlparse(url).netloc.lower() or url
+        except Exception:
+            return url
+
+    def get_bucket(self, host):
+        """Bucket for a host, created on first use (call with the lock held)"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            requests_per_minute = self.host_limits.get(host, self.requests_per_minute)
+            bucket = HostBucket(requests_per_minute, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, url):
+        """Claim the next request slot for the URL's host and return how long to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            start = self.get_bucket(self.get_host(url)).reserve(now)
+
+        return max(0.0, start - now)
+
+    def wait(self, url, cancel_token=None):
+        """Block until the URL's host has budget for one more request (or the job is cancelled)"""
+        delay = self.reserve(url)
+        if delay > 0:
+            with self._lock:
+                self.total_waited += delay
+            if cancel_token:
+                cancel_token.sleep(delay)
+            else:
+                time.sleep(delay)
+        return delay
+
+    def penalize(self, url, retry_after=None):
+        """Pause a host that rate limited or blocked us and halve its request rate"""
+        retry_after = parse_retry_after(retry_after)
+
+        with self._lock:
+            bucket = self.get_bucket(self.get_host(url))
+            now = time.monotonic()
+
+            if bucket.backoff:
+                bucket.backoff = min(bucket.backoff * 2, Config.RATE_BACKOFF_MAX_SECONDS)
+            else:
+                bucket.backoff = Config.RATE_BACKOFF_BASE_SECONDS
+
+            # The server's own Retry-After wins over our guess
+            pause = retry_after if retry_after is not None else bucket.backoff
+            bucket.blocked_until = max(bucket.blocked_until, now + pause)
+            bucket.rate = max(bucket.base_rate * Config.RATE_MIN_FACTOR, bucket.rate / 2)
+            bucket.tokens = min(bucket.tokens, 0.0)
+
+        print(f"🐢 Backing off {self.get_host(url)} for {pause:.0f}s")
+        return pause
+
+    def record_response(self, url, status_code, retry_after=None):
+        """Feed an HTTP status back into the scheduler"""
+        if status_code in BACKOFF_STATUS_CODES:
+            return self.penalize(url, retry_after)
+
+        self.record_success(url)
+        return 0.0
+
+    def record_success(self, url):
+        """Let a host that answered normally recover toward its configured rate"""
+        with self._lock:
+            bucket = self.get_bucket(self.get_host(url))
+            bucket.backoff = 0.0
+            bucket.rate = min(bucket.base_rate, bucket.rate + bucket.base_rate * Config.RATE_RECOVERY_STEP)
+
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler():
+    """Scheduler shared by the browser scrapers and the HTTP fallbacks"""
+    global _default_scheduler
+
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RateScheduler()
+        return _default_scheduler
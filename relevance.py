@@ -0,0 +1,73 @@
+# Candidate ranking for LeadSprinter
+# Scores each profile URL a search turned up by how well its result title and snippet match
+# the searched job title and location, and how often the job's searches found it, so the
+# page-load budget goes to the best candidates first
+
+import re
+from collections import Counter
+from config import Config
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Words that carry no meaning in a job title or place name
+STOPWORDS = {'a', 'an', 'and', 'at', 'for', 'in', 'of', 'on', 'the', 'to'}
+
+
+def normalize_token(token):
+    """Fold simple plurals, so engineers matches engineer"""
+    return token[:-1] if len(token) > 3 and token.endswith('s') else token
+
+
+def tokenize(text):
+    """Normalized words of a text, without stopwords"""
+    return {normalize_token(token) for token in TOKEN_PATTERN.findall((text or '').lower())} - STOPWORDS
+
+
+def term_coverage(query, text, tokens):
+    """1.0 if the text contains the query as a phrase, else the fraction of its words it contains"""
+    terms = tokenize(query)
+    if not terms:
+        return 0.0
+    if query.lower() in text:
+        return 1.0
+    return len(terms & tokens) / len(terms)
+
+
+def score_candidate(text, job_title, location, sightings):
+    """Relevance between 0 and 1 for one candidate's result text and number of sightings"""
+    text = (text or '').lower()
+    tokens = tokenize(text)
+    score = (
+        Config.RELEVANCE_TITLE_WEIGHT * term_coverage(job_title or '', text, tokens)
+        + Config.RELEVANCE_LOCATION_WEIGHT * term_coverage(location or '', text, tokens)
+        + Config.RELEVANCE_SIGHTINGS_WEIGHT * min(sightings, Config.RELEVANCE_SIGHTINGS_CAP) / Config.RELEVANCE_SIGHTINGS_CAP
+    )
+    return round(score, 3)
+
+
+class CandidateIndex:
+    """What a job's searches showed about each candidate profile: result text and how often it came up"""
+
+    def __init__(self):
+        self.texts = {}  # {url: [title and snippet text from every result that linked to it]}
+        self.sightings = Counter()  # {url: result lists (strategies, engines, cached searches) it appeared in}
+
+    def observe(self, urls):
+        """Count one result list's URLs"""
+        self.sightings.update(set(urls))
+
+    def add_text(self, url, *parts):
+        """Keep a result's title and snippet for scoring"""
+        texts = self.texts.setdefault(url, [])
+        for part in parts:
+            if part and part not in texts:
+                texts.append(part)
+
+    def score(self, url, job_title, location):
+        """Relevance of one candidate to the searched job title and location"""
+        return score_candidate(' '.join(self.texts.get(url, [])), job_title, location, self.sightings[url])
+
+    def rank(self, urls, job_title, location):
+        """(url, score) pairs, best first; ties keep the search engines' order"""
+        scored = [(url, self.score(url, job_title, location)) for url in urls]
+        return sorted(scored, key=lambda pair: -pair[1])
@@ -2,94 +2,138 @@
 # Uses Selenium to scrape LinkedIn profiles
 
 import time
-import random
+import threading
 import pandas as pd
-from selenium import webdriver
 from alternative_scraper import AlternativeLinkedInScraper
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 import re
 import os
+from datetime import datetime
 from urllib.parse import quote
+from config import Config
+from utils import rewrite_url
+from driver_pool import get_default_pool
+from rate_limit import get_default_scheduler
+from cancellation import CancellationToken, run_abortable
+from profile_extractor import extract_profile_fields, PROFILE_READY_SELECTORS
+from page_ready import ReadinessDetector, SERP_READY_SELECTORS, SERP_RESULT_SELECTORS
+from page_snapshot import PageSnapshot
+from url_extractor import extract_profile_urls
+from page_classifier import classify_snapshot, PageClassification, OK, CONSENT, EMPTY
+from search_results import SearchResultsMixin
+from relevance import CandidateIndex
+from cache import ProfileCache, SearchCache
+from dedup import SeenIndex
+from pipeline import ScrapePipeline
+from journal import JobJournal, get_default_journal_path
+from timing import StageTimer, timed
+from metrics import get_metrics
+from resource_filter import ResourceFilter, PageResourceStats
 
-class LinkedInScraper:
-    def __init__(self):
+class LinkedInScraper(SearchResultsMixin):
+    def __init__(self, pool=None, rate_scheduler=None, profile_cache=None, search_cache=None, cancel_token=None,
+                 timer=None):
+        self.pool = pool or get_default_pool()
+        self.rate_scheduler = rate_scheduler or get_default_scheduler()
+        self.lease = None
         self.driver = None
-        self.wait = None
-        self.stop_requested = False
+        self.cancel_token = cancel_token or CancellationToken()
+        self.timer = timer or StageTimer()
+        self.timing_report = None
+        self.workers = []
+        self.workers_lock = threading.Lock()
+        self.profile_readiness = ReadinessDetector(PROFILE_READY_SELECTORS)
+        self.serp_readiness = ReadinessDetector(SERP_READY_SELECTORS)
+        self.results_readiness = ReadinessDetector(SERP_RESULT_SELECTORS)
+        self.last_readiness = None
+        self.last_page_class = None
+        self.navigation_timings = []
+        self.snapshot = None
+        self.profile_cache = profile_cache
+        self.search_cache = search_cache
+        self.seen_index = None  # Profiles this job has claimed, plus those skipped from earlier runs
+        self.completed_index = None  # Profiles whose records made it into a job's results, persisted between runs
+        self.journal = None
+        self.serp_records = None  # {url: lead record from the SERP}, only in SERP-only mode
+        self.candidates = None  # Result text and sightings per found profile, for ranking
+        self.resource_filter = ResourceFilter()
+        self.resource_totals = PageResourceStats()
         self.results_df = pd.DataFrame(columns=['name', 'title', 'company', 'location', 'linkedin_url', 'email'])
         
     def setup_driver(self):
-        """Setup Chrome driver with optimal settings"""
-        chrome_options = Options()
-        
-        # ALWAYS run headless to avoid opening browser windows
-        chrome_options.add_argument('--headless=new')  # Use new headless mode
-        
-        # Performance optimizations
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-images')  # Faster loading
-        chrome_options.add_argument('--disable-notifications')
-        chrome_options.add_argument('--disable-popup-blocking')
-        
-        # Anti-detection measures
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Fix for dev container/codespace issues
-        chrome_options.add_argument('--disable-web-security')
-        chrome_options.add_argument('--allow-running-insecure-content')
-        chrome_options.add_argument('--disable-features=VizDisplayCompositor')
-        
-        # User agent to appear more human
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        """Borrow a warm Chrome driver from the pool"""
+        if self.lease:
+            return True
         
-        # Use unique user data directory to avoid conflicts
-        import tempfile
-        user_data_dir = tempfile.mkdtemp()
-        chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
+        self.lease = self.pool.checkout()
+        self.driver = self.lease.driver
+        return True
+    
+    def navigate(self, url, readiness=None):
+        """Load a page in the borrowed driver, optionally wait for its content, and record the latency"""
+        # Every worker draws from the same per-host budget before loading a page
+        with self.timer.span('rate_wait'):
+            self.rate_scheduler.wait(url, self.cancel_token)
+        self.invalidate_snapshot()
         
-        # User agent to appear more legitimate
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+        # Flush late network events from the previous page into the running totals
+        self.collect_resource_stats()
         
-        # Window size
-        chrome_options.add_argument('--window-size=1920,1080')
+        start = time.monotonic()
+        # A stop request abandons the load instead of waiting for Chrome to finish it
+        with self.timer.span('page_load'):
+            run_abortable(self.driver.get, self.cancel_token, rewrite_url(url))
+        load_seconds = time.monotonic() - start
+        if self.lease:
+            self.lease.record_page()
         
-        # Optional: Run headless (uncomment for background operation)
-        # chrome_options.add_argument('--headless')
+        ready = None
+        if readiness:
+            with self.timer.span('content_wait'):
+                ready = readiness.wait(self.driver, cancel_token=self.cancel_token)
         
-        try:
-            # Try using webdriver-manager for automatic driver management
-            from webdriver_manager.chrome import ChromeDriverManager
-            from selenium.webdriver.chrome.service import Service
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 10)
-            return True
-            
-        except Exception as e1:
-            try:
-                # Fallback: try with system ChromeDriver
-                self.driver = webdriver.Chrome(options=chrome_options)
-                self.wait = WebDriverWait(self.driver, 10)
-                return True
-            except Exception as e2:
-                raise Exception(f"Failed to setup Chrome driver: {str(e1)}. Fallback also failed: {str(e2)}")
+        self.navigation_timings.append({
+            'url': url,
+            'page_load_strategy': Config.PAGE_LOAD_STRATEGY,
+            'load_seconds': load_seconds,
+            'ready_seconds': ready.elapsed if ready is not None else 0.0,
+            'ready_selector': ready.fired if ready is not None else None,
+            'total_seconds': time.monotonic() - start
+        })
+        return ready
+    
+    def get_navigation_summary(self):
+        """Average navigation latency, to compare page-load strategies"""
+        if not self.navigation_timings:
+            return "no navigations"
         
-        return False
+        count = len(self.navigation_timings)
+        load = sum(timing['load_seconds'] for timing in self.navigation_timings) / count
+        total = sum(timing['total_seconds'] for timing in self.navigation_timings) / count
+        return (f"{count} navigations ({Config.PAGE_LOAD_STRATEGY}): "
+                f"avg {load:.2f}s load, {total:.2f}s until content ready")
+    
+    def collect_resource_stats(self):
+        """Requests and bytes loaded or blocked since the last call"""
+        stats = self.resource_filter.collect_page_stats(self.driver)
+        self.resource_totals.merge(stats)
+        return stats
+    
+    def get_snapshot(self):
+        """Page source for the current navigation, fetched at most once"""
+        if self.snapshot is None:
+            self.snapshot = PageSnapshot.from_driver(self.driver)
+        return self.snapshot
     
-    def random_delay(self, min_seconds=1, max_seconds=3):
-        """Add random delay to avoid detection"""
-        if not self.stop_requested:
-            time.sleep(random.uniform(min_seconds, max_seconds))
+    def invalidate_snapshot(self):
+        """Forget the cached page source after the page changes"""
+        self.snapshot = None
+        self.last_page_class = None
+    
+    @property
+    def stop_requested(self):
+        return self.cancel_token.is_cancelled
     
     def extract_email_from_text(self, text):
         """Extract email from text using regex"""
@@ -97,6 +141,7 @@ class LinkedInScraper:
         emails = re.findall(email_pattern, text)
         return emails[0] if emails else None
     
+    @timed('serp_extract')
     def extract_linkedin_urls(self):
         """Extract LinkedIn profile URLs from current Google search results page"""
         profile_links = []
@@ -104,56 +149,17 @@ class LinkedInScraper:
         try:
             print("🔍 Extracting LinkedIn URLs from search results...")
             
-            # Multiple selectors to find LinkedIn profile links
-            selectors = [
-                'div.g h3 a[href*="linkedin.com/in/"]',  # Standard search results
-                'a[href*="linkedin.com/in/"]',  # Any LinkedIn profile links
-                'div[data-ved] a[href*="linkedin.com/in/"]',  # Results with data-ved
-                '.g a[href*="linkedin.com/in/"]',  # General result container links
-                '[data-ved] a[href*="linkedin.com/in/"]'  # Any element with data-ved
-            ]
-            
-            for i, selector in enumerate(selectors):
-                try:
-                    links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    print(f"  Selector {i+1} '{selector}': found {len(links)} links")
-                    
-                    for link in links:
-                        href = link.get_attribute('href')
-                        if href and 'linkedin.com/in/' in href:
-                            # Clean Google tracking URLs
-                            clean_url = self.clean_google_url(href)
-                            if clean_url and clean_url not in profile_links:
-                                profile_links.append(clean_url)
-                                print(f"    ✅ Added: {clean_url}")
-                except Exception as e:
-                    print(f"  ❌ Selector {i+1} failed: {str(e)}")
-                    continue
-            
-            # Try finding URLs in page source as backup
-            if not profile_links:
-                print("🔍 No URLs found with selectors, trying regex on page source...")
-                try:
-                    page_source = self.driver.page_source
-                    import re
-                    # Look for LinkedIn URLs in the raw HTML
-                    linkedin_pattern = r'https://[^"\'>\s]*linkedin\.com/in/[^"\'>\s/]+'
-                    matches = re.findall(linkedin_pattern, page_source)
-                    print(f"  Regex found {len(matches)} potential URLs")
-                    
-                    for match in matches:
-                        clean_url = self.clean_google_url(match)
-                        if clean_url and clean_url not in profile_links:
-                            profile_links.append(clean_url)
-                            print(f"    ✅ Added from regex: {clean_url}")
-                except Exception as e:
-                    print(f"  ❌ Regex extraction failed: {str(e)}")
+            # One pass over the page source we already hold, instead of a WebDriver
+            # round trip per selector and per link; results keep their ranking order
+            profile_links = extract_profile_urls(self.get_snapshot().html)
+            for url in profile_links:
+                print(f"    ✅ Added: {url}")
             
             # Debug: show part of page source if no results
             if not profile_links:
                 print("⚠️ No LinkedIn URLs found. Checking page content...")
                 try:
-                    page_text = self.driver.page_source.lower()[:2000]
+                    page_text = self.get_snapshot().head
                     if 'linkedin' in page_text:
                         print("  ✅ Page contains 'linkedin' text")
                     else:
@@ -174,79 +180,43 @@ class LinkedInScraper:
             print(f"❌ Error extracting URLs: {str(e)}")
         
         print(f"🎯 Total LinkedIn URLs extracted: {len(profile_links)}")
-        return list(set(profile_links))  # Remove duplicates
+        return profile_links  # Already unique, in result order
     
-    def clean_google_url(self, url):
-        """Clean Google tracking from URLs"""
+    @timed('block_check')
+    def classify_current_page(self, snapshot=None):
+        """Classify the loaded page as ok, consent, blocked or empty in one scan (once per snapshot)"""
+        if snapshot is None and self.last_page_class is not None:
+            return self.last_page_class
         try:
-            if not url or 'linkedin.com/in/' not in url:
-                return None
-                
-            # Handle Google redirect URLs
-            if 'google.com/url?q=' in url:
-                # Extract the actual URL from Google's redirect
-                import urllib.parse
-                parsed = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
-                if 'q' in parsed:
-                    actual_url = parsed['q'][0]
-                    if 'linkedin.com/in/' in actual_url:
-                        return actual_url.split('&')[0]  # Remove tracking parameters
-            
-            # Clean direct LinkedIn URLs
-            if url.startswith('https://linkedin.com') or url.startswith('https://www.linkedin.com'):
-                return url.split('?')[0]  # Remove query parameters
-                
-            return None
-        except:
-            return None
+            self.last_page_class = classify_snapshot(snapshot or self.get_snapshot())
+        except Exception as e:
+            print(f"Error classifying page: {str(e)}")
+            self.last_page_class = PageClassification(OK)
+        return self.last_page_class
 
-    def detect_captcha_or_blocking(self):
+    def detect_captcha_or_blocking(self, snapshot=None):
         """Enhanced detection of anti-bot measures"""
-        try:
-            page_source = self.driver.page_source.lower()
-            current_url = self.driver.current_url.lower()
-            
-            # Check for various blocking indicators
-            blocking_indicators = [
-                'captcha', 'unusual traffic', 'detected unusual', 
-                'verify you are human', 'suspicious requests',
-                'automated queries', 'robot', 'unusual requests',
-                'please confirm', 'verify that you', 'prove you\'re human'
-            ]
-            
-            url_indicators = [
-                'captcha', 'blocked', 'denied', 'robot'
-            ]
-            
-            # Check page content
-            if any(indicator in page_source for indicator in blocking_indicators):
-                return True
-                
-            # Check URL
-            if any(indicator in current_url for indicator in url_indicators):
-                return True
-                
-            # Check for absence of search results (might indicate blocking)
-            if 'did not match any documents' in page_source:
-                return False  # This is a legitimate "no results" message
-            
-            # Check if we're on an error page
-            if '403' in page_source or '429' in page_source:
-                return True
-                
-            return False
-            
-        except Exception as e:
-            print(f"Error detecting blocking: {str(e)}")
-            return False
+        page = self.classify_current_page(snapshot)
+        if page.is_blocked:
+            print(f"🚫 Block evidence: {page.describe()}")
+        return page.is_blocked
 
+    @timed('duckduckgo_fallback')
     def scrape_duckduckgo_search_results(self, search_query, max_results=20):
         """Alternative search using DuckDuckGo with requests (bypasses Selenium blocking)"""
         try:
             print(f"🦆 Using DuckDuckGo alternative scraper for: {search_query}")
             
             # Use the alternative scraper for DuckDuckGo
-            alt_scraper = AlternativeLinkedInScraper()
+            alt_scraper = AlternativeLinkedInScraper(
+                search_cache=self.search_cache,
+                seen_index=self.seen_index,
+                rate_scheduler=self.rate_scheduler,
+                cancel_token=self.cancel_token,
+                timer=self.timer,
+                serp_records=self.serp_records,
+                candidates=self.candidates
+            )
             profiles = alt_scraper.search_duckduckgo_for_linkedin(search_query, max_results)
             
             if profiles:
@@ -260,41 +230,12 @@ class LinkedInScraper:
             print(f"❌ DuckDuckGo alternative search failed: {str(e)}")
             return []
 
-    def clean_search_url(self, url):
-        """Clean URLs from search engines"""
-        try:
-            if not url or 'linkedin.com/in/' not in url:
-                return None
-                
-            # Handle various redirect patterns
-            if 'duckduckgo.com' in url and 'uddg=' in url:
-                # DuckDuckGo redirect
-                import urllib.parse
-                parsed = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
-                if 'uddg' in parsed:
-                    return parsed['uddg'][0]
-            
-            if 'google.com/url?q=' in url:
-                # Google redirect
-                import urllib.parse
-                parsed = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
-                if 'q' in parsed:
-                    actual_url = parsed['q'][0]
-                    if 'linkedin.com/in/' in actual_url:
-                        return actual_url.split('&')[0]
-            
-            # Direct LinkedIn URL
-            if url.startswith('https://linkedin.com') or url.startswith('https://www.linkedin.com'):
-                return url.split('?')[0]
-                
-            return None
-        except:
-            return None
-
+    @timed('google_search')
     def scrape_google_search_results(self, search_query, max_results):
         """Enhanced Google search for LinkedIn profiles with multiple strategies"""
         try:
             profile_links = []
+            found = SeenIndex()
             
             # Multiple search strategies for better results
             search_strategies = [
@@ -307,14 +248,14 @@ class LinkedInScraper:
             ]
             
             for i, search_terms in enumerate(search_strategies):
-                if len(profile_links) >= max_results:
+                if len(profile_links) >= max_results or self.stop_requested:
                     break
                     
                 print(f"🔍 Strategy {i+1}: {search_terms}")
                 
                 try:
                     # Build search URL with Irish locale
-                    base_url = "https://www.google.com/search"
+                    base_url = Config.GOOGLE_SEARCH_URL
                     params = {
                         'q': search_terms,
                         'num': '20',
@@ -322,6 +263,14 @@ class LinkedInScraper:
                         'gl': 'ie',  # Ireland
                         'start': '0'
                     }
+                    locale = f"{params['hl']}-{params['gl']}"
+                    
+                    # Reuse the result list from an identical earlier search
+                    cached_urls = self.get_cached_search('google', search_terms, locale)
+                    if cached_urls is not None:
+                        self.collect_new_urls(cached_urls, profile_links, found, max_results)
+                        print(f"💾 Found {len(cached_urls)} cached profiles (total: {len(profile_links)})")
+                        continue
                     
                     # Manual URL building to avoid encoding issues
                     query_parts = []
@@ -331,66 +280,78 @@ class LinkedInScraper:
                     
                     url = f"{base_url}?{'&'.join(query_parts)}"
                     
-                    self.driver.get(url)
-                    self.random_delay(2, 4)
+                    # Wait for results (or a consent/captcha page) rather than a fixed delay
+                    ready = self.navigate(url, self.serp_readiness)
+                    if not ready:
+                        print(f"⚠️ Search results did not appear within {self.serp_readiness.timeout}s")
                     
-                    print(f"📍 Current URL: {self.driver.current_url}")
+                    current_url = self.driver.current_url
+                    print(f"📍 Current URL: {current_url}")
                     print(f"📄 Page title: {self.driver.title}")
                     
                     # Handle consent/cookie pages
-                    if 'consent.google' in self.driver.current_url:
+                    if self.classify_current_page().status == CONSENT:
                         print("📝 Handling consent page...")
-                        try:
-                            # Try different consent button selectors
-                            consent_buttons = [
-                                'button[aria-label*="Accept"]',
-                                'button[aria-label*="I agree"]', 
-                                'form[action*="consent"] button',
-                                '#L2AGLb',  # Common Google consent button ID
-                                'button:contains("I agree")'
-                            ]
+                        with self.timer.span('consent'):
+                            try:
+                                # Try different consent button selectors
+                                consent_buttons = [
+                                    'button[aria-label*="Accept"]',
+                                    'button[aria-label*="I agree"]', 
+                                    'form[action*="consent"] button',
+                                    '#L2AGLb',  # Common Google consent button ID
+                                    'button:contains("I agree")'
+                                ]
                             
-                            for selector in consent_buttons:
-                                try:
-                                    buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                                    if buttons:
-                                        buttons[0].click()
-                                        self.random_delay(2, 3)
-                                        break
-                                except:
-                                    continue
-                        except:
-                            pass
+                                for selector in consent_buttons:
+                                    try:
+                                        buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                                        if buttons:
+                                            buttons[0].click()
+                                            self.invalidate_snapshot()
+                                            self.results_readiness.wait(self.driver, cancel_token=self.cancel_token)
+                                            break
+                                    except:
+                                        continue
+                            except:
+                                pass
                     
                     # Check for blocking
                     if self.detect_captcha_or_blocking():
                         print("⚠️ Anti-bot measures detected, trying next strategy...")
-                        self.random_delay(5, 8)
+                        get_metrics().increment('block_detections_total', engine='google')
+                        self.rate_scheduler.penalize(url)
                         continue
                     
+                    get_metrics().increment('serps_fetched_total', engine='google')
+                    
                     # Extract URLs from current page
                     batch_urls = self.extract_linkedin_urls()
+                    results = self.parse_serp_results('google', self.get_snapshot())
+                    # A genuine "no results" page is cached too, so a repeat job skips it; an unexplained
+                    # empty page may be a soft block and is searched again next time
+                    if batch_urls or self.last_page_class.status == EMPTY:
+                        self.cache_search('google', search_terms, locale, batch_urls, results)
                     
                     # Add unique URLs
-                    for url in batch_urls:
-                        if url not in profile_links and len(profile_links) < max_results:
-                            profile_links.append(url)
+                    self.collect_new_urls(batch_urls, profile_links, found, max_results)
                     
                     print(f"✅ Found {len(batch_urls)} profiles (total: {len(profile_links)})")
                     
-                    if batch_urls:
-                        self.random_delay(2, 4)  # Success - moderate delay
+                    # An unexplained empty page is often a soft block, so give Google more room before
+                    # the next query; a genuine "no results" page is not held against it
+                    if batch_urls or self.last_page_class.status == EMPTY:
+                        self.rate_scheduler.record_success(url)
                     else:
-                        self.random_delay(3, 6)  # No results - longer delay
+                        self.rate_scheduler.penalize(url)
                         
                 except Exception as e:
                     print(f"❌ Strategy {i+1} failed: {str(e)}")
-                    self.random_delay(2, 4)
                     continue
             
             if profile_links:
                 print(f"🎯 SUCCESS: Found {len(profile_links)} LinkedIn profiles!")
-            else:
+            elif not self.stop_requested:
                 print("⚠️ No LinkedIn profiles found with any search strategy")
                 print("This could be due to:")
                 print("  - No matching profiles exist")
@@ -400,7 +361,15 @@ class LinkedInScraper:
                 # Try alternative scraper as fallback
                 print("\n🔄 Trying alternative scraping methods...")
                 try:
-                    alt_scraper = AlternativeLinkedInScraper()
+                    alt_scraper = AlternativeLinkedInScraper(
+                        search_cache=self.search_cache,
+                        seen_index=self.seen_index,
+                        rate_scheduler=self.rate_scheduler,
+                        cancel_token=self.cancel_token,
+                        timer=self.timer,
+                        serp_records=self.serp_records,
+                        candidates=self.candidates
+                    )
                     alt_profiles = alt_scraper.scrape_linkedin_profiles(search_query, max_results)
                     
                     if alt_profiles:
@@ -418,11 +387,14 @@ class LinkedInScraper:
             print(f"❌ Google search failed: {str(e)}")
             return []
     
+    @timed('profile')
     def scrape_profile_info(self, profile_url):
         """Extract information from a LinkedIn profile URL"""
         try:
-            self.driver.get(profile_url)
-            self.random_delay(2, 4)
+            # One bounded wait for whichever profile selector shows up first
+            self.last_readiness = self.navigate(profile_url, self.profile_readiness)
+            if not self.last_readiness:
+                print(f"⚠️  Profile content did not appear within {self.profile_readiness.timeout}s")
             
             profile_data = {
                 'name': 'N/A',
@@ -433,205 +405,224 @@ class LinkedInScraper:
                 'email': None
             }
             
-            # Try to extract name
+            # Resolve every field selector and email candidate in one round trip
             try:
-                name_selectors = [
-                    'h1.text-heading-xlarge',
-                    '.pv-text-details__left-panel h1',
-                    '.profile-photo-edit__preview'
-                ]
+                with self.timer.span('profile_extract'):
+                    extracted = extract_profile_fields(self.driver)
                 
-                for selector in name_selectors:
-                    try:
-                        name_element = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                        if name_element and name_element.text.strip():
-                            profile_data['name'] = name_element.text.strip()
-                            break
-                    except:
-                        continue
-                        
+                for field in ('name', 'title', 'location', 'company'):
+                    value = extracted['fields'].get(field)
+                    if value:
+                        profile_data[field] = value
+                
+                email = self.extract_email_from_text(' '.join(extracted['emails']))
+                if email:
+                    profile_data['email'] = email
+                    
             except Exception as e:
-                print(f"Could not extract name: {str(e)}")
+                print(f"Could not extract profile fields: {str(e)}")
+            
+            if self.resource_filter.enabled:
+                print(f"📉 Page resources: {self.collect_resource_stats()}")
             
-            # Try to extract title
+            return profile_data
+            
+        except Exception as e:
+            print(f"Error scraping profile {profile_url}: {str(e)}")
+            return None
+    
+    def create_worker(self):
+        """Child scraper for an extraction worker: shares the pool, rate budget and cancellation token"""
+        worker = LinkedInScraper(
+            pool=self.pool,
+            rate_scheduler=self.rate_scheduler,
+            cancel_token=self.cancel_token,
+            timer=self.timer
+        )
+        with self.workers_lock:
+            self.workers.append(worker)
+        return worker
+    
+    def release_worker(self, worker):
+        """Return a worker's driver to the pool"""
+        self.resource_totals.merge(worker.resource_totals)
+        self.navigation_timings.extend(worker.navigation_timings)
+        worker.cleanup()
+        with self.workers_lock:
+            if worker in self.workers:
+                self.workers.remove(worker)
+    
+    def open_profile_cache(self):
+        """Open the on-disk profile cache unless it is disabled"""
+        if self.profile_cache is None and Config.PROFILE_CACHE_ENABLED:
             try:
-                title_selectors = [
-                    '.text-body-medium.break-words',
-                    '.pv-text-details__left-panel .text-body-medium',
-                    '.profile-photo-edit__preview + div'
-                ]
-                
-                for selector in title_selectors:
-                    try:
-                        title_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if title_element and title_element.text.strip():
-                            profile_data['title'] = title_element.text.strip()
-                            break
-                    except:
-                        continue
-                        
+                self.profile_cache = ProfileCache()
+                self.profile_cache.evict()
             except Exception as e:
-                print(f"Could not extract title: {str(e)}")
-            
-            # Try to extract location
+                print(f"⚠️  Profile cache unavailable: {str(e)}")
+        return self.profile_cache
+    
+    def store_in_cache(self, profile_data):
+        """Cache a freshly extracted profile (search context is added per job, so it is not stored)"""
+        if self.profile_cache is None or profile_data.get('name', 'N/A') == 'N/A':
+            return
+        
+        record = {
+            key: profile_data.get(key)
+            for key in ('name', 'title', 'company', 'location', 'linkedin_url', 'email')
+        }
+        try:
+            self.profile_cache.put(profile_data['linkedin_url'], record)
+        except Exception as e:
+            print(f"⚠️  Could not cache {profile_data['linkedin_url']}: {str(e)}")
+    
+    def open_search_cache(self, mode=None):
+        """Open the on-disk search result cache in 'use', 'refresh' or 'bypass' mode"""
+        mode = mode or Config.SEARCH_CACHE_MODE
+        if self.search_cache is None:
             try:
-                location_selectors = [
-                    '.text-body-small.inline.t-black--light.break-words',
-                    '.pv-text-details__left-panel .text-body-small',
-                    '[data-field="location"]'
-                ]
-                
-                for selector in location_selectors:
-                    try:
-                        location_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if location_element and location_element.text.strip():
-                            profile_data['location'] = location_element.text.strip()
-                            break
-                    except:
-                        continue
-                        
+                self.search_cache = SearchCache(mode=mode)
+                self.search_cache.evict()
             except Exception as e:
-                print(f"Could not extract location: {str(e)}")
-            
-            # Try to extract company from experience section
+                print(f"⚠️  Search cache unavailable: {str(e)}")
+        else:
+            self.search_cache.mode = mode
+        return self.search_cache
+    
+    def get_cache_status(self):
+        """Cache hit rate suffix for progress messages"""
+        if self.profile_cache is None:
+            return ""
+        lookups = self.profile_cache.hits + self.profile_cache.misses
+        if not lookups:
+            return ""
+        return f" (cache hits: {self.profile_cache.hits}/{lookups}, {self.profile_cache.get_hit_rate():.0%})"
+    
+    def build_seen_index(self, search_params):
+        """Dedup index for a job, seeded with profiles from earlier runs so they are never reloaded"""
+        seen_index = SeenIndex()
+        
+        for export_path in search_params.get('seen_exports') or []:
             try:
-                company_selectors = [
-                    '.pv-entity__secondary-title',
-                    '.experience-item__subtitle',
-                    '[data-field="experience"] .pv-entity__secondary-title'
-                ]
-                
-                for selector in company_selectors:
-                    try:
-                        company_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if company_element and company_element.text.strip():
-                            profile_data['company'] = company_element.text.strip()
-                            break
-                    except:
-                        continue
-                        
+                added = seen_index.seed_from_export(export_path)
+                print(f"📋 Skipping {added} profiles already in {export_path}")
             except Exception as e:
-                print(f"Could not extract company: {str(e)}")
-            
-            # Try to find email in contact info or about section
+                print(f"⚠️  Could not read previous export {export_path}: {str(e)}")
+        
+        index_path = search_params.get('seen_index_path')
+        if index_path:
             try:
-                page_text = self.driver.page_source
-                email = self.extract_email_from_text(page_text)
-                if email:
-                    profile_data['email'] = email
+                added = seen_index.load(index_path)
+                print(f"📋 Skipping {added} profiles seen in earlier runs")
             except Exception as e:
-                print(f"Could not extract email: {str(e)}")
-            
-            return profile_data
-            
+                print(f"⚠️  Could not load seen-profile index {index_path}: {str(e)}")
+        
+        return seen_index
+    
+    def open_completed_index(self, search_params):
+        """Index saved to seen_index_path: earlier runs' profiles plus the ones this job completes"""
+        index_path = search_params.get('seen_index_path')
+        if not index_path:
+            return None
+        
+        completed_index = SeenIndex()
+        try:
+            completed_index.load(index_path)
         except Exception as e:
-            print(f"Error scraping profile {profile_url}: {str(e)}")
+            print(f"⚠️  Could not load seen-profile index {index_path}: {str(e)}")
+        return completed_index
+    
+    def open_journal(self, search_params):
+        """Journal for this job - resumes it if the journal file already exists"""
+        journal_path = search_params.get('journal_path')
+        if not journal_path and not Config.JOURNAL_ENABLED:
             return None
+        
+        try:
+            journal_path = journal_path or get_default_journal_path(search_params)
+            journal = JobJournal(journal_path, dict(search_params, journal_path=journal_path))
+        except Exception as e:
+            print(f"⚠️  Job journal unavailable: {str(e)}")
+            return None
+        
+        if journal.is_resumed:
+            print(f"📒 Resuming job from {journal_path}: {len(journal.records)} profiles, "
+                  f"{len(journal.completed_queries)} searches already done")
+            # Profiles found before the interruption are re-queued from the journal, not searched again
+            self.seen_index.filter_new(journal.queued, mark=True)
+        else:
+            print(f"📒 Job journal: {journal_path}")
+        return journal
     
-    def scrape_profiles(self, search_params, progress_callback=None):
-        """Main scraping function"""
+    def resume(self, journal_path, progress_callback=None):
+        """Continue an interrupted job from its journal, skipping searches and profiles already done"""
+        search_params = JobJournal.read_params(journal_path)
+        search_params['journal_path'] = journal_path
+        return self.scrape_profiles(search_params, progress_callback)
+    
+    def iter_profiles(self, search_params, progress_callback=None):
+        """Yield each profile record as soon as it is extracted"""
+        self.timer = StageTimer()
+        self.timing_report = None
+        
         try:
             if not self.setup_driver():
                 raise Exception("Failed to setup web driver")
             
-            all_results = []
+            if search_params.get('use_profile_cache', True):
+                self.open_profile_cache()
+            self.open_search_cache(search_params.get('search_cache'))
+            self.seen_index = self.build_seen_index(search_params)
+            self.completed_index = self.open_completed_index(search_params)
+            self.journal = self.open_journal(search_params)
+            self.serp_records = {} if search_params.get('serp_only', Config.SERP_ONLY_MODE) else None
+            ranking = search_params.get('rank_candidates', Config.RELEVANCE_RANKING_ENABLED)
+            self.candidates = CandidateIndex() if ranking else None
+            
+            # Searching and extraction overlap: SERPs for the next query are fetched
+            # while workers extract the profiles already found
+            pipeline = ScrapePipeline(self, search_params, progress_callback, self.journal)
+            yield from pipeline.iter_results()
+            
+            if self.resource_filter.enabled:
+                print(f"📉 Resource blocking totals: {self.resource_totals}")
+            print(f"⏱️ Navigation latency: {self.get_navigation_summary()}")
+        
+        finally:
+            # Only completed profiles are saved; ones merely queued or failed stay eligible for later runs
+            if self.completed_index is not None:
+                try:
+                    self.completed_index.save(search_params['seen_index_path'])
+                except Exception as e:
+                    print(f"⚠️  Could not save seen-profile index: {str(e)}")
+            if self.journal:
+                self.journal.close()
+                self.journal = None
+            self.cleanup()
+            self.finish_timing_report(search_params)
+    
+    def finish_timing_report(self, search_params):
+        """Build the job's per-stage timing report, print it and save it next to the other job files"""
+        try:
+            self.timing_report = self.timer.get_report()
+            print(f"⏱️ Stage timings:\n{self.timer.format_report(self.timing_report)}")
+            
+            report_path = search_params.get('timing_report_path')
+            if not report_path and Config.TIMING_REPORTS_ENABLED:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                job_title = search_params['job_titles'][0].replace(' ', '_') if search_params.get('job_titles') else 'job'
+                report_path = os.path.join(Config.REPORTS_DIR, f"timing_{job_title}_{timestamp}.json")
+            if report_path:
+                self.timer.save_report(report_path, self.timing_report)
+                print(f"⏱️ Timing report saved to {report_path}")
+        except Exception as e:
+            print(f"⚠️  Could not build timing report: {str(e)}")
+    
+    def scrape_profiles(self, search_params, progress_callback=None):
+        """Main scraping function"""
+        try:
             total_requested = search_params['num_results']
-            current_count = 0
-            
-            # Process each job title and location combination
-            for job_title in search_params['job_titles']:
-                for location in search_params['locations']:
-                    if self.stop_requested:
-                        break
-                    
-                    # Create more effective search queries
-                    search_variants = [
-                        f"{job_title} {location}",
-                        f"{job_title} in {location}", 
-                        f"{job_title} {location} Ireland" if 'galway' in location.lower() else f"{job_title} {location}"
-                    ]
-                    
-                    for search_query in search_variants:
-                        if current_count >= total_requested or self.stop_requested:
-                            break
-                            
-                        if progress_callback:
-                            progress_callback(current_count, total_requested, 
-                                            f"Searching: {search_query}")
-                        
-                        # Get profile URLs from Google search
-                        try:
-                            remaining_needed = total_requested - current_count
-                            profile_urls = self.scrape_google_search_results(
-                                search_query, 
-                                min(20, remaining_needed)
-                            )
-                            
-                            # If Google returns no results, try DuckDuckGo as fallback
-                            if not profile_urls:
-                                print(f"🔄 Google found nothing for '{search_query}', trying DuckDuckGo...")
-                                profile_urls = self.scrape_duckduckgo_search_results(
-                                    search_query,
-                                    min(15, remaining_needed)
-                                )
-                            
-                            if not profile_urls:
-                                print(f"❌ No profiles found for '{search_query}' with any search engine")
-                                continue
-                            
-                            print(f"🔍 Processing {len(profile_urls)} profiles from '{search_query}'")
-                            
-                            # Process each profile URL
-                            for i, profile_url in enumerate(profile_urls):
-                                if current_count >= total_requested or self.stop_requested:
-                                    break
-                                
-                                if progress_callback:
-                                    progress_callback(current_count, total_requested, 
-                                                    f"Extracting profile {i+1}/{len(profile_urls)}")
-                                
-                                # Skip if we already have this profile
-                                if any(result.get('linkedin_url') == profile_url for result in all_results):
-                                    continue
-                                
-                                try:
-                                    profile_data = self.scrape_profile_info(profile_url)
-                                    if profile_data:
-                                        # Add search context
-                                        profile_data['search_query'] = search_query
-                                        profile_data['job_title_searched'] = job_title
-                                        profile_data['location_searched'] = location
-                                        
-                                        all_results.append(profile_data)
-                                        current_count += 1
-                                        
-                                        print(f"✅ Profile {current_count}: {profile_data.get('name', 'Unknown')} - {profile_data.get('title', 'No title')}")
-                                    else:
-                                        print(f"⚠️  Could not extract data from {profile_url}")
-                                        
-                                except Exception as e:
-                                    print(f"❌ Error processing {profile_url}: {str(e)}")
-                                    continue
-                                
-                                # Small delay between profile scraping
-                                if not self.stop_requested:
-                                    self.random_delay(1, 3)
-                            
-                            # If we found profiles with this variant, don't try other variants for this job/location combo
-                            if profile_urls:
-                                break
-                                
-                        except Exception as e:
-                            print(f"❌ Search failed for '{search_query}': {str(e)}")
-                            continue
-                    
-                    # Break out of location loop if we have enough results
-                    if current_count >= total_requested:
-                        break
-                
-                # Break out of job title loop if we have enough results  
-                if current_count >= total_requested:
-                    break
+            all_results = list(self.iter_profiles(search_params, progress_callback))
             
             # Convert results to DataFrame
             if all_results:
@@ -640,9 +631,12 @@ class LinkedInScraper:
                 # Remove duplicates based on LinkedIn URL
                 self.results_df = self.results_df.drop_duplicates(subset=['linkedin_url'], keep='first')
                 
+                # Keep the timing report with the results it describes
+                self.results_df.attrs['timing_report'] = self.timing_report
+                
                 if progress_callback:
                     progress_callback(len(self.results_df), total_requested, 
-                                    f"Completed! Found {len(self.results_df)} unique profiles")
+                                    f"Completed! Found {len(self.results_df)} unique profiles{self.get_cache_status()}")
             else:
                 if progress_callback:
                     progress_callback(0, total_requested, "No profiles found")
@@ -653,22 +647,21 @@ class LinkedInScraper:
             if progress_callback:
                 progress_callback(0, 0, f"Error: {str(e)}")
             raise Exception(f"Scraping failed: {str(e)}")
-        
-        finally:
-            self.cleanup()
     
     def stop_scraping(self):
-        """Stop the scraping process"""
-        self.stop_requested = True
+        """Stop the scraping process - wakes every worker blocked in a sleep, page wait or request"""
+        self.cancel_token.cancel()
     
     def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
-            self.driver = None
+        """Return the borrowed driver to the pool"""
+        if self.lease:
+            if self.stop_requested:
+                # The driver may still be finishing an abandoned page load; hand it back in the background
+                threading.Thread(target=self.pool.checkin, args=(self.lease,), daemon=True).start()
+            else:
+                self.pool.checkin(self.lease)
+        self.lease = None
+        self.driver = None
 
 def scrape_profiles(params):
     """Legacy function for backward compatibility"""
@@ -0,0 +1,70 @@
+# Search result handling for LeadSprinter
+# Shared by the Selenium and requests-based scrapers: caching result lists, parsing result text
+# for ranking and SERP-only leads, and collecting new profile URLs
+
+from serp_parser import iter_serp_results, build_serp_record, merge_serp_record
+from metrics import get_metrics
+
+
+class SearchResultsMixin:
+    """Search-result helpers; the scraper provides search_cache, seen_index, candidates, serp_records and timer"""
+
+    def collect_new_urls(self, urls, collected, found, max_results):
+        """Append URLs not yet found in this search or already claimed by the job, up to max_results"""
+        if self.candidates is not None:
+            self.candidates.observe(urls)
+        for url in urls:
+            if len(collected) >= max_results:
+                break
+            if self.seen_index is not None and url in self.seen_index:
+                continue
+            if found.add(url):
+                collected.append(url)
+
+    def get_cached_search(self, engine, query, locale):
+        """Look up a previous result list for this exact search"""
+        if self.search_cache is None:
+            return None
+        try:
+            entry = self.search_cache.get(engine, query, locale)
+        except Exception as e:
+            print(f"⚠️ Search cache lookup failed: {str(e)}")
+            return None
+        if entry is None:
+            return None
+
+        urls, results = entry
+        get_metrics().increment('cache_hits_total', cache='search')
+        # The stored result text stands in for the page, for ranking and SERP-only leads
+        self.collect_serp_records(results)
+        return urls
+
+    def cache_search(self, engine, query, locale, urls, results=None):
+        """Remember the result list of a search, with each result's title and snippet (empty for a "no results" page)"""
+        if self.search_cache is None:
+            return
+        try:
+            self.search_cache.put(engine, query, locale, urls, results)
+        except Exception as e:
+            print(f"⚠️ Could not cache search results: {str(e)}")
+
+    def parse_serp_results(self, engine, snapshot):
+        """(url, title, snippet) per result in a SERP snapshot, for the search cache, ranking and SERP-only mode"""
+        if self.search_cache is None and self.serp_records is None and self.candidates is None:
+            return []
+        try:
+            with self.timer.span('serp_parse'):
+                results = list(iter_serp_results(snapshot.soup, engine))
+        except Exception as e:
+            print(f"Error parsing {engine} results: {str(e)}")
+            return []
+        self.collect_serp_records(results)
+        return results
+
+    def collect_serp_records(self, results):
+        """Keep each result's text for candidate ranking, and its lead record in SERP-only mode"""
+        for url, heading, snippet in results:
+            if self.candidates is not None:
+                self.candidates.add_text(url, heading, snippet)
+            if self.serp_records is not None:
+                merge_serp_record(self.serp_records, build_serp_record(url, heading, snippet))
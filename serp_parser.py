@@ -0,0 +1,151 @@
+# SERP result parsing for LeadSprinter
+# Turns the LinkedIn results on a Google, Bing or DuckDuckGo page into lead records from
+# their titles and snippets, so most leads need no profile page load at all
+
+import re
+from config import Config
+from canonicalize import canonicalize
+
+# CSS selectors for one organic result and its parts, per engine
+SERP_LAYOUTS = {
+    'google': {
+        'block': 'div.g',
+        'link': 'a[href]',
+        'heading': 'h3',
+        'snippet': '.VwiC3b, .IsZvec, [data-sncf]'
+    },
+    'bing': {
+        'block': 'li.b_algo',
+        'link': 'h2 a[href]',
+        'heading': 'h2',
+        'snippet': '.b_caption p, .b_algoSlug'
+    },
+    'duckduckgo': {
+        'block': 'div.result',
+        'link': 'a.result__a[href]',
+        'heading': 'a.result__a',
+        'snippet': '.result__snippet'
+    }
+}
+
+# "Name - Title - Company | LinkedIn", with -, – or — between the parts
+HEADING_SUFFIX_PATTERN = re.compile(r'\s*(?:[|\-–—]\s*)?(?:Professional Profile\s*[|\-–—]\s*)?LinkedIn\s*$', re.IGNORECASE)
+HEADING_SEPARATOR_PATTERN = re.compile(r'\s+[|\-–—]\s+')
+TRUNCATION_MARKERS = ('...', '…')
+
+# A field ends at a separator or a full stop, but not inside a "..." the search engine cut it off with
+SNIPPET_LOCATION_PATTERN = re.compile(r'Location:\s*([^·|]+?)\s*(?:·|\||(?<!\.)\.\s|$)')
+SNIPPET_COMPANY_PATTERN = re.compile(r'Experience:\s*([^·|]+?)\s*(?:·|\||(?<!\.)\.\s|$)')
+SNIPPET_SEPARATOR = '·'
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+LEAD_FIELDS = ('name', 'title', 'company', 'location')
+
+
+def clean_part(text):
+    """A heading or snippet fragment, or None if it is empty or cut off by the search engine"""
+    text = (text or '').strip(' \u00a0-–—|,')
+    if not text or text.endswith(TRUNCATION_MARKERS):
+        return None
+    return text
+
+
+def parse_heading(heading):
+    """name, title, company and sometimes location from a LinkedIn result title"""
+    fields = {}
+    raw_parts = HEADING_SEPARATOR_PATTERN.split(HEADING_SUFFIX_PATTERN.sub('', heading or ''))
+    parts = [clean_part(part) for part in raw_parts]
+
+    fields['name'] = parts[0] if parts else None
+    if len(parts) >= 3:
+        fields['title'], fields['company'] = parts[1], parts[2]
+    elif len(parts) == 2 and raw_parts[1].strip():
+        # "Name - Title at Company", "Name - Title", or "Name - Place, Country" for profiles without a headline;
+        # split before dropping a cut-off part, so a truncated company still leaves the title
+        rest = raw_parts[1].strip()
+        if ',' in rest and ' at ' not in rest:
+            fields['location'] = clean_part(rest)
+            return fields
+        title, _, company = rest.partition(' at ')
+        fields['title'], fields['company'] = clean_part(title), clean_part(company)
+    return fields
+
+
+def parse_snippet(snippet):
+    """location, company and email from a result snippet"""
+    fields = {}
+    snippet = ' '.join((snippet or '').split())
+
+    match = SNIPPET_LOCATION_PATTERN.search(snippet)
+    if match:
+        fields['location'] = clean_part(match.group(1))
+    elif SNIPPET_SEPARATOR in snippet:
+        # Google's LinkedIn snippets usually open with "Place, Region, Country · Title · Company"
+        first = clean_part(snippet.split(SNIPPET_SEPARATOR, 1)[0])
+        if first and ',' in first and len(first.split()) <= 6:
+            fields['location'] = first
+
+    match = SNIPPET_COMPANY_PATTERN.search(snippet)
+    if match:
+        fields['company'] = clean_part(match.group(1))
+
+    match = EMAIL_PATTERN.search(snippet)
+    if match:
+        fields['email'] = match.group(0)
+    return fields
+
+
+def iter_serp_results(soup, engine):
+    """(canonical url, title text, snippet text) for each LinkedIn profile result on a parsed SERP, in ranking order"""
+    layout = SERP_LAYOUTS[engine]
+
+    for block in soup.select(layout['block']):
+        url = None
+        for link in block.select(layout['link']):
+            url = canonicalize(link.get('href'))
+            if url:
+                break
+        if not url:
+            continue
+
+        heading = block.select_one(layout['heading'])
+        snippet = block.select_one(layout['snippet'])
+        yield (
+            url,
+            heading.get_text(' ', strip=True) if heading else '',
+            snippet.get_text(' ', strip=True) if snippet else ''
+        )
+
+
+def build_serp_record(url, heading, snippet):
+    """Lead record for one search result"""
+    heading_fields = parse_heading(heading)
+    snippet_fields = parse_snippet(snippet)
+    return {
+        'name': heading_fields.get('name') or 'N/A',
+        'title': heading_fields.get('title') or 'N/A',
+        'company': heading_fields.get('company') or snippet_fields.get('company') or 'N/A',
+        'location': snippet_fields.get('location') or heading_fields.get('location') or 'N/A',
+        'linkedin_url': url,
+        'email': snippet_fields.get('email')
+    }
+
+
+def merge_serp_record(records, record):
+    """Add a record to {url: record}, filling gaps in an earlier sighting of the same profile"""
+    existing = records.get(record['linkedin_url'])
+    if existing is None:
+        records[record['linkedin_url']] = record
+        return
+
+    for field in LEAD_FIELDS:
+        if existing.get(field, 'N/A') == 'N/A' and record.get(field, 'N/A') != 'N/A':
+            existing[field] = record[field]
+    if not existing.get('email') and record.get('email'):
+        existing['email'] = record['email']
+
+
+def get_missing_fields(record, key_fields=None):
+    """Key fields a lead record has no value for"""
+    key_fields = key_fields or Config.SERP_KEY_FIELDS
+    return [field for field in key_fields if record.get(field, 'N/A') in ('N/A', None, '')]
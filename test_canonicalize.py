@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for LinkedIn URL canonicalization and SERP URL extraction
+(every dedup and cache key depends on these producing one URL per person)
+"""
+
+import sys
+import os
+import base64
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from canonicalize import canonicalize
+from url_extractor import extract_profile_urls
+
+JANE = 'https://www.linkedin.com/in/jane-doe'
+SEAN = 'https://www.linkedin.com/in/se%C3%A1n-%C3%B3-brien'
+
+
+def bing_link(target):
+    """A Bing click-tracking link wrapping target as u=a1<base64url>"""
+    token = base64.urlsafe_b64encode(target.encode('utf-8')).decode('ascii').rstrip('=')
+    return f'https://www.bing.com/ck/a?!&&p=abc123&u=a1{token}&ntb=1'
+
+
+def check(cases, function):
+    """Run (input, expected) pairs through a function and collect the mismatches"""
+    failures = []
+    for value, expected in cases:
+        result = function(value)
+        marker = "✅" if result == expected else "❌"
+        print(f"  {marker} {str(value)[:70]} -> {result}")
+        if result != expected:
+            failures.append((value, result, expected))
+    return failures
+
+
+def test_plain_urls():
+    """Scheme, subdomain, case, query strings, trailing slashes and punctuation are normalized away"""
+    failures = check([
+        ('https://www.linkedin.com/in/jane-doe', JANE),
+        ('http://ie.linkedin.com/in/Jane-Doe/', JANE),
+        ('https://m.linkedin.com/in/jane-doe?trk=public_profile', JANE),
+        ('linkedin.com/in/jane-doe#experience', JANE),
+        ('https://www.linkedin.com/in/jane-doe/details/experience/', JANE),
+        ('https://www.linkedin.com/in/jane-doe).', JANE),
+        ('https://www.linkedin.com/in/jane-doe,', JANE)
+    ], canonicalize)
+    assert not failures, f"Plain URLs: {failures}"
+
+
+def test_percent_encoding():
+    """A slug is decoded and re-encoded exactly once, whatever form it arrives in"""
+    failures = check([
+        ('https://www.linkedin.com/in/se%C3%A1n-%C3%B3-brien', SEAN),
+        ('https://www.linkedin.com/in/Se%C3%A1n-%C3%93-Brien/', SEAN),
+        ('https://www.linkedin.com/in/Seán-Ó-Brien', SEAN)
+    ], canonicalize)
+    assert not failures, f"Percent-encoding: {failures}"
+
+
+def test_redirect_wrappers():
+    """Search engine redirects are unwrapped to the profile they point at"""
+    failures = check([
+        ('https://duckduckgo.com/l/?uddg=https%3A%2F%2Fie.linkedin.com%2Fin%2Fjane-doe%3Ftrk%3Dx&rut=abc', JANE),
+        ('https://www.google.com/url?q=https://www.linkedin.com/in/jane-doe/&sa=U', JANE),
+        ('https://www.google.com/url?q=https%3A%2F%2Fwww.linkedin.com%2Fin%2Fjane-doe%2F&sa=U', JANE),
+        (bing_link('https://ie.linkedin.com/in/jane-doe?trk=x'), JANE),
+        (bing_link('https://ie.linkedin.com/in/Seán-Ó-Brien'), SEAN)
+    ], canonicalize)
+    assert not failures, f"Redirect wrappers: {failures}"
+
+
+def test_non_profiles():
+    """Anything that is not a profile URL gives None"""
+    failures = check([
+        ('https://www.linkedin.com/company/acme', None),
+        ('https://www.linkedin.com/in/', None),
+        ('https://www.google.com/search?q=jane+doe', None),
+        ('', None),
+        (None, None)
+    ], canonicalize)
+    assert not failures, f"Non-profiles: {failures}"
+
+
+def test_extraction():
+    """One pass over a SERP finds every profile once, canonical and in page order"""
+    html = (
+        '<a href="https://ie.linkedin.com/in/Jane-Doe?trk=x">Jane</a> https://www.linkedin.com/in/jane-doe '
+        '<a href="/l/?uddg=https%3A%2F%2Fwww.linkedin.com%2Fin%2Fbob-smith">Bob</a> '
+        f'<a href="{bing_link("https://ie.linkedin.com/in/Seán-Ó-Brien")}">Seán</a> '
+        '<a href="https://www.linkedin.com/company/acme">Acme</a>'
+    )
+    expected = [JANE, 'https://www.linkedin.com/in/bob-smith', SEAN]
+
+    urls = extract_profile_urls(html)
+    assert urls == expected, f"Extracted {urls}"
+    assert extract_profile_urls(html, limit=2) == expected[:2]
+    assert extract_profile_urls('') == []
+
+    # The extractor and canonicalize agree on every URL
+    assert [canonicalize(url) for url in urls] == urls
+    print(f"  ✅ Extracted {len(urls)} profiles in page order")
+
+    fixtures_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+    for name in ['google_serp.html', 'bing_serp.html', 'duckduckgo_serp.html']:
+        with open(os.path.join(fixtures_dir, name), 'r', encoding='utf-8') as f:
+            urls = extract_profile_urls(f.read())
+        assert len(urls) == 10, f"{name}: {len(urls)} profiles"
+        print(f"  ✅ {name}: {len(urls)} profiles")
+
+
+if __name__ == "__main__":
+    print("Testing LinkedIn URL canonicalization...")
+    try:
+        test_plain_urls()
+        test_percent_encoding()
+        test_redirect_wrappers()
+        test_non_profiles()
+        test_extraction()
+        print("\n🎉 Canonicalization tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test script for the job journal: a journal cut off mid-line by a crash is replayed into
+the searches to skip, the profiles still to extract and the records already collected
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from journal import JobJournal
+from dedup import SeenIndex
+from pipeline import ScrapePipeline, ProfileTask
+
+PARAMS = {'job_titles': ['Data Engineer'], 'locations': ['Dublin'], 'num_results': 10}
+
+
+def profile(slug):
+    return f'https://www.linkedin.com/in/{slug}'
+
+
+def record(slug):
+    return {'name': slug.title(), 'title': 'Data Engineer', 'company': 'Acme', 'location': 'Dublin',
+            'linkedin_url': profile(slug), 'email': None, 'relevance_score': 0.9}
+
+
+def write_interrupted_journal(directory):
+    """Run part of a job through the journal, then cut its last line in half as a crash would"""
+    path = str(Path(directory) / 'job.jsonl')
+    journal = JobJournal(path, PARAMS)
+    journal.record_query('Data Engineer Dublin', 'Data Engineer', 'Dublin',
+                         [profile('ann'), profile('bob'), profile('cat'), profile('dan')], found=6,
+                         scores={profile('ann'): 0.9, profile('bob'): 0.8, profile('cat'): 0.4, profile('dan'): 0.2})
+    journal.record_query('Data Engineer in Dublin', 'Data Engineer', 'Dublin', [], found=0)
+    journal.record_visit(profile('ann'), record('ann'))
+    journal.record_visit(profile('bob'), None, extracted=False)  # Failed extraction
+    journal.record_visit(profile('cat'), record('cat'))
+    journal.close()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content[:-len(json.dumps({'type': 'visit'}))])
+    return path
+
+
+def test_replay(tmp_path):
+    """The truncated journal replays everything before the cut"""
+    path = write_interrupted_journal(tmp_path)
+    journal = JobJournal(path)
+    try:
+        assert journal.is_resumed
+        assert journal.params == PARAMS, journal.params
+        assert JobJournal.read_params(path) == PARAMS
+
+        # Both searches finished, including the one that found nothing
+        assert journal.completed_queries == {'Data Engineer Dublin': 6, 'Data Engineer in Dublin': 0}, \
+            journal.completed_queries
+        print("  ✅ Finished searches restored")
+
+        # The visit to cat was cut off, so cat is pending again; bob failed and is retried
+        pending = journal.get_pending()
+        assert [entry[0] for entry in pending] == [profile('bob'), profile('cat'), profile('dan')], pending
+        assert pending[0] == (profile('bob'), 'Data Engineer Dublin', 'Data Engineer', 'Dublin', 0.8)
+        print(f"  ✅ {len(pending)} pending profiles, failed extraction included")
+
+        assert journal.records == [record('ann')], journal.records
+        assert not journal.finished
+        print("  ✅ Extracted records restored")
+    finally:
+        journal.close()
+
+
+def test_resume_appends(tmp_path):
+    """A resumed job keeps writing to the same journal without repeating its job entry"""
+    path = write_interrupted_journal(tmp_path)
+    journal = JobJournal(path, PARAMS)
+    journal.record_visit(profile('cat'), record('cat'))
+    journal.record_finished()
+    journal.close()
+
+    journal = JobJournal(path)
+    try:
+        assert [entry[0] for entry in journal.get_pending()] == [profile('bob'), profile('dan')]
+        assert journal.records == [record('ann'), record('cat')]
+        assert journal.finished
+    finally:
+        journal.close()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        job_entries = [line for line in f if '"type": "job"' in line]
+    assert len(job_entries) == 1, job_entries
+    print("  ✅ Resumed job appends to the same journal")
+
+
+class OfflineScraper:
+    """Just enough of LinkedInScraper for ScrapePipeline: searches find nothing new, every profile extracts"""
+
+    stop_requested = False
+    profile_cache = None
+    serp_records = None
+    candidates = None
+    completed_index = None
+    lease = 'offline'  # Acts as its own worker, already holding a browser
+
+    def __init__(self):
+        self.seen_index = SeenIndex()
+        self.pool = self
+        self.searches = []
+        self.extracted = []
+
+    def ensure_capacity(self, size):
+        pass
+
+    def scrape_google_search_results(self, search_query, max_results):
+        self.searches.append(search_query)
+        return []
+
+    def scrape_duckduckgo_search_results(self, search_query, max_results):
+        return []
+
+    def create_worker(self):
+        return self
+
+    def release_worker(self, worker):
+        pass
+
+    def scrape_profile_info(self, profile_url):
+        self.extracted.append(profile_url)
+        return record(profile_url.rsplit('/', 1)[-1])
+
+    def store_in_cache(self, profile_data):
+        pass
+
+    def get_cache_status(self):
+        return ''
+
+    def stop_scraping(self):
+        self.stop_requested = True
+
+
+def test_resume_pipeline(tmp_path):
+    """A resumed pipeline yields the journal's records, extracts only pending profiles and skips finished searches"""
+    path = write_interrupted_journal(tmp_path)
+    journal = JobJournal(path, PARAMS)
+    scraper = OfflineScraper()
+    scraper.seen_index.filter_new(journal.queued, mark=True)
+    try:
+        results = list(ScrapePipeline(scraper, dict(PARAMS, workers=1), journal=journal).iter_results())
+    finally:
+        journal.close()
+
+    assert sorted(scraper.extracted) == [profile('bob'), profile('cat'), profile('dan')], scraper.extracted
+    assert 'Data Engineer Dublin' not in scraper.searches, scraper.searches
+    assert [r['linkedin_url'] for r in results][:1] == [profile('ann')]
+    assert len(results) == 4, results
+
+    # Resumed profiles keep the relevance score recorded with their search
+    scores = {r['linkedin_url']: r.get('relevance_score') for r in results}
+    assert scores[profile('dan')] == 0.2, scores
+    print(f"  ✅ Resumed pipeline: {len(results)} records, searched {scraper.searches}")
+
+    # A record extracted just as the user pressed Stop is turned away; it must stay pending, not be lost
+    path = str(Path(tmp_path) / 'stopped.jsonl')
+    journal = JobJournal(path, PARAMS)
+    journal.record_query('Data Engineer Dublin', 'Data Engineer', 'Dublin', [profile('ann'), profile('bob')])
+    scraper = OfflineScraper()
+    scraper.stop_requested = True
+    pipeline = ScrapePipeline(scraper, dict(PARAMS, workers=1), journal=journal)
+    task = ProfileTask(profile('bob'), 'Data Engineer Dublin', 'Data Engineer', 'Dublin')
+    assert pipeline.accept(task, record('bob')) is None
+    journal.close()
+
+    journal = JobJournal(path, PARAMS)
+    scraper = OfflineScraper()
+    scraper.seen_index.filter_new(journal.queued, mark=True)
+    try:
+        assert [entry[0] for entry in journal.get_pending()] == [profile('ann'), profile('bob')], journal.get_pending()
+        results = list(ScrapePipeline(scraper, dict(PARAMS, workers=1), journal=journal).iter_results())
+    finally:
+        journal.close()
+    assert sorted(r['linkedin_url'] for r in results) == [profile('ann'), profile('bob')], results
+    print("  ✅ Record turned away at Stop is extracted again on resume")
+
+
+if __name__ == "__main__":
+    print("Testing job journal replay...")
+    try:
+        for test in (test_replay, test_resume_appends, test_resume_pipeline):
+            with tempfile.TemporaryDirectory() as directory:
+                test(directory)
+        print("\n🎉 Job journal tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for page classification against the saved pages in fixtures/pages
+(each file name starts with the status it should get: ok_, consent_, blocked_ or empty_)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from page_classifier import classify_page, OK, BLOCKED, CONSENT, EMPTY
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+PAGES_DIR = os.path.join(FIXTURES_DIR, 'pages')
+
+# The benchmark SERPs are ordinary result pages
+SERP_FIXTURES = ['google_serp.html', 'bing_serp.html', 'duckduckgo_serp.html']
+
+
+def read_fixture(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_saved_pages():
+    """Every saved page gets the status its file name promises"""
+    failures = []
+    for name in sorted(os.listdir(PAGES_DIR)):
+        expected = name.split('_', 1)[0]
+        result = classify_page(read_fixture(os.path.join(PAGES_DIR, name)))
+        marker = "✅" if result.status == expected else "❌"
+        print(f"  {marker} {name}: {result.status} ({result.describe()})")
+        if result.status != expected:
+            failures.append(name)
+
+    for name in SERP_FIXTURES:
+        result = classify_page(read_fixture(os.path.join(FIXTURES_DIR, name)))
+        marker = "✅" if result.status == OK else "❌"
+        print(f"  {marker} {name}: {result.status} ({result.describe()})")
+        if result.status != OK:
+            failures.append(name)
+
+    assert not failures, f"Misclassified: {failures}"
+
+
+def test_redirect_urls():
+    """Block and consent redirects are recognized from the URL alone"""
+    assert classify_page('', 'https://www.google.com/sorry/index?continue=x').status == BLOCKED
+    assert classify_page('<html></html>', 'https://consent.google.com/ml?continue=x').status == CONSENT
+    print("  ✅ Redirect URLs classified")
+
+
+def test_search_terms_in_url():
+    """Search terms in the query string are not mistaken for a block redirect"""
+    html = read_fixture(os.path.join(FIXTURES_DIR, 'google_serp.html'))
+    for url in [
+        'https://www.google.com/search?q=site%3Alinkedin.com%2Fin+%22Robotics+Engineer%22+Dublin',
+        'https://www.bing.com/search?q=Captcha+Developer+denied+blocked&mkt=en-IE'
+    ]:
+        result = classify_page(html, url)
+        assert result.status == OK, f"{url}: {result}"
+    print("  ✅ Search terms in URLs ignored")
+
+
+def test_priority_and_evidence():
+    """A block outranks a consent wall and an empty result list, and the evidence says why"""
+    result = classify_page('Before you continue to Google ... did not match any documents ... unusual traffic')
+    assert result.status == BLOCKED
+    assert ('blocked', 'unusual traffic') in [(category, text) for category, text, _ in result.evidence]
+
+    assert classify_page('Your search did not match any documents.').status == EMPTY
+    assert classify_page('Showing results 1-403 of 429').status == OK
+    print("  ✅ Priority and evidence")
+
+
+if __name__ == "__main__":
+    print("Testing page classification...")
+    try:
+        test_saved_pages()
+        test_redirect_urls()
+        test_search_terms_in_url()
+        test_priority_and_evidence()
+        print("\n🎉 Page classification tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for per-host rate limiting
+(Retry-After parsing, token bucket spacing and backoff after a host pushes back)
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from rate_limit import parse_retry_after, HostBucket, RateScheduler
+
+URL = 'https://www.bing.com/search?q=engineer'
+
+
+def test_parse_retry_after():
+    """Delta-seconds and HTTP dates give seconds to wait; anything else gives None"""
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after(' 7 ') == 7.0
+    assert parse_retry_after(30) == 30.0
+    print("  ✅ Delta-seconds")
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=90)
+    seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert 85 <= seconds <= 90, f"HTTP date gave {seconds}"
+    past = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+    print(f"  ✅ HTTP date ({seconds:.0f}s ahead, past dates wait 0s)")
+
+    for value in [None, '', 'soon', '-5', '1.5', 'Mon, 99 Foo 2026']:
+        assert parse_retry_after(value) is None, f"{value!r} was accepted"
+    print("  ✅ Missing or malformed values are ignored")
+
+
+def test_reserve():
+    """Up to `burst` requests start at once, then one per 1/rate seconds"""
+    bucket = HostBucket(requests_per_minute=60, burst=3)
+    now = bucket.updated
+
+    starts = [bucket.reserve(now) - now for _ in range(6)]
+    assert starts[:3] == [0.0, 0.0, 0.0], f"Burst: {starts[:3]}"
+    assert [round(start, 6) for start in starts[3:]] == [1.0, 2.0, 3.0], f"Spacing: {starts[3:]}"
+    print(f"  ✅ Burst of 3, then 1s apart: {[round(start, 2) for start in starts]}")
+
+    # An idle spell refills the bucket, but never beyond the burst
+    bucket = HostBucket(requests_per_minute=60, burst=2)
+    now = bucket.updated
+    bucket.reserve(now)
+    bucket.reserve(now)
+    later = now + 60
+    starts = [bucket.reserve(later) - later for _ in range(3)]
+    assert [round(start, 6) for start in starts] == [0.0, 0.0, 1.0], f"After idle: {starts}"
+    print("  ✅ Idle hosts earn back at most one burst")
+
+
+def test_penalize():
+    """Backoff starts at the base, doubles while the host pushes back, stops at the cap and yields to Retry-After"""
+    saved = Config.RATE_BACKOFF_BASE_SECONDS, Config.RATE_BACKOFF_MAX_SECONDS
+    Config.RATE_BACKOFF_BASE_SECONDS, Config.RATE_BACKOFF_MAX_SECONDS = 5, 30
+    try:
+        scheduler = RateScheduler(requests_per_minute=60, burst=2, host_limits={})
+        pauses = [scheduler.penalize(URL) for _ in range(5)]
+        assert pauses == [5, 10, 20, 30, 30], f"Backoff: {pauses}"
+        print(f"  ✅ Backoff doubles up to the cap: {pauses}")
+
+        bucket = scheduler.get_bucket('www.bing.com')
+        assert bucket.rate == bucket.base_rate * Config.RATE_MIN_FACTOR, f"Rate: {bucket.rate}"
+        assert scheduler.reserve(URL) > 25, "Penalized host was not paused"
+        print("  ✅ Penalized host is paused and slowed to the minimum rate")
+
+        scheduler.record_success(URL)
+        assert scheduler.penalize(URL) == 5, "Success did not reset the backoff"
+        print("  ✅ A normal answer resets the backoff")
+
+        scheduler = RateScheduler(requests_per_minute=60, burst=2, host_limits={})
+        assert scheduler.penalize(URL, '120') == 120.0
+        assert scheduler.penalize(URL, 'garbage') == 10
+        print("  ✅ Retry-After wins over the backoff; a malformed one falls back to it")
+
+        scheduler = RateScheduler(requests_per_minute=60, burst=2, host_limits={})
+        assert scheduler.record_response(URL, 429, '3') == 3.0
+        assert scheduler.record_response(URL, 200) == 0.0
+        assert scheduler.get_bucket('www.bing.com').backoff == 0.0
+        print("  ✅ record_response penalizes 429/503 and credits other answers")
+    finally:
+        Config.RATE_BACKOFF_BASE_SECONDS, Config.RATE_BACKOFF_MAX_SECONDS = saved
+
+
+if __name__ == "__main__":
+    print("Testing per-host rate limiting...")
+    try:
+        test_parse_retry_after()
+        test_reserve()
+        test_penalize()
+        print("\n🎉 Rate limiting tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        sys.exit(1)
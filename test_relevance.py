@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for candidate ranking
+(decides which search results get the page-load budget first)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+from relevance import score_candidate, CandidateIndex
+
+ENGINEER = 'Aoife Byrne - Senior Software Engineer - Fintrail | LinkedIn Galway, Ireland'
+
+
+def test_weighting():
+    """Title, location and sightings each add their configured weight"""
+    title = Config.RELEVANCE_TITLE_WEIGHT
+    location = Config.RELEVANCE_LOCATION_WEIGHT
+    sightings = Config.RELEVANCE_SIGHTINGS_WEIGHT
+
+    assert score_candidate(ENGINEER, 'Software Engineer', 'Galway', 0) == round(title + location, 3)
+    assert score_candidate(ENGINEER, 'Software Engineer', 'Cork', 0) == round(title, 3)
+    assert score_candidate(ENGINEER, 'Accountant', 'Galway', 0) == round(location, 3)
+    assert score_candidate(ENGINEER, 'Software Engineer', 'Galway', Config.RELEVANCE_SIGHTINGS_CAP) == round(title + location + sightings, 3)
+    print("  ✅ Title, location and sightings weights add up")
+
+    # Half the title's words (plurals folded, stopwords ignored) earn half the title weight
+    assert score_candidate(ENGINEER, 'Engineers of Data', 'Galway', 0) == round(title / 2 + location, 3)
+    assert score_candidate('', 'Software Engineer', 'Galway', 0) == 0.0
+    assert score_candidate(ENGINEER, '', '', 0) == 0.0
+    print("  ✅ Partial matches score by word coverage; empty text or query scores nothing")
+
+
+def test_sightings_cap():
+    """Sightings count up to the cap and no further"""
+    cap = Config.RELEVANCE_SIGHTINGS_CAP
+    scores = [score_candidate('', 'Engineer', 'Galway', count) for count in range(cap + 3)]
+    assert scores == sorted(scores), f"Scores fell with more sightings: {scores}"
+    assert len(set(scores[:cap + 1])) == cap + 1, f"Sightings below the cap did not count: {scores}"
+    assert len(set(scores[cap:])) == 1, f"Sightings beyond the cap counted: {scores}"
+    assert scores[-1] == round(Config.RELEVANCE_SIGHTINGS_WEIGHT, 3)
+    print(f"  ✅ Sightings scores: {scores}")
+
+
+def test_rank():
+    """Best first, with ties left in the order the search engines returned them"""
+    index = CandidateIndex()
+    urls = ['https://www.linkedin.com/in/%s' % name for name in ['ann', 'bob', 'cat', 'dan', 'eve']]
+    index.observe(urls)
+    index.observe(urls[3:4])
+    index.add_text(urls[0], 'Ann - Accountant - Ledgerly | LinkedIn', 'Cork, Ireland')
+    index.add_text(urls[1], 'Bob - Software Engineer - Fintrail | LinkedIn', 'Dublin, Ireland')
+    index.add_text(urls[2], 'Cat - Barista | LinkedIn', 'Cork, Ireland')
+    index.add_text(urls[3], 'Dan - Software Engineer - Harbourline | LinkedIn', 'Galway, Ireland')
+    index.add_text(urls[4], 'Eve - Software Engineer - Westbay Labs | LinkedIn', 'Dublin, Ireland')
+    index.add_text(urls[4], 'Eve - Software Engineer - Westbay Labs | LinkedIn')
+
+    ranked = index.rank(urls, 'Software Engineer', 'Galway')
+    order = [url.rsplit('/', 1)[1] for url, _ in ranked]
+    for url, score in ranked:
+        print(f"  {score:.3f} {url}")
+    assert order == ['dan', 'bob', 'eve', 'ann', 'cat'], f"Rank order: {order}"
+    assert index.texts[urls[4]] == ['Eve - Software Engineer - Westbay Labs | LinkedIn', 'Dublin, Ireland']
+    print("  ✅ Best match first, ties keep engine order, repeated text stored once")
+
+    assert [url for url, _ in index.rank(list(reversed(urls[:3])), 'Barista', 'Galway')] == [urls[2], urls[1], urls[0]]
+    assert index.rank([], 'Software Engineer', 'Galway') == []
+    assert index.score('https://www.linkedin.com/in/unknown', 'Software Engineer', 'Galway') == 0.0
+    print("  ✅ Unseen candidates score nothing")
+
+
+if __name__ == "__main__":
+    print("Testing candidate ranking...")
+    try:
+        test_weighting()
+        test_sightings_cap()
+        test_rank()
+        print("\n🎉 Candidate ranking tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        sys.exit(1)
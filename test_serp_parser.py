@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script for SERP result parsing against the benchmark SERPs in fixtures/
+(lead records built from result titles and snippets stand in for profile page loads)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from serp_parser import iter_serp_results, parse_heading, parse_snippet, build_serp_record, merge_serp_record
+from url_extractor import extract_profile_urls
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SERP_FIXTURES = {
+    'google': 'google_serp.html',
+    'bing': 'bing_serp.html',
+    'duckduckgo': 'duckduckgo_serp.html'
+}
+
+AOIFE = 'https://www.linkedin.com/in/aoife-byrne'
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def check(cases, function):
+    """Run (input, expected) pairs through a function and collect the mismatches"""
+    failures = []
+    for value, expected in cases:
+        result = function(value)
+        marker = "✅" if result == expected else "❌"
+        print(f"  {marker} {str(value)[:60]} -> {result}")
+        if result != expected:
+            failures.append((value, result, expected))
+    return failures
+
+
+def test_iter_serp_results():
+    """Each engine's layout yields every LinkedIn result, in page order, with its title and snippet"""
+    for engine, name in SERP_FIXTURES.items():
+        html = read_fixture(name)
+        results = list(iter_serp_results(BeautifulSoup(html, 'html.parser'), engine))
+
+        assert len(results) == 10, f"{engine}: {len(results)} results"
+        assert [url for url, _, _ in results] == extract_profile_urls(html), f"{engine}: order differs from the extractor"
+        url, heading, snippet = results[0]
+        assert url == AOIFE, f"{engine}: first result {url}"
+        assert heading == 'Aoife Byrne - Senior Software Engineer - Fintrail | LinkedIn', f"{engine}: heading {heading!r}"
+        assert snippet.startswith('Galway, Ireland · Senior Software Engineer'), f"{engine}: snippet {snippet!r}"
+        assert all(heading and snippet for _, heading, snippet in results), f"{engine}: empty title or snippet"
+        print(f"  ✅ {name}: {len(results)} results")
+
+    # Results that do not link to a profile are skipped, and a missing snippet is empty
+    html = '''
+        <li class="b_algo"><h2><a href="https://www.example.com/jobs">Jobs</a></h2></li>
+        <li class="b_algo"><h2><a href="https://ie.linkedin.com/in/Jane-Doe/">Jane Doe - Engineer | LinkedIn</a></h2></li>
+    '''
+    results = list(iter_serp_results(BeautifulSoup(html, 'html.parser'), 'bing'))
+    assert results == [('https://www.linkedin.com/in/jane-doe', 'Jane Doe - Engineer | LinkedIn', '')], results
+    print("  ✅ Non-profile results skipped, missing snippet empty")
+
+
+def test_parse_heading():
+    """The heading forms LinkedIn results use, and parts the engine cut off"""
+    failures = check([
+        ('Aoife Byrne - Senior Software Engineer - Fintrail | LinkedIn',
+         {'name': 'Aoife Byrne', 'title': 'Senior Software Engineer', 'company': 'Fintrail'}),
+        ('Cian Walsh – Software Developer – Westbay Labs – LinkedIn',
+         {'name': 'Cian Walsh', 'title': 'Software Developer', 'company': 'Westbay Labs'}),
+        ('Niamh Kelly - Full Stack Developer at Harbourline | LinkedIn',
+         {'name': 'Niamh Kelly', 'title': 'Full Stack Developer', 'company': 'Harbourline'}),
+        ('Liam Murphy - Data Analyst | LinkedIn',
+         {'name': 'Liam Murphy', 'title': 'Data Analyst', 'company': None}),
+        ('Sinead Ryan - Cork, Ireland | LinkedIn',
+         {'name': 'Sinead Ryan', 'location': 'Cork, Ireland'}),
+        ('Jane Doe | Professional Profile - LinkedIn',
+         {'name': 'Jane Doe'})
+    ], parse_heading)
+
+    # A part the search engine truncated is dropped rather than stored half-written
+    failures += check([
+        ('Aoife Byrne - Senior Software Engineer - Fintrail Financial Serv... | LinkedIn',
+         {'name': 'Aoife Byrne', 'title': 'Senior Software Engineer', 'company': None}),
+        ('Aoife Byrne - Senior Software Engineer at Fintrail Financ…',
+         {'name': 'Aoife Byrne', 'title': 'Senior Software Engineer', 'company': None}),
+        ('Aoife Byrne - Principal Software Engineering Lea...',
+         {'name': 'Aoife Byrne', 'title': None, 'company': None})
+    ], parse_heading)
+    assert not failures, f"Headings: {failures}"
+
+
+def test_parse_snippet():
+    """Location, company and email from the snippet text"""
+    failures = check([
+        ('Experience: Fintrail · Education: University of Galway · Location: Galway, Ireland. View profile',
+         {'location': 'Galway, Ireland', 'company': 'Fintrail'}),
+        ('Dublin, County Dublin, Ireland · Full Stack Developer · Harbourline',
+         {'location': 'Dublin, County Dublin, Ireland'}),
+        ('Software Developer · Westbay Labs',
+         {}),
+        ('Recruiter. Reach me at jane.doe@example.ie for roles. Location: Cork',
+         {'location': 'Cork', 'email': 'jane.doe@example.ie'}),
+        ('Experience: Fintrail Financial Serv... · Location: Galway',
+         {'location': 'Galway', 'company': None}),
+        ('', {})
+    ], parse_snippet)
+    assert not failures, f"Snippets: {failures}"
+
+
+def test_merge_serp_record():
+    """A later sighting fills the gaps of an earlier one without overwriting what it had"""
+    records = {}
+    merge_serp_record(records, build_serp_record(AOIFE, 'Aoife Byrne - Senior Software Engineer... | LinkedIn', ''))
+    first = records[AOIFE]
+    assert (first['title'], first['company'], first['location'], first['email']) == ('N/A', 'N/A', 'N/A', None), first
+
+    merge_serp_record(records, build_serp_record(
+        AOIFE,
+        'A. Byrne - Senior Software Engineer - Fintrail | LinkedIn',
+        'Location: Galway, Ireland. Contact aoife@fintrail.ie'
+    ))
+    merged = records[AOIFE]
+    assert merged is first, "Merge replaced the earlier record"
+    assert merged == {
+        'name': 'Aoife Byrne',
+        'title': 'Senior Software Engineer',
+        'company': 'Fintrail',
+        'location': 'Galway, Ireland',
+        'linkedin_url': AOIFE,
+        'email': 'aoife@fintrail.ie'
+    }, merged
+    print("  ✅ Gaps filled, known fields kept")
+
+    merge_serp_record(records, build_serp_record(AOIFE, 'Aoife Byrne - CTO - Other Co | LinkedIn', 'Location: Cork, Ireland'))
+    assert (merged['title'], merged['company'], merged['location']) == ('Senior Software Engineer', 'Fintrail', 'Galway, Ireland')
+    assert len(records) == 1
+    print("  ✅ Complete records are left alone")
+
+
+if __name__ == "__main__":
+    print("Testing SERP result parsing...")
+    try:
+        test_iter_serp_results()
+        test_parse_heading()
+        test_parse_snippet()
+        test_merge_serp_record()
+        print("\n🎉 SERP parsing tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,114 @@
+# Stage timing for LeadSprinter
+# Records how long each stage of a job takes so a run can be broken down into
+# navigation, waiting, extraction, deliberate sleeps and search fallbacks
+
+import functools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Stages that are deliberate waiting rather than work
+SLEEP_STAGES = {'rate_wait'}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StageTimer:
+    """Thread-safe collection of timing spans, shared by a job's scrapers and workers"""
+
+    def __init__(self):
+        self.durations = {}  # stage -> list of seconds
+        self.busy_seconds = 0.0  # Time inside outermost spans, summed over threads
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, stage):
+        """Time a block of code as one occurrence of a stage"""
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            self._local.depth = depth
+            self.record(stage, elapsed, outermost=depth == 0)
+
+    def record(self, stage, seconds, outermost=False):
+        """Add one measured duration"""
+        with self._lock:
+            self.durations.setdefault(stage, []).append(seconds)
+            if outermost:
+                self.busy_seconds += seconds
+
+    def get_report(self):
+        """Per-stage count, total and p50/p95/p99, plus time slept versus time spent working"""
+        with self._lock:
+            durations = {stage: sorted(values) for stage, values in self.durations.items()}
+            busy_seconds = self.busy_seconds
+
+        stages = {}
+        for stage, values in durations.items():
+            stages[stage] = {
+                'count': len(values),
+                'total': round(sum(values), 3),
+                'p50': round(percentile(values, 0.50), 3),
+                'p95': round(percentile(values, 0.95), 3),
+                'p99': round(percentile(values, 0.99), 3),
+                'max': round(values[-1], 3)
+            }
+
+        slept = sum(stages[stage]['total'] for stage in SLEEP_STAGES if stage in stages)
+        return {
+            'wall_seconds': round(time.monotonic() - self.started, 3),
+            'slept_seconds': round(slept, 3),
+            'useful_seconds': round(max(0.0, busy_seconds - slept), 3),
+            'stages': stages
+        }
+
+    def format_report(self, report=None):
+        """Human-readable table of the report"""
+        report = report or self.get_report()
+        lines = [
+            f"Wall time {report['wall_seconds']:.1f}s, slept {report['slept_seconds']:.1f}s, "
+            f"useful work {report['useful_seconds']:.1f}s (summed over workers)",
+            f"{'stage':<22}{'count':>7}{'total':>10}{'p50':>9}{'p95':>9}{'p99':>9}"
+        ]
+        for stage, stats in sorted(report['stages'].items(), key=lambda item: -item[1]['total']):
+            lines.append(
+                f"{stage:<22}{stats['count']:>7}{stats['total']:>9.1f}s"
+                f"{stats['p50']:>8.2f}s{stats['p95']:>8.2f}s{stats['p99']:>8.2f}s"
+            )
+        return '\n'.join(lines)
+
+    def save_report(self, filepath, report=None):
+        """Write the report as JSON"""
+        directory = os.path.dirname(os.path.abspath(filepath))
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(report or self.get_report(), f, indent=2)
+        return filepath
+
+
+def timed(stage):
+    """Method decorator that records each call as a span on the instance's timer"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.timer.span(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
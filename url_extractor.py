@@ -0,0 +1,71 @@
+# LinkedIn URL extraction for LeadSprinter
+# One pass of a precompiled pattern over SERP HTML, returning profile URLs in ranking
+# order with search engine redirect wrappers decoded on the way
+
+import base64
+import re
+from urllib.parse import quote, unquote
+from canonicalize import canonical_profile_url
+
+# Scanned once, in document order. Both branches start with the same literal, which lets
+# the regex engine skip ahead with a fast substring search instead of trying every position:
+#   plain    - linkedin.com/in/<slug> anywhere: hrefs, Google /url?q= targets, visible URLs
+#   encoded  - the same percent-encoded inside a redirect parameter (DuckDuckGo uddg=, encoded q=)
+PROFILE_URL_PATTERN = re.compile(
+    r'linkedin\.com(?:/in/(?P<plain>[A-Za-z0-9\-_%]+)|%2[Ff]in%2[Ff](?P<encoded>[A-Za-z0-9\-_%]+))'
+)
+
+# Bing click-tracking links carry the target as base64url after u=a1. The extra branch defeats
+# the literal-prefix skip, so it is only used on pages that contain such links
+BING_WRAPPER_MARKER = 'u=a1'
+WRAPPED_PROFILE_URL_PATTERN = re.compile(
+    PROFILE_URL_PATTERN.pattern + r'|u=a1(?P<bing>[A-Za-z0-9\-_]{16,})'
+)
+
+
+def decode_bing_target(token):
+    """Profile slug from a Bing u=a1<base64url> redirect, or None"""
+    try:
+        target = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode('utf-8', 'ignore')
+    except (ValueError, TypeError):
+        return None
+
+    # Re-encode so a slug with non-ASCII letters matches the pattern's percent-encoded form
+    match = PROFILE_URL_PATTERN.search(quote(target, safe=':/?&=#%'))
+    return get_slug(match) if match else None
+
+
+def get_slug(match):
+    """Profile slug for one pattern match, or None if the match was not a profile link"""
+    slug = match.group('plain')
+    if slug:
+        return slug
+
+    slug = match.group('encoded')
+    if slug:
+        # Undo the redirect's encoding; canonical_profile_url decodes the slug itself once more
+        return unquote(slug)
+
+    bing = match.groupdict().get('bing')
+    return decode_bing_target(bing) if bing else None
+
+
+def extract_profile_urls(html, limit=None):
+    """Canonical LinkedIn profile URLs in the order they appear on the page, without repeats"""
+    urls = []
+    seen = set()
+    if not html:
+        return urls
+
+    pattern = WRAPPED_PROFILE_URL_PATTERN if BING_WRAPPER_MARKER in html else PROFILE_URL_PATTERN
+    for match in pattern.finditer(html):
+        slug = get_slug(match)
+        url = canonical_profile_url(slug) if slug else None
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        urls.append(url)
+
+        if limit and len(urls) >= limit:
+            break
+    return urls
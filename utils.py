@@ -76,6 +76,17 @@ def validate_linkedin_url(url):
     except:
         return False
 
+def rewrite_url(url, rewrites=None):
+    """Apply the first matching prefix rewrite from Config.URL_REWRITES (used to redirect page loads to fixtures)"""
+    if rewrites is None:
+        from config import Config
+        rewrites = Config.URL_REWRITES
+    
+    for prefix, replacement in (rewrites or {}).items():
+        if url.startswith(prefix):
+            return replacement + url[len(prefix):]
+    return url
+
 def format_filename(text, max_length=50):
     """Format text to be safe for filenames"""
     if not text: